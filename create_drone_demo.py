@@ -765,7 +765,7 @@ def build_modules(system: SystemStructure) -> Dict[str, Module]:
         module.parameters = spec.get("parameters", {}).copy()
         module.failure_rate = spec.get("failure_rate", 1e-5)
         pos_x, pos_y = spec.get("position", (0, 0))
-        module.position = {"x": pos_x, "y": pos_y}
+        module.position = Point(pos_x, pos_y)
         system.add_module(module)
         module_map[module.name] = module
 
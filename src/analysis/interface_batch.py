@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""
+接口批量仿真
+Interface Batch Simulation
+
+将大量仅包含阈值触发条件的接口状态机转换为结构数组（SoA）布局，
+用一次 NumPy 向量化运算完成全部接口的单步状态转移。
+失效模式触发条件的数组快照 FailureTriggerArrays 位于模型层（models._trigger_arrays）。
+"""
+
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..models.interface_model import Interface, InterfaceTransition
+
+# 比较操作符编码，与 TriggerCondition.evaluate 的阈值分支一致
+OP_CODES: Dict[str, int] = {'>=': 0, '>': 1, '<=': 2, '<': 3, '==': 4, '!=': 5}
+_OP_FUNCS = (np.greater_equal, np.greater, np.less_equal, np.less, np.equal, np.not_equal)
+
+
+def _threshold_spec(transition: InterfaceTransition) -> Optional[Tuple[str, int, float]]:
+    """解析转换的阈值条件，返回 (变量名, 操作符编码, 阈值)
+
+    条件永远不会触发（禁用、缺少变量/阈值、未知操作符）时返回 None；
+    无法向量化的条件抛出 ValueError。
+    """
+    condition = transition.condition
+    if condition.python_code or condition.condition_type.lower() != 'threshold':
+        raise ValueError(f"转换 {transition.name} 的触发条件不是纯阈值条件，无法批量仿真")
+    if not condition.enabled:
+        return None
+
+    variable = condition.parameters.get('variable')
+    threshold = condition.parameters.get('value')
+    op_code = OP_CODES.get(condition.parameters.get('operator', '>='))
+    if variable is None or threshold is None or op_code is None:
+        return None
+    try:
+        return variable, op_code, float(threshold)
+    except (TypeError, ValueError):
+        raise ValueError(f"转换 {transition.name} 的阈值 {threshold!r} 不是数值，无法批量仿真")
+
+
+class InterfaceBatch:
+    """阈值型接口状态机的批量步进器
+
+    每个接口的变量取值由调用方以二维数组 ``values[接口序号, 变量序号]`` 提供，
+    缺失值用 NaN 表示（对应逐个评估时取不到变量、条件不满足的情形）。
+    批量步进只更新内部状态数组，需要时通过 :meth:`sync_to_interfaces` 写回接口对象。
+    """
+
+    def __init__(self, interfaces: Sequence[Interface]):
+        self.interfaces: List[Interface] = list(interfaces)
+        self.variables: List[str] = []
+        self.var_index: Dict[str, int] = {}
+        self.state_refs: List[Tuple[int, str]] = []  # 全局状态编号 -> (接口序号, 状态ID)
+
+        state_index: Dict[Tuple[int, str], int] = {}
+        rows: List[Tuple[int, int, int, int, int, float]] = []
+        current: List[int] = []
+
+        for owner, interface in enumerate(self.interfaces):
+            for state_id in interface.states:
+                state_index[(owner, state_id)] = len(self.state_refs)
+                self.state_refs.append((owner, state_id))
+
+            current_state_id = interface.current_state_id
+            if current_state_id not in interface.states:
+                current_state_id = interface.normal_state_id or next(iter(interface.states), None)
+            current.append(state_index.get((owner, current_state_id), -1))
+
+            # 与 step_state_machine 相同：按优先级稳定排序，数值越小越先评估
+            for transition in sorted(interface.transitions, key=lambda t: t.priority):
+                spec = _threshold_spec(transition)
+                source = state_index.get((owner, transition.source_state_id))
+                target = state_index.get((owner, transition.target_state_id))
+                if spec is None or source is None or target is None:
+                    continue
+                variable, op_code, threshold = spec
+                if variable not in self.var_index:
+                    self.var_index[variable] = len(self.variables)
+                    self.variables.append(variable)
+                rows.append((owner, source, target, self.var_index[variable], op_code, threshold))
+
+        self.current = np.asarray(current, dtype=np.int32)
+        self.owner = np.asarray([r[0] for r in rows], dtype=np.int32)
+        self.source = np.asarray([r[1] for r in rows], dtype=np.int32)
+        self.target = np.asarray([r[2] for r in rows], dtype=np.int32)
+        self.var = np.asarray([r[3] for r in rows], dtype=np.int32)
+        self.op_codes = np.asarray([r[4] for r in rows], dtype=np.int8)
+        self.thresholds = np.asarray([r[5] for r in rows], dtype=np.float64)
+
+    @staticmethod
+    def supports(interface: Interface) -> bool:
+        """判断接口状态机能否批量仿真"""
+        try:
+            for transition in interface.transitions:
+                _threshold_spec(transition)
+        except ValueError:
+            return False
+        return True
+
+    def values_from_inputs(self, inputs: Sequence[Mapping[str, Any]]) -> np.ndarray:
+        """由每个接口的输入字典构造变量取值矩阵，缺失或非数值记为 NaN"""
+        values = np.full((len(self.interfaces), len(self.variables)), np.nan)
+        for row, interface_inputs in enumerate(inputs):
+            for variable, column in self.var_index.items():
+                value = interface_inputs.get(variable)
+                if value is None:
+                    continue
+                try:
+                    values[row, column] = float(value)
+                except (TypeError, ValueError):
+                    pass
+        return values
+
+    def step(self, values: np.ndarray) -> np.ndarray:
+        """对全部接口执行一次状态机评估，返回发生转换的接口掩码"""
+        values = np.asarray(values, dtype=np.float64)
+        actual = values[self.owner, self.var]
+        valid = ~np.isnan(actual)
+
+        hit = np.zeros(actual.shape, dtype=bool)
+        for code, compare in enumerate(_OP_FUNCS):
+            mask = self.op_codes == code
+            if mask.any():
+                hit[mask] = compare(actual[mask], self.thresholds[mask])
+        active = np.flatnonzero(hit & valid & (self.source == self.current[self.owner]))
+
+        transitioned = np.zeros(len(self.interfaces), dtype=bool)
+        if active.size:
+            # 行按接口与优先级排序，每个接口取第一条满足的转换
+            owners, first = np.unique(self.owner[active], return_index=True)
+            self.current[owners] = self.target[active[first]]
+            transitioned[owners] = True
+        return transitioned
+
+    def current_state_ids(self) -> List[Optional[str]]:
+        """返回各接口当前状态ID"""
+        return [self.state_refs[idx][1] if idx >= 0 else None for idx in self.current]
+
+    def sync_to_interfaces(self):
+        """将批量仿真得到的当前状态写回接口对象"""
+        for interface, state_id in zip(self.interfaces, self.current_state_ids()):
+            if state_id is not None:
+                interface.current_state_id = state_id
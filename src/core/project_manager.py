@@ -7,9 +7,9 @@ Project Manager
 """
 
 import os
-import json
 from typing import Optional
 from ..models.system_model import SystemStructure
+from ..utils.serialization import deserialize, format_for_path, serialize
 
 
 class ProjectManager:
@@ -48,10 +48,10 @@ class ProjectManager:
             # 确保目录存在
             os.makedirs(os.path.dirname(file_path), exist_ok=True)
             
-            # 保存为JSON文件
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(self.current_system.to_dict(), f, 
-                         ensure_ascii=False, indent=2)
+            # 按扩展名保存为JSON或msgpack文件
+            payload = serialize(self.current_system.to_dict(), format_for_path(file_path))
+            with open(file_path, 'wb') as f:
+                f.write(payload)
             
             self.current_file_path = file_path
             self.is_modified = False
@@ -67,8 +67,8 @@ class ProjectManager:
             raise FileNotFoundError(f"项目文件不存在: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = deserialize(f.read(), format_for_path(file_path))
             
             system = SystemStructure()
             system.from_dict(data)
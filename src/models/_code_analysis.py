@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+用户代码静态分析
+User Code Analysis
+
+判断用户 Python 建模代码是否只读取某个变量（如 ``inputs``），
+以便执行时省去为防止修改而做的深拷贝；以及把用户代码包装为普通函数（CodeRunner 负责调用）。
+分析是保守的：无法确认只读（或无法确认包装后语义不变）的代码一律按原方式处理。
+"""
+
+import ast
+import builtins
+from functools import lru_cache
+from types import CodeType
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from .base_model import compile_python_code, exec_globals
+
+# 以只读变量为参数时不会修改或返回该对象本身的内置函数
+_SAFE_CALLS = frozenset({'float', 'int', 'str', 'bool', 'len', 'abs', 'round', 'isinstance', 'repr'})
+
+
+def _parent_map(tree: ast.AST) -> Dict[ast.AST, ast.AST]:
+    parents = {}
+    for node in ast.walk(tree):
+        for child in ast.iter_child_nodes(node):
+            parents[child] = node
+    return parents
+
+
+def _value_is_safe(expr: ast.AST, parents: Dict[ast.AST, ast.AST], aliases: Set[str]) -> bool:
+    """检查读取出的值（可能是可变对象）的去向；直接赋给变量名时记为别名继续跟踪"""
+    while True:
+        parent = parents.get(expr)
+        if isinstance(parent, ast.Subscript):
+            if parent.slice is expr:
+                return True  # 作为下标使用
+            if not isinstance(parent.ctx, ast.Load):
+                return False  # 修改嵌套元素
+            expr = parent  # 继续读取嵌套元素
+            continue
+        if isinstance(parent, ast.IfExp) and parent.test is not expr:
+            expr = parent  # 条件表达式的结果仍是该值本身
+            continue
+        if isinstance(parent, (ast.BinOp, ast.UnaryOp, ast.Compare, ast.FormattedValue, ast.Expr)):
+            return True
+        if isinstance(parent, (ast.If, ast.While, ast.IfExp, ast.Assert)) and parent.test is expr:
+            return True
+        if isinstance(parent, ast.Call) and expr in parent.args:
+            return isinstance(parent.func, ast.Name) and parent.func.id in _SAFE_CALLS
+        if isinstance(parent, ast.Assign) and parent.value is expr:
+            if all(isinstance(target, ast.Name) for target in parent.targets):
+                aliases.update(target.id for target in parent.targets)
+                return True
+        return False
+
+
+@lru_cache(maxsize=512)
+def is_read_only(source: str, name: str = 'inputs') -> bool:
+    """代码是否只读取变量 ``name``（不修改、不重新绑定、不把其中的对象交给外部）"""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return False
+    parents = _parent_map(tree)
+
+    aliases: Set[str] = set()
+    checked: Set[str] = set()
+    pending = {name}
+    while pending:
+        current = pending.pop()
+        checked.add(current)
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Name) or node.id != current:
+                continue
+            parent = parents.get(node)
+            if not isinstance(node.ctx, ast.Load):
+                if current == name or isinstance(parent, ast.AugAssign):
+                    return False  # 重新绑定原变量，或对别名做原地运算
+                continue
+
+            if current == name:
+                # 原变量只允许 inputs[...]、inputs.get(...) 与 x in inputs 三种用法
+                if isinstance(parent, ast.Subscript) and parent.value is node:
+                    expr = parent
+                    if not isinstance(parent.ctx, ast.Load):
+                        return False
+                elif (isinstance(parent, ast.Attribute) and parent.attr == 'get' and
+                      isinstance(parents.get(parent), ast.Call) and parents[parent].func is parent):
+                    expr = parents[parent]
+                elif (isinstance(parent, ast.Compare) and node in parent.comparators and
+                      all(isinstance(op, (ast.In, ast.NotIn)) for op in parent.ops)):
+                    continue
+                else:
+                    return False
+            else:
+                expr = node
+
+            if not _value_is_safe(expr, parents, aliases):
+                return False
+        pending.update(aliases - checked)
+    return True
+
+
+# 包装为函数后语义会改变的语句：写全局/外层变量、提前返回、生成器与协程
+_FUNCTION_BLOCKERS = (ast.Global, ast.Nonlocal, ast.Return, ast.Yield, ast.YieldFrom, ast.Await)
+# 依赖 exec 局部命名空间（字典）的内置函数
+_NAMESPACE_CALLS = frozenset({'locals', 'vars', 'exec', 'eval', 'dir'})
+_BUILTIN_NAMES = frozenset(dir(builtins))
+
+
+def _top_scope_nodes(tree: ast.AST) -> Iterator[ast.AST]:
+    """遍历顶层作用域中的节点（不进入嵌套函数、lambda 与类的内部）"""
+    stack = list(ast.iter_child_nodes(tree))
+    while stack:
+        node = stack.pop()
+        yield node
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+            stack.extend(ast.iter_child_nodes(node))
+
+
+def _bound_names(tree: ast.AST) -> Set[str]:
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and not isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, ast.alias):
+            names.add((node.asname or node.name).split('.')[0])
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+    return names
+
+
+@lru_cache(maxsize=512)
+def code_function(source: str, arg_names: Tuple[str, ...], result_name: str,
+                  filename: str = '<python_code>') -> Optional[Callable]:
+    """把用户代码包装为 ``def f(*arg_names): <source>; return result_name``
+
+    函数内的局部变量按下标访问，比 exec 的字典作用域查找快；``result_name`` 须在 ``arg_names`` 中，
+    即执行前已有初值。以下情况返回 None，调用方应回退到 exec：使用 global/nonlocal/return/yield、
+    星号导入或 __future__ 导入、调用 locals()/exec() 等依赖命名空间字典的函数、
+    删除 ``result_name``、给内置函数同名的变量赋值（函数内先读后写会变成未绑定的局部变量）。
+    语法错误照常抛出 SyntaxError。
+    """
+    tree = ast.parse(source, filename)
+    for node in ast.walk(tree):
+        if isinstance(node, (ast.Global, ast.Nonlocal)):
+            return None
+        if isinstance(node, ast.ImportFrom) and (node.module == '__future__' or
+                                                 any(alias.name == '*' for alias in node.names)):
+            return None
+        if isinstance(node, ast.Name) and node.id in _NAMESPACE_CALLS:
+            return None
+        if (isinstance(node, ast.Delete) and
+                any(isinstance(target, ast.Name) and target.id == result_name for target in node.targets)):
+            return None
+    if any(isinstance(node, _FUNCTION_BLOCKERS) for node in _top_scope_nodes(tree)):
+        return None
+    if _bound_names(tree) & _BUILTIN_NAMES:
+        return None
+
+    wrapper = ast.parse(f"def _user_code({', '.join(arg_names)}):\n    return {result_name}\n", filename)
+    function_def = wrapper.body[0]
+    function_def.body[:0] = tree.body
+    namespace = {'__builtins__': builtins}
+    exec(compile(wrapper, filename, 'exec'), namespace)
+    return namespace['_user_code']
+
+
+class CodeRunner:
+    """执行一段用户代码：能包装为函数（见 code_function）时直接调用，否则回退为 exec 执行编译结果
+
+    函数或编译结果按源码对象缓存，源码变化时重新生成；复制或跨进程传递时只保留参数定义。
+    """
+
+    __slots__ = ('arg_names', 'result_name', 'filename', 'source', 'function', 'compiled')
+
+    def __init__(self, arg_names: Tuple[str, ...], result_name: str, filename: str = '<python_code>'):
+        self.arg_names = arg_names
+        self.result_name = result_name
+        self.filename = filename
+        self.source: Optional[str] = None
+        self.function: Optional[Callable] = None
+        self.compiled: Optional[CodeType] = None
+
+    def __getstate__(self):
+        return self.arg_names, self.result_name, self.filename
+
+    def __setstate__(self, state):
+        self.__init__(*state)
+
+    def run(self, source: str, *args: Any) -> Any:
+        """以 ``args``（与 arg_names 一一对应）执行 ``source``，返回 result_name 的最终取值"""
+        if self.source is not source:
+            function = code_function(source, self.arg_names, self.result_name, self.filename)
+            self.compiled = compile_python_code(source, self.filename) if function is None else None
+            self.function = function
+            self.source = source
+        if self.function is not None:
+            return self.function(*args)
+        local_vars = dict(zip(self.arg_names, args))
+        exec(self.compiled, exec_globals(self.compiled), local_vars)
+        return local_vars.get(self.result_name, args[self.arg_names.index(self.result_name)])
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+"""
+阈值判据向量化评估
+Vectorized Threshold Criteria Evaluation
+
+任务剖面中的阈值判据较多时，把目标、阈值、权重预先打包为 NumPy 数组，
+每次评估只取一次实际值，再按比较操作符分组做数组比较与加权求和，
+代替逐个调用 SuccessCriteria.evaluate。
+
+判据数量很大且安装了 Numba 时，比较与加权求和在一个 JIT 编译的循环中完成；
+详细任务剖面的逐判据比较（含范围操作符）同样由 compare_each 在 JIT 循环中完成。
+
+含自定义代码或非数值阈值的判据集合不打包（build 返回 None）；
+实际值中出现非数值时 success_weight 返回 None，调用方应回退到逐个评估。
+"""
+
+import operator
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - 可选依赖
+    numba = None
+
+# 启用的判据数达到该值时才打包为数组，判据较少时逐个评估更快
+VECTOR_MIN_CRITERIA = 32
+# 启用的判据数达到该值且安装了 Numba 时改用 JIT 循环
+JIT_MIN_CRITERIA = 1000
+
+# 比较函数 -> JIT 循环中的操作码；未知操作符记为 -1（恒不满足）
+_OP_CODES = {operator.ge: 0, operator.le: 1, operator.eq: 2, operator.ne: 3, operator.gt: 4, operator.lt: 5}
+# compare_each 的范围操作码：在 [下限, 上限] 内 / 不在其内
+IN_RANGE_CODE = 6
+OUT_RANGE_CODE = 7
+
+
+def op_code(func: Optional[Callable]) -> int:
+    """比较函数对应的操作码，未知时为 -1"""
+    return _OP_CODES.get(func, -1)
+
+
+def _reduce_hits(actual, thresholds, op_codes, weights):
+    """逐个比较并累加满足判据的权重，返回 (权重之和, 满足个数)"""
+    success = 0.0
+    hits = 0
+    for i in range(actual.shape[0]):
+        value = actual[i]
+        threshold = thresholds[i]
+        code = op_codes[i]
+        if code == 0:
+            hit = value >= threshold
+        elif code == 1:
+            hit = value <= threshold
+        elif code == 2:
+            hit = value == threshold
+        elif code == 3:
+            hit = value != threshold
+        elif code == 4:
+            hit = value > threshold
+        elif code == 5:
+            hit = value < threshold
+        else:
+            hit = False
+        if hit:
+            success += weights[i]
+            hits += 1
+    return success, hits
+
+
+def compare_each(actual, present, op_codes, targets, range_min, range_max, hits):
+    """逐个比较，结果写入布尔数组 hits；present 为假（缺少模块或参数）的判据不满足
+
+    循环体不含分支：各比较都计算出来，再按操作码以位运算选取，便于 LLVM 向量化整个循环。
+    """
+    for i in range(actual.shape[0]):
+        code = op_codes[i]
+        value = actual[i]
+        target = targets[i]
+        inside = (range_min[i] <= value) & (value <= range_max[i])
+        hit = (((code == 0) & (value >= target)) | ((code == 1) & (value <= target))
+               | ((code == 2) & (value == target)) | ((code == 3) & (value != target))
+               | ((code == 4) & (value > target)) | ((code == 5) & (value < target))
+               | ((code == IN_RANGE_CODE) & inside) | ((code == OUT_RANGE_CODE) & (not inside)))
+        hits[i] = present[i] & hit
+
+
+# 不启用 fastmath：其假定不存在 NaN，会改变与 NaN 比较的结果；首次调用时编译并缓存到磁盘
+if numba is not None:
+    _reduce_hits_jit = numba.njit(cache=True, nogil=True)(_reduce_hits)
+    compare_each_jit = numba.njit(cache=True, nogil=True)(compare_each)
+else:
+    _reduce_hits_jit = compare_each_jit = None
+
+
+class CriteriaArrays:
+    """打包后的阈值判据"""
+
+    __slots__ = ('targets', 'thresholds', 'weights', 'op_groups', 'op_codes', 'total_weight', 'disabled_weight')
+
+    @classmethod
+    def build(cls, criteria: Sequence[Any], ops: Dict[str, Callable]) -> Optional['CriteriaArrays']:
+        """打包判据；``ops`` 为比较操作符到比较函数的映射，未知操作符的判据恒不满足"""
+        enabled = [c for c in criteria if c.enabled]
+        if len(enabled) < VECTOR_MIN_CRITERIA or any(c.python_code for c in enabled):
+            return None
+
+        import numpy as np
+
+        thresholds = np.array([c.threshold_value for c in enabled])
+        if thresholds.dtype.kind not in 'bif':
+            return None
+        use_jit = _reduce_hits_jit is not None and len(enabled) >= JIT_MIN_CRITERIA
+
+        groups: Dict[Callable, List[int]] = {}
+        for index, c in enumerate(enabled):
+            func = ops.get(c.comparison_operator)
+            if func is not None:
+                groups.setdefault(func, []).append(index)
+
+        arrays = cls.__new__(cls)
+        arrays.targets = [(c.target_module_id, c.target_parameter) for c in enabled]
+        arrays.thresholds = thresholds
+        arrays.weights = np.array([c.weight for c in enabled], dtype=np.float64)
+        arrays.op_groups = [(func, np.array(indices, dtype=np.intp)) for func, indices in groups.items()]
+        arrays.op_codes = None
+        if use_jit:
+            arrays.thresholds = thresholds.astype(np.float64)
+            arrays.op_codes = np.array([_OP_CODES.get(ops.get(c.comparison_operator), -1) for c in enabled],
+                                       dtype=np.int8)
+        # 与逐个评估保持一致：合计权重按判据顺序求和，停用的判据视为满足
+        arrays.total_weight = sum(c.weight for c in enabled)
+        arrays.disabled_weight = sum(c.weight for c in criteria if not c.enabled)
+        return arrays
+
+    def success_weight(self, system_state: Dict[str, Any]) -> Optional[float]:
+        """满足的判据权重之和；实际值不全为数值时返回 None"""
+        import numpy as np
+
+        empty: Dict[str, Any] = {}
+        actual = np.array([system_state.get(module_id, empty).get(parameter, 0)
+                           for module_id, parameter in self.targets])
+        if actual.dtype.kind not in 'bif':
+            return None
+
+        if self.op_codes is not None:
+            success, hit_count = _reduce_hits_jit(actual.astype(np.float64), self.thresholds,
+                                                  self.op_codes, self.weights)
+            if hit_count == actual.shape[0]:
+                return self.total_weight + self.disabled_weight
+            return success + self.disabled_weight
+
+        hits = np.zeros(actual.shape[0], dtype=bool)
+        for func, index in self.op_groups:
+            hits[index] = func(actual[index], self.thresholds[index])
+        if hits.all():
+            # 全部满足时直接使用合计权重，保证成功率恰为 1.0
+            return self.total_weight + self.disabled_weight
+        return float(self.weights[hits].sum()) + self.disabled_weight
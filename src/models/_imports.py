@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+模型层公共导入
+Shared Model Imports
+
+各数据模型模块共用的基类与工具在此统一导入一次，模型模块从这里取用，
+不必各自重复编写导入回退逻辑。
+"""
+
+from .base_model import (
+    BaseModel,
+    ConnectionPoint,
+    DictCacheMixin,
+    Point,
+    _MISSING,
+    _ev,
+    compile_python_code,
+    exec_globals,
+    intern_str,
+    log_code_error,
+    reset_code_error_counts,
+    serializable_fields,
+)
+from ._code_analysis import CodeRunner, code_function, is_read_only
+from ._numeric_code import numeric_kernel
+
+__all__ = [
+    'BaseModel',
+    'ConnectionPoint',
+    'DictCacheMixin',
+    'Point',
+    '_MISSING',
+    '_ev',
+    'compile_python_code',
+    'exec_globals',
+    'intern_str',
+    'log_code_error',
+    'reset_code_error_counts',
+    'serializable_fields',
+    'CodeRunner',
+    'code_function',
+    'is_read_only',
+    'numeric_kernel',
+]
@@ -0,0 +1,284 @@
+# -*- coding: utf-8 -*-
+"""
+数值型建模代码快速路径
+Numeric Python Code Fast Path
+
+对只包含 ``outputs['y'] = f(inputs['x'], parameters['k'])`` 形式算术运算的用户代码，
+将其改写为普通函数（局部变量按下标访问，避免 exec 的字典作用域查找）：
+
+- 单次调用：直接以 Python 浮点数运行；
+- 批量调用：安装了 Numba 时用 ``numba.njit`` 编译逐行循环，否则以 NumPy 数组向量化运行。
+  代码中含 ``# @njit`` 注释行即表示批量调用优先使用 Numba。
+
+不满足白名单（属性访问、条件分支、函数定义、非数值常量等）的代码返回 None，
+调用方应回退到 exec 执行。白名单与 exec 的命名空间一致：除内置的 abs/min/max 外，
+数学函数与常量须先经 ``import math`` 或 ``from math import ...`` 导入，否则同样回退，
+由 exec 照常抛出 NameError。
+"""
+
+import ast
+import math
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - 可选依赖
+    numba = None
+
+# 允许调用的数学函数：名称 -> (math 实现, numpy 函数名)
+_FUNCTIONS: Dict[str, Tuple[Callable, str]] = {
+    'abs': (abs, 'abs'),
+    'min': (min, 'minimum'),
+    'max': (max, 'maximum'),
+    'sqrt': (math.sqrt, 'sqrt'),
+    'exp': (math.exp, 'exp'),
+    'log': (math.log, 'log'),
+    'log10': (math.log10, 'log10'),
+    'sin': (math.sin, 'sin'),
+    'cos': (math.cos, 'cos'),
+    'tan': (math.tan, 'tan'),
+    'floor': (math.floor, 'floor'),
+    'ceil': (math.ceil, 'ceil'),
+}
+_CONSTANTS = {'pi': math.pi, 'e': math.e}
+# exec 命名空间中无需导入即可使用的函数（__builtins__）
+_BUILTIN_FUNCTIONS = frozenset({'abs', 'min', 'max'})
+_BIN_OPS = {ast.Add: '+', ast.Sub: '-', ast.Mult: '*', ast.Div: '/', ast.FloorDiv: '//', ast.Mod: '%', ast.Pow: '**'}
+_UNARY_OPS = (ast.UAdd, ast.USub)
+
+# 用户代码中要求批量执行时使用 Numba 的注释标记
+_NJIT_MARKER = re.compile(r'^\s*#\s*@njit\b', re.MULTILINE)
+
+
+class _Rewriter:
+    """校验并改写用户代码，记录输入、参数、输出键的下标"""
+
+    def __init__(self):
+        self.input_names: List[str] = []
+        self.param_names: List[str] = []
+        self.output_names: List[str] = []
+        self.assigned: set = set()
+        self.imports: Dict[str, str] = {}  # 已导入的名称 -> math 中的名称（'math' 表示模块本身）
+
+    @staticmethod
+    def _key(node: ast.Subscript, container: str) -> Optional[str]:
+        if isinstance(node.value, ast.Name) and node.value.id == container:
+            key = node.slice
+            if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                return key.value
+        return None
+
+    @staticmethod
+    def _slot(names: List[str], key: str) -> int:
+        if key not in names:
+            names.append(key)
+        return names.index(key)
+
+    def _math_module(self, node: ast.AST) -> bool:
+        return (isinstance(node, ast.Name) and node.id not in self.assigned
+                and self.imports.get(node.id) == 'math')
+
+    def _function(self, func: ast.AST) -> Optional[str]:
+        """被调用函数在 _FUNCTIONS 中的名称；exec 时不可用的名称返回 None"""
+        if isinstance(func, ast.Attribute) and self._math_module(func.value):
+            return func.attr if func.attr in _FUNCTIONS and hasattr(math, func.attr) else None
+        if isinstance(func, ast.Name) and func.id not in self.assigned:
+            if func.id in _BUILTIN_FUNCTIONS:
+                return func.id
+            name = self.imports.get(func.id)
+            return name if name in _FUNCTIONS else None
+        return None
+
+    def expr(self, node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+                return repr(node.value)
+            return None
+        if isinstance(node, ast.BinOp) and type(node.op) in _BIN_OPS:
+            left, right = self.expr(node.left), self.expr(node.right)
+            if left is None or right is None:
+                return None
+            return f"({left} {_BIN_OPS[type(node.op)]} {right})"
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, _UNARY_OPS):
+            operand = self.expr(node.operand)
+            if operand is None:
+                return None
+            return f"({'-' if isinstance(node.op, ast.USub) else '+'}{operand})"
+        if isinstance(node, ast.Subscript):
+            key = self._key(node, 'inputs')
+            if key is not None:
+                return f"_in[{self._slot(self.input_names, key)}]"
+            key = self._key(node, 'parameters')
+            if key is not None:
+                return f"_par[{self._slot(self.param_names, key)}]"
+            key = self._key(node, 'outputs')
+            if key is not None and key in self.output_names:
+                return f"_out{self.output_names.index(key)}"
+            return None
+        if isinstance(node, ast.Name):
+            if node.id in self.assigned:
+                return f"_v_{node.id}"
+            name = self.imports.get(node.id)
+            if name in _CONSTANTS:
+                return repr(_CONSTANTS[name])
+            return None
+        if isinstance(node, ast.Attribute) and self._math_module(node.value) and node.attr in _CONSTANTS:
+            return repr(_CONSTANTS[node.attr])
+        if isinstance(node, ast.Call) and not node.keywords:
+            name = self._function(node.func)
+            if name is None or (name in ('min', 'max') and len(node.args) != 2):
+                return None
+            args = [self.expr(arg) for arg in node.args]
+            if not args or any(arg is None for arg in args):
+                return None
+            return f"_f_{name}({', '.join(args)})"
+        return None
+
+    def target(self, node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Name) and node.id not in ('inputs', 'parameters', 'outputs'):
+            self.assigned.add(node.id)
+            return f"_v_{node.id}"
+        if isinstance(node, ast.Subscript):
+            key = self._key(node, 'outputs')
+            if key is not None:
+                return f"_out{self._slot(self.output_names, key)}"
+        return None
+
+    def statement(self, node: ast.stmt) -> Optional[str]:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1:
+            value = self.expr(node.value)
+            target = self.target(node.targets[0]) if value is not None else None
+            return f"{target} = {value}" if target else None
+        if isinstance(node, ast.AugAssign) and type(node.op) in _BIN_OPS:
+            current = self.expr(node.target)
+            value = self.expr(node.value)
+            if current is None or value is None:
+                return None
+            return self.statement(ast.Assign(
+                targets=[node.target], value=ast.BinOp(node.target, node.op, node.value)))
+        if isinstance(node, (ast.Import, ast.ImportFrom)) and any(
+                (alias.asname or alias.name) in self.assigned for alias in node.names):
+            return None  # 导入覆盖已赋值的变量
+        if isinstance(node, ast.Import):
+            if any(alias.name != 'math' for alias in node.names):
+                return None
+            for alias in node.names:
+                self.imports[alias.asname or alias.name] = 'math'
+            return 'pass'
+        if isinstance(node, ast.ImportFrom):
+            if node.module != 'math' or node.level or any(
+                    not hasattr(math, alias.name) or (alias.name not in _FUNCTIONS and alias.name not in _CONSTANTS)
+                    for alias in node.names):
+                return None
+            for alias in node.names:
+                self.imports[alias.asname or alias.name] = alias.name
+            return 'pass'
+        if isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            return 'pass'  # 文档字符串
+        return None
+
+
+class NumericKernel:
+    """由数值型用户代码生成的可直接调用的内核"""
+
+    def __init__(self, source: str):
+        tree = ast.parse(source)
+        rewriter = _Rewriter()
+        body = []
+        for node in tree.body:
+            line = rewriter.statement(node)
+            if line is None:
+                raise ValueError("代码不是纯数值运算")
+            body.append(line)
+        if not rewriter.output_names:
+            raise ValueError("代码没有写入任何输出")
+
+        self.input_names: Tuple[str, ...] = tuple(rewriter.input_names)
+        self.param_names: Tuple[str, ...] = tuple(rewriter.param_names)
+        self.output_names: Tuple[str, ...] = tuple(rewriter.output_names)
+        self.prefers_numba: bool = _NJIT_MARKER.search(source) is not None
+        outputs = ', '.join(f"_out{i}" for i in range(len(self.output_names)))
+        self.function_source = (
+            "def _kernel(_in, _par):\n"
+            + ''.join(f"    {line}\n" for line in body)
+            + f"    return ({outputs},)\n"
+        )
+        self.scalar = self._build({f"_f_{name}": impl for name, (impl, _) in _FUNCTIONS.items()})
+        self._batch: Optional[Callable] = None  # Numba 编译的逐行循环
+        self._vector: Optional[Callable] = None  # NumPy 向量化版本
+
+    def _build(self, namespace: Dict[str, Any]) -> Callable:
+        namespace = dict(namespace)
+        exec(compile(self.function_source, '<numeric_kernel>', 'exec'), namespace)
+        return namespace['_kernel']
+
+    def _numeric_vector(self, names: Sequence[str], values: Mapping[str, Any]) -> Optional[List[float]]:
+        result = []
+        for name in names:
+            value = values.get(name)
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return None
+            result.append(value)
+        return result
+
+    def run(self, inputs: Mapping[str, Any], parameters: Mapping[str, Any]) -> Optional[Dict[str, Any]]:
+        """单次执行；输入或参数缺失、非数值或计算出错时返回 None"""
+        in_values = self._numeric_vector(self.input_names, inputs)
+        par_values = self._numeric_vector(self.param_names, parameters)
+        if in_values is None or par_values is None:
+            return None
+        try:
+            values = self.scalar(in_values, par_values)
+        except (ArithmeticError, ValueError):
+            return None
+        return dict(zip(self.output_names, values))
+
+    def run_batch(self, inputs, parameters: Mapping[str, Any], use_numba: bool = True) -> Dict[str, Any]:
+        """批量执行
+
+        ``inputs`` 为形如 ``(样本数, len(input_names))`` 的数组，列顺序与 input_names 一致；
+        返回输出名到一维数组的映射。``use_numba`` 为假或未安装 Numba 时以 NumPy 向量化运行。
+        """
+        import numpy as np
+
+        in_matrix = np.asarray(inputs, dtype=np.float64).reshape(-1, len(self.input_names))
+        par_vector = np.asarray([float(parameters[name]) for name in self.param_names], dtype=np.float64)
+        rows = in_matrix.shape[0]
+
+        if use_numba and numba is not None:
+            out_matrix = np.empty((rows, len(self.output_names)), dtype=np.float64)
+            self._batch_function()(in_matrix, par_vector, out_matrix)
+            return {name: out_matrix[:, i] for i, name in enumerate(self.output_names)}
+
+        if self._vector is None:
+            self._vector = self._build({f"_f_{name}": getattr(np, np_name)
+                                       for name, (_, np_name) in _FUNCTIONS.items()})
+        with np.errstate(all='ignore'):
+            values = self._vector(in_matrix.T, par_vector)
+        return {name: np.broadcast_to(np.asarray(value, dtype=np.float64), (rows,)).copy()
+                for name, value in zip(self.output_names, values)}
+
+    def _batch_function(self) -> Callable:
+        """Numba 编译的逐行循环（首次调用时编译；释放 GIL，可在线程池中并发执行）"""
+        if self._batch is None:
+            kernel = numba.njit(nogil=True)(self.scalar)
+            namespace = {'_kernel': kernel}
+            exec(compile(
+                "def _batch(_in, _par, _out):\n"
+                "    for _r in range(_in.shape[0]):\n"
+                "        _values = _kernel(_in[_r], _par)\n"
+                + ''.join(f"        _out[_r, {i}] = _values[{i}]\n" for i in range(len(self.output_names))),
+                '<numeric_batch>', 'exec'), namespace)
+            self._batch = numba.njit(nogil=True)(namespace['_batch'])
+        return self._batch
+
+
+@lru_cache(maxsize=512)
+def numeric_kernel(source: str) -> Optional[NumericKernel]:
+    """获取源码对应的数值内核；不可改写的代码返回 None（结果按源码缓存，容量同 compile_python_code）"""
+    try:
+        return NumericKernel(source)
+    except (SyntaxError, ValueError):
+        return None
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""
+失效模式触发条件数组快照
+Failure Trigger Arrays
+
+接口的纯概率触发条件（见 TriggerCondition.is_simple_probability）的单步概率与所属失效模式
+保存在并行 NumPy 数组中，一次随机数抽样完成全部判定；其余条件仅对尚未触发的失效模式逐个评估。
+
+快照记录建立时各失效模式、触发条件及其参数的取值，每次检查前与当前取值比对，
+失效模式列表、触发条件列表或条件参数（包括原地修改）变化后自动重建，不需要手动失效。
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+_default_rng = None
+
+
+def _signature(failure_modes: Sequence[Any]) -> Tuple:
+    """失效模式及其触发条件中影响判定结果的取值"""
+    return tuple(
+        (fm, tuple((c, c.enabled, c.condition_type, c.python_code, c.probability, tuple(c.parameters.items()))
+                   for c in fm.trigger_conditions))
+        for fm in failure_modes
+    )
+
+
+class FailureTriggerArrays:
+    """接口失效模式触发条件的结构数组快照"""
+
+    __slots__ = ('failure_modes', 'conditions', 'fallback', 'owners', 'probabilities', 'signature')
+
+    def __init__(self, failure_modes: Sequence[Any]):
+        import numpy as np
+
+        self.failure_modes: List[Any] = list(failure_modes)
+        self.signature = _signature(self.failure_modes)
+        self.conditions: List[Any] = []  # 纯概率条件
+        self.fallback: List[List[Any]] = []  # 每个失效模式需逐个评估的条件
+
+        owners: List[int] = []
+        probabilities: List[float] = []
+        for index, failure_mode in enumerate(self.failure_modes):
+            others = []
+            for condition in failure_mode.trigger_conditions:
+                if condition.is_simple_probability():
+                    self.conditions.append(condition)
+                    owners.append(index)
+                    probabilities.append(condition.step_probability() if condition.enabled else 0.0)
+                elif condition.enabled:
+                    others.append(condition)
+            self.fallback.append(others)
+
+        self.owners = np.asarray(owners, dtype=np.int32)
+        self.probabilities = np.asarray(probabilities, dtype=np.float64)
+
+    def matches(self, failure_modes: Sequence[Any]) -> bool:
+        """快照是否仍与当前的失效模式及触发条件一致"""
+        return _signature(failure_modes) == self.signature
+
+    def check(self, context: Optional[Dict[str, Any]] = None, rng=None) -> List[Any]:
+        """返回本步触发的失效模式（保持 failure_modes 中的顺序）"""
+        import numpy as np
+
+        global _default_rng
+        context = context if context is not None else {}
+        if rng is None:
+            if _default_rng is None:
+                _default_rng = np.random.default_rng()
+            rng = _default_rng
+
+        fired = np.zeros(len(self.failure_modes), dtype=bool)
+        if self.conditions:
+            hits = np.flatnonzero(rng.random(len(self.conditions)) < self.probabilities)
+            if hits.size:
+                fired[self.owners[hits]] = True
+                # 与逐个评估一致，记录触发时间与次数
+                now = context.get('time', context.get('current_time', 0.0))
+                runtime = context.setdefault('runtime', {})
+                for idx in hits:
+                    stats = runtime.setdefault(f"prob_{self.conditions[idx].id}", {})
+                    stats['last_trigger_time'] = now
+                    stats['activations'] = int(stats.get('activations', 0)) + 1
+
+        for index, conditions in enumerate(self.fallback):
+            if conditions and not fired[index]:
+                fired[index] = any(condition.evaluate(context) for condition in conditions)
+
+        return [fm for fm, hit in zip(self.failure_modes, fired) if hit]
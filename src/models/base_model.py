@@ -6,24 +6,169 @@ Base Data Model
 定义系统中所有数据模型的基类和通用接口
 """
 
+import ast
+import builtins
+import dis
 import json
+import logging
+import sys
 import uuid
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
+from types import CodeType
 from typing import Dict, Any, Optional, List
 from abc import ABC, abstractmethod
 
 
+# 同一段用户代码反复出错时，仅前若干次以 WARNING 记录（附带堆栈），之后降为 DEBUG
+CODE_ERROR_LOG_LIMIT = 5
+# 计数最多保留的出错代码数，超出时丢弃最久未出错的；每次仿真开始时清空（见 reset_code_error_counts）
+CODE_ERROR_KEYS_LIMIT = 256
+_code_error_counts: 'OrderedDict[Any, int]' = OrderedDict()
+
+
+def reset_code_error_counts():
+    """清空用户代码出错计数，使新一次仿真中的错误重新以 WARNING 记录"""
+    _code_error_counts.clear()
+
+
+def log_code_error(logger: logging.Logger, key: Any, message: str, *args: Any):
+    """记录用户代码执行错误（需在 except 块内调用）
+
+    ``key`` 标识出错的代码（通常为源码字符串），按 key 计数限流，避免仿真循环中
+    每步都格式化消息、输出堆栈；消息参数仅在日志级别启用时才格式化。
+    """
+    count = _code_error_counts.pop(key, 0) + 1
+    _code_error_counts[key] = count
+    if len(_code_error_counts) > CODE_ERROR_KEYS_LIMIT:
+        _code_error_counts.popitem(last=False)
+    if count <= CODE_ERROR_LOG_LIMIT:
+        if count == CODE_ERROR_LOG_LIMIT:
+            message += "（后续相同错误仅在 DEBUG 级别记录）"
+        logger.warning(message, *args, exc_info=True)
+    elif logger.isEnabledFor(logging.DEBUG):
+        logger.debug(message, *args, exc_info=True)
+
+
+@lru_cache(maxsize=512)
+def compile_python_code(source: str, filename: str = '<python_code>') -> CodeType:
+    """编译用户 Python 建模代码；相同源码只编译一次，模板实例之间共享代码对象"""
+    return compile(source, filename, 'exec')
+
+
+# from_dict 中字段缺失的标记；需要新建对象的默认值（ID、空容器、当前时间）只在缺失时才生成
+_MISSING = object()
+
+# 用户代码共用的全局命名空间，预置 __builtins__，避免每次 exec 新建字典并注入内置模块
+EXEC_GLOBALS: Dict[str, Any] = {'__builtins__': builtins}
+_GLOBAL_WRITE_OPS = frozenset({'STORE_GLOBAL', 'DELETE_GLOBAL'})
+
+
+@lru_cache(maxsize=512)
+def _writes_globals(code: CodeType) -> bool:
+    """代码（含嵌套函数）是否通过 global 语句写入全局命名空间"""
+    if any(instruction.opname in _GLOBAL_WRITE_OPS for instruction in dis.get_instructions(code)):
+        return True
+    return any(isinstance(const, CodeType) and _writes_globals(const) for const in code.co_consts)
+
+
+def exec_globals(code: CodeType) -> Dict[str, Any]:
+    """返回执行 ``code`` 所用的全局命名空间
+
+    通常共用 EXEC_GLOBALS；使用 global 语句写全局变量的代码每次获得新的命名空间，
+    以免写入的值在不同调用、不同对象之间残留。
+    """
+    if _writes_globals(code):
+        return {'__builtins__': builtins}
+    return EXEC_GLOBALS
+
+
+def serializable_fields(cls):
+    """类装饰器：依据 ``cls._FIELDS`` 生成 to_dict/from_dict
+
+    ``_FIELDS`` 为 (属性名, 默认值[, 转换函数]) 序列。生成的方法先调用父类实现，再逐字段直接读写，
+    没有循环与逐字段分派；默认值须为字面量，可变默认值只在字段缺失时才新建。
+    转换函数（如 intern_str）作用于 from_dict 读取到的值。
+    """
+    to_lines = ["def to_dict(self):", "    base_dict = super(_cls, self).to_dict()"]
+    from_lines = ["def from_dict(self, data):", "    super(_cls, self).from_dict(data)", "    get = data.get"]
+    namespace = {'_cls': cls, '_MISSING': _MISSING}
+    for index, (name, default, *converter) in enumerate(cls._FIELDS):
+        literal = repr(default)
+        if not name.isidentifier() or ast.literal_eval(literal) != default or len(converter) > 1:
+            raise ValueError(f"{cls.__name__} 的字段定义无效: {name!r}={default!r}")
+        to_lines.append(f"    base_dict[{name!r}] = self.{name}")
+        if isinstance(default, (dict, list)):
+            # 可变默认值：避免每次调用都新建一个用不到的空容器
+            from_lines.append(f"    value = get({name!r}, _MISSING)")
+            value = f"{literal} if value is _MISSING else value"
+        else:
+            value = f"get({name!r}, {literal})"
+        if converter:
+            namespace[f"_convert{index}"] = converter[0]
+            value = f"_convert{index}({value})"
+        from_lines.append(f"    self.{name} = {value}")
+    to_lines.append("    return base_dict")
+
+    source = "\n".join(to_lines + from_lines) + "\n"
+    exec(compile(source, f"<serializable:{cls.__qualname__}>", 'exec'), namespace)
+    for method_name in ('to_dict', 'from_dict'):
+        method = namespace[method_name]
+        method.__qualname__ = f"{cls.__qualname__}.{method_name}"
+        method.__module__ = cls.__module__
+        setattr(cls, method_name, method)
+    return cls
+
+
+def intern_str(value):
+    """驻留取值种类有限的短字符串（协议、格式、模块ID等），大量对象共享同一字符串对象；非字符串原样返回"""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _ev(member):
+    """枚举取值；模型中的枚举字段按约定只会是枚举成员或 None"""
+    return member.value if member is not None else None
+
+
+class DictCacheMixin:
+    """to_dict 结果缓存
+
+    子类把自身字段组成的字典保存到 ``_dict_cache``，to_dict 每次返回它的浅拷贝，
+    子对象部分（列表、字典、坐标等）每次重新生成，因此调用方可以自由修改返回值。
+    任何公开属性被重新赋值时（包括 update_modified_time 更新修改时间）缓存自动失效；
+    容器类属性在结果中以引用形式出现，原地修改无需失效。
+    """
+
+    __slots__ = ()
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_dict_cache', None)
+
+    def invalidate_dict_cache(self):
+        """显式使 to_dict 缓存失效"""
+        object.__setattr__(self, '_dict_cache', None)
+
+
 class BaseModel(ABC):
     """基础模型类，所有数据模型的父类"""
+
+    __slots__ = ('id', 'name', 'description', 'created_time', 'modified_time', 'version')
     
     def __init__(self, name: str = "", description: str = ""):
-        self.id = str(uuid.uuid4())
+        self._assign_default_id()
         self.name = name
         self.description = description
         self.created_time = datetime.now()
         self.modified_time = datetime.now()
         self.version = "1.0"
         
+    def _assign_default_id(self):
+        """分配默认ID，子类可改为首次读取时再生成"""
+        self.id = str(uuid.uuid4())
+
     def update_modified_time(self):
         """更新修改时间"""
         self.modified_time = datetime.now()
@@ -43,13 +188,23 @@ class BaseModel(ABC):
     @abstractmethod
     def from_dict(self, data: Dict[str, Any]):
         """从字典格式加载数据"""
-        self.id = data.get('id', str(uuid.uuid4()))
+        value = data.get('id', _MISSING)
+        self.id = str(uuid.uuid4()) if value is _MISSING else value
         self.name = data.get('name', '')
         self.description = data.get('description', '')
-        self.created_time = datetime.fromisoformat(data.get('created_time', datetime.now().isoformat()))
-        self.modified_time = datetime.fromisoformat(data.get('modified_time', datetime.now().isoformat()))
+        value = data.get('created_time', _MISSING)
+        self.created_time = datetime.now() if value is _MISSING else datetime.fromisoformat(value)
+        value = data.get('modified_time', _MISSING)
+        self.modified_time = datetime.now() if value is _MISSING else datetime.fromisoformat(value)
         self.version = data.get('version', '1.0')
     
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]):
+        """由字典构造对象"""
+        obj = cls()
+        obj.from_dict(data)
+        return obj
+    
     def to_json(self) -> str:
         """转换为JSON字符串"""
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
@@ -76,10 +231,20 @@ class BaseModel(ABC):
 
 class Point:
     """二维坐标点"""
+
+    __slots__ = ('x', 'y')
     
     def __init__(self, x: float = 0.0, y: float = 0.0):
         self.x = x
         self.y = y
+
+    @classmethod
+    def from_mapping(cls, data: Dict[str, float]) -> 'Point':
+        """由字典直接构造坐标点"""
+        point = cls.__new__(cls)
+        point.x = data.get('x', 0.0)
+        point.y = data.get('y', 0.0)
+        return point
     
     def to_dict(self) -> Dict[str, float]:
         return {'x': self.x, 'y': self.y}
@@ -120,11 +285,18 @@ class ConnectionPoint:
             'connected_to': self.connected_to
         }
     
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'ConnectionPoint':
+        """由字典构造连接点"""
+        point = cls()
+        point.from_dict(data)
+        return point
+    
     def from_dict(self, data: Dict[str, Any]):
-        self.id = data.get('id', str(uuid.uuid4()))
+        value = data.get('id', _MISSING)
+        self.id = str(uuid.uuid4()) if value is _MISSING else value
         self.name = data.get('name', '')
-        self.position = Point()
-        self.position.from_dict(data.get('position', {}))
+        self.position = Point.from_mapping(data.get('position', {}))
         self.connection_type = data.get('connection_type', 'input')
         self.data_type = data.get('data_type', 'signal')
         self.variables = data.get('variables', [])
@@ -5,9 +5,15 @@
 Environment Modeling Data Model
 """
 
+import logging
 from typing import Dict, List, Any, Optional
 from enum import Enum
-from .base_model import BaseModel
+from ._imports import BaseModel, CodeRunner, log_code_error
+
+logger = logging.getLogger(__name__)
+
+# 用户代码包装为函数时的参数（依次对应 exec 执行时预置的局部变量）
+_CODE_ARGS = ('system_state', 'modified_state', 'current_time', 'parameters', 'stress_factors', 'affected_modules')
 
 
 class EnvironmentType(Enum):
@@ -140,6 +146,7 @@ class EnvironmentModule(BaseModel):
         self.color = "#FFE4B5"    # 模块颜色
         self.affected_modules = []  # 受影响的模块ID列表
         self.enabled = True       # 是否启用
+        self._code = CodeRunner(_CODE_ARGS, 'modified_state', '<environment>')
     
     def add_stress_factor(self, stress_factor: StressFactor):
         """添加应力因子"""
@@ -191,18 +198,11 @@ class EnvironmentModule(BaseModel):
         # 执行自定义Python代码
         if self.python_code:
             try:
-                local_vars = {
-                    'system_state': system_state,
-                    'modified_state': modified_state,
-                    'current_time': current_time,
-                    'parameters': self.parameters,
-                    'stress_factors': {sf.name: sf.generate_stress_value(current_time) for sf in self.stress_factors},
-                    'affected_modules': self.affected_modules
-                }
-                exec(self.python_code, {}, local_vars)
-                modified_state = local_vars.get('modified_state', modified_state)
-            except Exception as e:
-                print(f"执行环境模块 {self.name} 的Python代码时出错: {e}")
+                stress_values = {sf.name: sf.generate_stress_value(current_time) for sf in self.stress_factors}
+                modified_state = self._code.run(self.python_code, system_state, modified_state, current_time,
+                                                self.parameters, stress_values, self.affected_modules)
+            except Exception:
+                log_code_error(logger, self.python_code, "执行环境模块 %s 的Python代码时出错", self.name)
         
         return modified_state
     
@@ -8,7 +8,7 @@ Fault Tree Analysis Data Model
 from typing import Dict, List, Any, Optional, Set, Tuple
 from enum import Enum
 import uuid
-from .base_model import BaseModel
+from ._imports import BaseModel
 
 
 class EventType(Enum):
@@ -6,19 +6,24 @@ Interface Data Model
 定义各种接口类型和失效模式的数据结构
 """
 
+from collections import defaultdict, deque
 from datetime import datetime
 import copy
+import logging
 import random
 import math
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from enum import Enum
+from types import MappingProxyType
 import uuid
 
-STATE_HISTORY_LIMIT = 200
-try:
-    from .base_model import BaseModel
-except ImportError:
-    from base_model import BaseModel
+STATE_HISTORY_LIMIT = 200  # 状态历史默认保留条数，可由接口参数 history_max 覆盖
+_EMPTY = MappingProxyType({})  # 只读空映射，上下文缺项时的默认值
+from ._imports import (BaseModel, DictCacheMixin, _MISSING, _ev, compile_python_code, exec_globals,
+                       intern_str, is_read_only, log_code_error, numeric_kernel)
+from ._trigger_arrays import FailureTriggerArrays
+
+logger = logging.getLogger(__name__)
 
 
 class InterfaceType(Enum):
@@ -56,9 +61,12 @@ class FailureMode(Enum):
     ENVIRONMENTAL_STRESS = "environmental_stress"  # 环境应力
 
 
-class TriggerCondition:
+class TriggerCondition(DictCacheMixin):
     """触发条件"""
 
+    __slots__ = ('id', 'name', 'condition_type', 'parameters', 'python_code', 'probability',
+                 'enabled', '_dict_cache', '_compiled', '_code_src', '_exec_locals')
+
     def __init__(self, name: str = "", condition_type: str = "threshold"):
         self.id = str(uuid.uuid4())
         self.name = name
@@ -67,6 +75,9 @@ class TriggerCondition:
         self.python_code = ""  # Python条件判断代码
         self.probability = 0.0  # 触发概率
         self.enabled = True
+        self._compiled = None  # python_code 的编译结果，源码变化时重新编译
+        self._code_src = None
+        self._exec_locals: Optional[Dict[str, Any]] = {}  # 执行 python_code 时复用的局部变量字典
 
     def evaluate(self, context: Dict[str, Any]) -> bool:
         """评估触发条件是否满足"""
@@ -75,29 +86,39 @@ class TriggerCondition:
 
         # 优先执行自定义Python代码
         if self.python_code:
+            # 复用局部变量字典；使用期间从实例上取下，重入调用时退化为新建字典
+            local_vars = self._exec_locals
+            self._exec_locals = None
+            if local_vars is None:
+                local_vars = {}
+            local_vars['context'] = context
+            local_vars['parameters'] = self.parameters
+            local_vars['result'] = False
             try:
-                local_vars = {
-                    'context': context,
-                    'parameters': self.parameters,
-                    'result': False
-                }
-                exec(self.python_code, {}, local_vars)
+                if self._code_src is not self.python_code:
+                    self._compiled = compile_python_code(self.python_code, '<trigger>')
+                    self._code_src = self.python_code
+                exec(self._compiled, exec_globals(self._compiled), local_vars)
                 return bool(local_vars.get('result', False))
-            except Exception as e:
-                print(f"评估触发条件 {self.name} 时出错: {e}")
+            except Exception:
+                log_code_error(logger, self.python_code, "评估触发条件 %s 时出错", self.name)
                 return False
+            finally:
+                local_vars.clear()
+                self._exec_locals = local_vars
 
         condition_type = self.condition_type.lower()
-        inputs = context.get('inputs', {})
-        state_variables = context.get('state_variables', {})
-        environment = context.get('environment', {})
+        params = self.parameters
+        inputs = context.get('inputs') or _EMPTY
+        state_variables = context.get('state_variables') or _EMPTY
+        environment = context.get('environment') or _EMPTY
         now = context.get('time', context.get('current_time', 0.0))
 
         # 简单阈值判断
         if condition_type == 'threshold':
-            variable = self.parameters.get('variable')
-            operator = self.parameters.get('operator', '>=')
-            threshold = self.parameters.get('value')
+            variable = params.get('variable')
+            operator = params.get('operator', '>=')
+            threshold = params.get('value')
 
             if variable is None or threshold is None:
                 return False
@@ -124,23 +145,23 @@ class TriggerCondition:
                     return actual_value == threshold
                 if operator == '!=':
                     return actual_value != threshold
-            except Exception as exc:
-                print(f"阈值条件计算失败: {exc}")
+            except Exception:
+                log_code_error(logger, self.id, "触发条件 %s 的阈值计算失败", self.name)
                 return False
 
         # 事件触发：根据上下文的事件集合判断
         elif condition_type == 'event':
-            event_name = self.parameters.get('event')
-            events = context.get('events', set())
+            event_name = params.get('event')
+            events = context.get('events') or _EMPTY
             return event_name in events if event_name else False
 
         # 时间触发：比较当前时间或任务阶段时间
         elif condition_type == 'time':
             current_time = context.get('time', 0.0)
-            trigger_time = self.parameters.get('time', None)
+            trigger_time = params.get('time', None)
             if trigger_time is None:
                 return False
-            comparison = self.parameters.get('comparison', '>=')
+            comparison = params.get('comparison', '>=')
             if comparison == '>=':
                 return current_time >= trigger_time
             if comparison == '>':
@@ -155,8 +176,8 @@ class TriggerCondition:
         # 概率触发：使用设定概率判断
         elif condition_type == 'probability':
             # 时间窗口（可选）
-            start_time = self.parameters.get('start_time')
-            duration = self.parameters.get('duration')
+            start_time = params.get('start_time')
+            duration = params.get('duration')
             in_window = True
             try:
                 if start_time is not None:
@@ -174,13 +195,13 @@ class TriggerCondition:
             runtime = context.setdefault('runtime', {})
             stats = runtime.setdefault(f"prob_{self.id}", {})
             try:
-                cooldown = float(self.parameters.get('cooldown', 0.0) or 0.0)
+                cooldown = float(params.get('cooldown', 0.0) or 0.0)
             except Exception:
                 cooldown = 0.0
             last_t = stats.get('last_trigger_time')
             if last_t is not None and cooldown > 0 and (now - last_t) < cooldown:
                 return False
-            max_activations = self.parameters.get('max_activations')
+            max_activations = params.get('max_activations')
             if max_activations is not None:
                 try:
                     if int(stats.get('activations', 0)) >= int(max_activations):
@@ -189,29 +210,7 @@ class TriggerCondition:
                     pass
 
             # 计算单步概率 p：优先 parameters['p'/'probability']，否则由 λ/步长换算
-            p = self.parameters.get('p', self.parameters.get('probability', None))
-            if p is None:
-                lam = self.parameters.get('lambda_per_hour')
-                try:
-                    lam = float(lam) if lam is not None else None
-                except Exception:
-                    lam = None
-                if lam is not None:
-                    try:
-                        dt = float(self.parameters.get('dt', 1.0))
-                    except Exception:
-                        dt = 1.0
-                    try:
-                        p = 1.0 - math.exp(-lam * dt / 3600.0)
-                    except Exception:
-                        p = 0.0
-                else:
-                    p = self.probability or 0.0
-            try:
-                p = float(p)
-            except Exception:
-                p = 0.0
-            p = max(0.0, min(1.0, p))
+            p = self.step_probability()
 
             # RNG 优先从 context['random'] / 兼容旧字段 'random_generator'
             rng = context.get('random', None) or context.get('random_generator', None)
@@ -228,19 +227,69 @@ class TriggerCondition:
 
         return False
 
+    def step_probability(self) -> float:
+        """概率触发条件的单步触发概率
+
+        优先使用 parameters['p'/'probability']，否则由 λ（每小时）与步长 dt（秒）换算，
+        最后回退到 probability 属性；结果截断到 [0, 1]。
+        """
+        params = self.parameters
+        p = params.get('p', params.get('probability', None))
+        if p is None:
+            lam = params.get('lambda_per_hour')
+            try:
+                lam = float(lam) if lam is not None else None
+            except Exception:
+                lam = None
+            if lam is not None:
+                try:
+                    dt = float(params.get('dt', 1.0))
+                except Exception:
+                    dt = 1.0
+                try:
+                    p = 1.0 - math.exp(-lam * dt / 3600.0)
+                except Exception:
+                    p = 0.0
+            else:
+                p = self.probability or 0.0
+        try:
+            p = float(p)
+        except Exception:
+            p = 0.0
+        return max(0.0, min(1.0, p))
+
+    def is_simple_probability(self) -> bool:
+        """是否为无时间窗口、冷却、次数限制与自定义代码的纯概率条件"""
+        if self.python_code or self.condition_type.lower() != 'probability':
+            return False
+        params = self.parameters
+        return (params.get('start_time') is None and params.get('duration') is None and
+                params.get('max_activations') is None and not params.get('cooldown'))
+
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'condition_type': self.condition_type,
-            'parameters': self.parameters,
-            'python_code': self.python_code,
-            'probability': self.probability,
-            'enabled': self.enabled
-        }
+        cached = self._dict_cache
+        if cached is None:
+            self._dict_cache = cached = {
+                'id': self.id,
+                'name': self.name,
+                'condition_type': self.condition_type,
+                'parameters': self.parameters,
+                'python_code': self.python_code,
+                'probability': self.probability,
+                'enabled': self.enabled
+            }
+        return dict(cached)
+
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'TriggerCondition':
+        """由字典构造触发条件"""
+        condition = cls()
+        condition.from_dict(data)
+        return condition
 
     def from_dict(self, data: Dict[str, Any]):
-        self.id = data.get('id', str(uuid.uuid4()))
+        value = data.get('id', _MISSING)
+        self.id = str(uuid.uuid4()) if value is _MISSING else value
         self.name = data.get('name', '')
         self.condition_type = data.get('condition_type', 'threshold')
         self.parameters = data.get('parameters', {})
@@ -258,9 +307,14 @@ class TriggerCondition:
         return new_condition
 
 
-class InterfaceFailureMode:
+class InterfaceFailureMode(DictCacheMixin):
     """接口失效模式"""
 
+    __slots__ = ('id', 'failure_mode', 'name', 'description', 'severity', 'occurrence_rate',
+                 'detection_rate', 'failure_rate', 'trigger_conditions', 'effects',
+                 'mitigation_measures', 'python_code', 'associated_state_id', 'enabled',
+                 '_dict_cache')
+
     def __init__(self, failure_mode: FailureMode, name: str = ""):
         self.id = str(uuid.uuid4())
         self.failure_mode = failure_mode
@@ -293,25 +347,37 @@ class InterfaceFailureMode:
         return False
     
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'failure_mode': self.failure_mode.value,
-            'name': self.name,
-            'description': self.description,
-            'severity': self.severity,
-            'occurrence_rate': self.occurrence_rate,
-            'detection_rate': self.detection_rate,
-            'failure_rate': self.failure_rate,
-            'trigger_conditions': [tc.to_dict() for tc in self.trigger_conditions],
-            'effects': self.effects,
-            'mitigation_measures': self.mitigation_measures,
-            'python_code': self.python_code,
-            'associated_state_id': self.associated_state_id,
-            'enabled': self.enabled
-        }
+        cached = self._dict_cache
+        if cached is None:
+            self._dict_cache = cached = {
+                'id': self.id,
+                'failure_mode': self.failure_mode.value,
+                'name': self.name,
+                'description': self.description,
+                'severity': self.severity,
+                'occurrence_rate': self.occurrence_rate,
+                'detection_rate': self.detection_rate,
+                'failure_rate': self.failure_rate,
+                'trigger_conditions': None,  # 占位保持键顺序，每次重新生成
+                'effects': self.effects,
+                'mitigation_measures': self.mitigation_measures,
+                'python_code': self.python_code,
+                'associated_state_id': self.associated_state_id,
+                'enabled': self.enabled
+            }
+        data = dict(cached)
+        data['trigger_conditions'] = [tc.to_dict() for tc in self.trigger_conditions]
+        return data
+
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'InterfaceFailureMode':
+        """由字典构造失效模式"""
+        failure_mode = cls(FailureMode.COMMUNICATION_FAILURE)
+        failure_mode.from_dict(data)
+        return failure_mode
 
     def from_dict(self, data: Dict[str, Any]):
-        self.failure_mode = FailureMode(data.get('failure_mode', FailureMode.COMMUNICATION_FAILURE.value))
+        self.failure_mode = _VAL[FailureMode].get(data.get('failure_mode'), FailureMode.COMMUNICATION_FAILURE)
         self.name = data.get('name', '')
         self.description = data.get('description', '')
         self.severity = data.get('severity', 1)
@@ -321,11 +387,7 @@ class InterfaceFailureMode:
         self.id = data.get('id', self.id)
 
         # 加载触发条件
-        self.trigger_conditions = []
-        for tc_data in data.get('trigger_conditions', []):
-            tc = TriggerCondition()
-            tc.from_dict(tc_data)
-            self.trigger_conditions.append(tc)
+        self.trigger_conditions = list(map(TriggerCondition.from_dict_cls, data.get('trigger_conditions', [])))
 
         self.effects = data.get('effects', [])
         self.mitigation_measures = data.get('mitigation_measures', [])
@@ -343,14 +405,13 @@ class InterfaceFailureMode:
         """
         s = max(1, min(10, int(self.severity or 1)))
         # 映射发生度
-        if 'occurrence_rate' in self.__dict__ and self.occurrence_rate and self.occurrence_rate > 0:
+        if self.occurrence_rate and self.occurrence_rate > 0:
             try:
                 o = max(1, min(10, int(round(float(self.occurrence_rate)))))
             except Exception:
                 o = 5
         elif self.failure_rate and self.failure_rate > 0:
             # 简单将失效率数量级映射到1~10：例如 1e-6→1，1e-5→2 ... 1e-1→6 等
-            import math
             try:
                 order = -math.log10(float(self.failure_rate))
                 o = max(1, min(10, int(round(11 - order))))
@@ -388,9 +449,12 @@ class InterfaceStateType(Enum):
     FAILURE = "failure"
 
 
-class InterfaceState:
+class InterfaceState(DictCacheMixin):
     """接口状态"""
 
+    __slots__ = ('id', 'name', 'state_type', 'description', 'python_code', 'outputs', 'metadata',
+                 '_dict_cache', '_compiled', '_code_src')
+
     def __init__(self, name: str = "正常状态", state_type: InterfaceStateType = InterfaceStateType.NORMAL):
         self.id = str(uuid.uuid4())
         self.name = name
@@ -399,6 +463,8 @@ class InterfaceState:
         self.python_code = ""  # 状态下的执行代码
         self.outputs: Dict[str, Any] = {}
         self.metadata: Dict[str, Any] = {}
+        self._compiled = None
+        self._code_src = None
 
     def execute(self, context: Dict[str, Any], interface: 'Interface') -> Dict[str, Any]:
         """执行状态下的代码"""
@@ -413,33 +479,43 @@ class InterfaceState:
                     'state_outputs': copy.deepcopy(base_outputs),
                     'outputs': copy.deepcopy(base_outputs)
                 }
-                exec(self.python_code, {}, local_vars)
+                if self._code_src is not self.python_code:
+                    self._compiled = compile_python_code(self.python_code, '<state>')
+                    self._code_src = self.python_code
+                exec(self._compiled, exec_globals(self._compiled), local_vars)
                 return local_vars.get('outputs', base_outputs)
-            except Exception as exc:
-                print(f"执行接口状态 {self.name} 的Python代码时出错: {exc}")
+            except Exception:
+                log_code_error(logger, self.python_code, "执行接口状态 %s 的Python代码时出错", self.name)
                 return base_outputs
 
         return base_outputs
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'state_type': self.state_type.value,
-            'description': self.description,
-            'python_code': self.python_code,
-            'outputs': self.outputs,
-            'metadata': self.metadata
-        }
+        cached = self._dict_cache
+        if cached is None:
+            self._dict_cache = cached = {
+                'id': self.id,
+                'name': self.name,
+                'state_type': self.state_type.value,
+                'description': self.description,
+                'python_code': self.python_code,
+                'outputs': self.outputs,
+                'metadata': self.metadata
+            }
+        return dict(cached)
+
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'InterfaceState':
+        """由字典构造状态"""
+        state = cls()
+        state.from_dict(data)
+        return state
 
     def from_dict(self, data: Dict[str, Any]):
-        self.id = data.get('id', str(uuid.uuid4()))
+        value = data.get('id', _MISSING)
+        self.id = str(uuid.uuid4()) if value is _MISSING else value
         self.name = data.get('name', '正常状态')
-        state_type_value = data.get('state_type', InterfaceStateType.NORMAL.value)
-        try:
-            self.state_type = InterfaceStateType(state_type_value)
-        except ValueError:
-            self.state_type = InterfaceStateType.NORMAL
+        self.state_type = _VAL[InterfaceStateType].get(data.get('state_type'), InterfaceStateType.NORMAL)
         self.description = data.get('description', '')
         self.python_code = data.get('python_code', '')
         self.outputs = data.get('outputs', {})
@@ -454,9 +530,12 @@ class InterfaceState:
         return cloned
 
 
-class InterfaceTransition:
+class InterfaceTransition(DictCacheMixin):
     """接口状态转换"""
 
+    __slots__ = ('id', 'name', 'source_state_id', 'target_state_id', 'condition', 'priority',
+                 'is_recovery', 'metadata', '_dict_cache')
+
     def __init__(self, source_state_id: str, target_state_id: str,
                  condition: Optional[TriggerCondition] = None, name: str = ""):
         self.id = str(uuid.uuid4())
@@ -472,24 +551,36 @@ class InterfaceTransition:
         return self.condition.evaluate(context)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'name': self.name,
-            'source_state_id': self.source_state_id,
-            'target_state_id': self.target_state_id,
-            'condition': self.condition.to_dict(),
-            'priority': self.priority,
-            'is_recovery': self.is_recovery,
-            'metadata': self.metadata
-        }
+        cached = self._dict_cache
+        if cached is None:
+            self._dict_cache = cached = {
+                'id': self.id,
+                'name': self.name,
+                'source_state_id': self.source_state_id,
+                'target_state_id': self.target_state_id,
+                'condition': None,  # 占位保持键顺序，每次重新生成
+                'priority': self.priority,
+                'is_recovery': self.is_recovery,
+                'metadata': self.metadata
+            }
+        data = dict(cached)
+        data['condition'] = self.condition.to_dict()
+        return data
+
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'InterfaceTransition':
+        """由字典构造转换；from_dict 会写入全部字段，因此跳过 __init__ 中用不到的默认条件"""
+        transition = cls.__new__(cls)
+        transition.from_dict(data)
+        return transition
 
     def from_dict(self, data: Dict[str, Any]):
-        self.id = data.get('id', str(uuid.uuid4()))
+        value = data.get('id', _MISSING)
+        self.id = str(uuid.uuid4()) if value is _MISSING else value
         self.name = data.get('name', '')
         self.source_state_id = data.get('source_state_id', '')
         self.target_state_id = data.get('target_state_id', '')
-        self.condition = TriggerCondition()
-        self.condition.from_dict(data.get('condition', {}))
+        self.condition = TriggerCondition.from_dict_cls(data.get('condition', {}))
         self.priority = data.get('priority', 0)
         self.is_recovery = data.get('is_recovery', False)
         self.metadata = data.get('metadata', {})
@@ -509,9 +600,25 @@ class InterfaceDirection(Enum):
     BIDIRECTIONAL = "bidirectional"
 
 
-class Interface(BaseModel):
+# 枚举取值 -> 成员，反序列化时以字典查找代替 Enum(value) 调用
+_VAL = {
+    enum_cls: {member.value: member for member in enum_cls}
+    for enum_cls in (InterfaceType, HardwareInterfaceSubtype, FailureMode, InterfaceStateType, InterfaceDirection)
+}
+
+
+class Interface(DictCacheMixin, BaseModel):
     """接口基类，支持状态机、失效模式与Python行为建模"""
 
+    __slots__ = ('interface_type', 'direction', 'subtype', 'source_module_id', 'target_module_id',
+                 'protocol', 'data_format', 'bandwidth', 'latency', 'reliability', 'failure_modes',
+                 'python_code', 'parameters', 'state_machine_enabled', 'states', 'transitions',
+                 'normal_state_id', 'current_state_id', 'state_history', 'failure_state_map',
+                 'category', 'template_key',  # 由接口模板实例化时标注
+                 '_dict_cache', '_exec_locals', '_compiled', '_code_src', '_inputs_read_only',
+                 '_failure_arrays', '_fm_by_name', '_fm_index_key', '_states_by_type',
+                 '_states_index_key')
+
     def __init__(self, name: str = "", description: str = "",
                  interface_type: InterfaceType = InterfaceType.SOFTWARE_HARDWARE,
                  direction: InterfaceDirection = InterfaceDirection.BIDIRECTIONAL):
@@ -536,9 +643,23 @@ class Interface(BaseModel):
         self.transitions: List[InterfaceTransition] = []
         self.normal_state_id: Optional[str] = None
         self.current_state_id: Optional[str] = None
-        self.state_history: List[Dict[str, Any]] = []
+        self.state_history: deque = self._new_state_history()
         self.failure_state_map: Dict[str, str] = {}  # 失效模式名称 -> 状态ID
 
+        # simulate_interface 执行Python代码时复用的局部变量字典
+        self._exec_locals: Optional[Dict[str, Any]] = {}
+        self._compiled = None  # python_code 的编译结果，源码变化时重新编译
+        self._code_src = None
+        self._inputs_read_only = False  # python_code 是否只读取 inputs（只读时不再深拷贝输入）
+        # check_failure_conditions_fast 使用的触发条件数组快照，失效模式或触发条件变化时重建
+        self._failure_arrays = None
+        # 失效模式名称索引；记录建立时的列表对象与长度，以识别对 failure_modes 的直接修改
+        self._fm_by_name: Dict[str, InterfaceFailureMode] = {}
+        self._fm_index_key = None
+        # 状态类型 -> 状态ID列表（按加入顺序）；与失效模式索引相同，记录 states 对象与长度以识别直接修改
+        self._states_by_type: Dict[InterfaceStateType, List[str]] = defaultdict(list)
+        self._states_index_key = (id(self.states), 0)
+
         self._initialize_default_state()
 
     # ------------------------------------------------------------------
@@ -561,7 +682,12 @@ class Interface(BaseModel):
             state = state.clone()
             state.id = str(uuid.uuid4())
 
-        self.states[state.id] = state
+        states = self.states
+        index_valid = self._states_index_key == (id(states), len(states))
+        states[state.id] = state
+        if index_valid:
+            self._states_by_type[state.state_type].append(state.id)
+            self._states_index_key = (id(states), len(states))
 
         if make_default or (state.state_type == InterfaceStateType.NORMAL and not self.normal_state_id):
             self.normal_state_id = state.id
@@ -574,26 +700,39 @@ class Interface(BaseModel):
 
     def remove_state(self, state_id: str):
         """移除状态并清理相关转换"""
-        if state_id not in self.states:
-            return
+        self.remove_states((state_id,))
 
-        del self.states[state_id]
+    def remove_states(self, state_ids: Iterable[str]):
+        """批量移除状态，并在一次遍历中清理相关转换"""
+        removed = {state_id for state_id in state_ids if state_id in self.states}
+        if not removed:
+            return
 
-        # 移除相关转换
-        self.transitions = [
-            t for t in self.transitions
-            if t.source_state_id != state_id and t.target_state_id != state_id
-        ]
+        states = self.states
+        index_valid = self._states_index_key == (id(states), len(states))
+        for state_id in removed:
+            del states[state_id]
+        if index_valid:
+            for state_ids_of_type in self._states_by_type.values():
+                state_ids_of_type[:] = [state_id for state_id in state_ids_of_type if state_id not in removed]
+            self._states_index_key = (id(states), len(states))
+
+        # 原地移除相关转换，保持列表对象不变
+        transitions = self.transitions
+        for index in range(len(transitions) - 1, -1, -1):
+            transition = transitions[index]
+            if transition.source_state_id in removed or transition.target_state_id in removed:
+                del transitions[index]
 
         # 更新映射
         for failure_name, mapped_state in list(self.failure_state_map.items()):
-            if mapped_state == state_id:
+            if mapped_state in removed:
                 del self.failure_state_map[failure_name]
 
-        if self.normal_state_id == state_id:
+        if self.normal_state_id in removed:
             self.normal_state_id = None
 
-        if self.current_state_id == state_id:
+        if self.current_state_id in removed:
             self.reset_runtime_state()
 
         self.update_modified_time()
@@ -601,6 +740,34 @@ class Interface(BaseModel):
     def get_state(self, state_id: str) -> Optional[InterfaceState]:
         return self.states.get(state_id)
 
+    def _index_states_by_type(self) -> Dict[InterfaceStateType, List[str]]:
+        """一次遍历重建状态类型索引"""
+        index: Dict[InterfaceStateType, List[str]] = defaultdict(list)
+        for state_id, state in self.states.items():
+            index[state.state_type].append(state_id)
+        self._states_by_type = index
+        self._states_index_key = (id(self.states), len(self.states))
+        return index
+
+    def first_state_of_type(self, state_type: InterfaceStateType) -> Optional[str]:
+        """返回指定类型的第一个状态ID
+
+        索引随 add_state/remove_states 增量维护；states 被直接修改时重建。
+        状态类型可能在加入后被改写，因此命中时校验类型，未命中时重建一次再查。
+        """
+        states = self.states
+        rebuilt = self._states_index_key != (id(states), len(states))
+        index = self._index_states_by_type() if rebuilt else self._states_by_type
+        while True:
+            for state_id in index.get(state_type, ()):
+                state = states.get(state_id)
+                if state is not None and state.state_type is state_type:
+                    return state_id
+            if rebuilt:
+                return None
+            index = self._index_states_by_type()
+            rebuilt = True
+
     def add_transition(self, transition: InterfaceTransition) -> str:
         """添加状态转换，避免重复"""
         for existing in self.transitions:
@@ -615,7 +782,15 @@ class Interface(BaseModel):
         return transition.id
 
     def remove_transition(self, transition_id: str):
-        self.transitions = [t for t in self.transitions if t.id != transition_id]
+        self.remove_transitions((transition_id,))
+
+    def remove_transitions(self, transition_ids: Iterable[str]):
+        """批量移除状态转换（单次遍历，原地删除）"""
+        removed = set(transition_ids)
+        transitions = self.transitions
+        for index in range(len(transitions) - 1, -1, -1):
+            if transitions[index].id in removed:
+                del transitions[index]
         self.update_modified_time()
 
     def get_transitions_from_state(self, state_id: str) -> List[InterfaceTransition]:
@@ -639,33 +814,46 @@ class Interface(BaseModel):
         failure_mode.associated_state_id = state_id
         return state_id
 
-    def _ensure_transitions_for_failure_mode(self, failure_mode: InterfaceFailureMode, failure_state_id: str):
+    def _transition_keys(self) -> set:
+        """现有转换的 (源状态, 目标状态, 触发条件模板ID) 集合"""
+        return {
+            (t.source_state_id, t.target_state_id, t.metadata.get('trigger_condition_template_id'))
+            for t in self.transitions
+        }
+
+    def _ensure_transitions_for_failure_mode(self, failure_mode: InterfaceFailureMode, failure_state_id: str,
+                                             existing_keys: Optional[set] = None):
         normal_state_id = self.normal_state_id or self.current_state_id
         if not normal_state_id:
             return
 
+        if existing_keys is None:
+            existing_keys = self._transition_keys()
+
         for condition in failure_mode.trigger_conditions:
-            existing = False
-            for transition in self.transitions:
-                template_id = transition.metadata.get('trigger_condition_template_id')
-                if (transition.source_state_id == normal_state_id and
-                        transition.target_state_id == failure_state_id and
-                        template_id == condition.id):
-                    existing = True
-                    break
-
-            if existing:
+            key = (normal_state_id, failure_state_id, condition.id)
+            if key in existing_keys:
                 continue
 
             transition = InterfaceTransition(normal_state_id, failure_state_id, condition.clone(), failure_mode.name)
             transition.metadata['failure_mode'] = failure_mode.name
             transition.metadata['trigger_condition_template_id'] = condition.id
             self.add_transition(transition)
+            existing_keys.add(key)
 
     def _sync_state_machine_with_failure_modes(self):
+        existing_keys = self._transition_keys()
         for failure_mode in self.failure_modes:
             state_id = self._ensure_state_for_failure_mode(failure_mode)
-            self._ensure_transitions_for_failure_mode(failure_mode, state_id)
+            self._ensure_transitions_for_failure_mode(failure_mode, state_id, existing_keys)
+
+    def _new_state_history(self, records: Iterable[Dict[str, Any]] = ()) -> deque:
+        """创建有界的状态历史缓冲区"""
+        try:
+            limit = max(1, int(self.parameters.get('history_max', STATE_HISTORY_LIMIT)))
+        except (TypeError, ValueError):
+            limit = STATE_HISTORY_LIMIT
+        return deque(records, maxlen=limit)
 
     def reset_runtime_state(self, to_normal: bool = True):
         """重置状态机运行状态"""
@@ -677,7 +865,7 @@ class Interface(BaseModel):
         else:
             self.current_state_id = None
 
-        self.state_history = []
+        self.state_history = self._new_state_history()
 
     def step_state_machine(self, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """执行一次状态机评估并返回状态信息"""
@@ -721,9 +909,7 @@ class Interface(BaseModel):
             if 'failure_mode' in triggered_transition.metadata:
                 history_record['failure_mode'] = triggered_transition.metadata['failure_mode']
 
-            self.state_history.append(history_record)
-            if len(self.state_history) > STATE_HISTORY_LIMIT:
-                self.state_history = self.state_history[-STATE_HISTORY_LIMIT:]
+            self.state_history.append(history_record)  # 环形缓冲区，超出上限自动丢弃最早记录
 
         outputs = current_state.execute(context, self) if current_state else {}
 
@@ -738,29 +924,58 @@ class Interface(BaseModel):
     # 失效模式与行为建模
     # ------------------------------------------------------------------
     def add_failure_mode(self, failure_mode: InterfaceFailureMode):
-        if failure_mode not in self.failure_modes:
-            self.failure_modes.append(failure_mode)
+        failure_modes = self.failure_modes
+        if failure_mode not in failure_modes:
+            index = self._failure_mode_index()
+            failure_modes.append(failure_mode)
+            index.setdefault(failure_mode.name, failure_mode)  # 同名时仍指向先加入的失效模式
+            self._fm_index_key = (id(failure_modes), len(failure_modes))
 
         state_id = self._ensure_state_for_failure_mode(failure_mode)
         self._ensure_transitions_for_failure_mode(failure_mode, state_id)
         self.update_modified_time()
 
+    def _failure_mode_index(self) -> Dict[str, InterfaceFailureMode]:
+        """返回失效模式名称索引，failure_modes 被替换或长度变化时重建"""
+        failure_modes = self.failure_modes
+        key = (id(failure_modes), len(failure_modes))
+        if self._fm_index_key != key:
+            index: Dict[str, InterfaceFailureMode] = {}
+            for fm in failure_modes:
+                index.setdefault(fm.name, fm)
+            self._fm_by_name = index
+            self._fm_index_key = key
+        return self._fm_by_name
+
     def remove_failure_mode(self, failure_mode_name: str):
-        removed_modes = [fm for fm in self.failure_modes if fm.name == failure_mode_name]
-        self.failure_modes = [fm for fm in self.failure_modes if fm.name != failure_mode_name]
+        if self.get_failure_mode(failure_mode_name) is None:
+            return
 
-        for failure_mode in removed_modes:
-            state_id = failure_mode.associated_state_id or self.failure_state_map.get(failure_mode.name)
-            if state_id:
-                self.remove_state(state_id)
+        # 原地移除同名失效模式（可能不止一个）
+        failure_modes = self.failure_modes
+        removed_modes = []
+        for index in range(len(failure_modes) - 1, -1, -1):
+            if failure_modes[index].name == failure_mode_name:
+                removed_modes.append(failure_modes[index])
+                del failure_modes[index]
+        self._fm_by_name.pop(failure_mode_name, None)
+        self._fm_index_key = (id(failure_modes), len(failure_modes))
+
+        state_ids = [
+            failure_mode.associated_state_id or self.failure_state_map.get(failure_mode.name)
+            for failure_mode in removed_modes
+        ]
+        self.remove_states(state_id for state_id in state_ids if state_id)
 
         self.update_modified_time()
 
     def get_failure_mode(self, failure_mode_name: str) -> Optional[InterfaceFailureMode]:
-        for fm in self.failure_modes:
-            if fm.name == failure_mode_name:
-                return fm
-        return None
+        fm = self._failure_mode_index().get(failure_mode_name)
+        if fm is None or fm.name != failure_mode_name:
+            # 未命中或失效模式已被重命名：重建索引后再查一次
+            self._fm_index_key = None
+            fm = self._failure_mode_index().get(failure_mode_name)
+        return fm
 
     def get_active_failure_modes(self) -> List[InterfaceFailureMode]:
         active_modes = []
@@ -776,6 +991,18 @@ class Interface(BaseModel):
                 triggered_failures.append(failure_mode)
         return triggered_failures
 
+    def check_failure_conditions_fast(self, context: Optional[Dict[str, Any]] = None,
+                                      rng=None) -> List[InterfaceFailureMode]:
+        """check_failure_conditions 的向量化版本（需要 NumPy）
+
+        纯概率触发条件以 numpy.random.Generator ``rng`` 一次抽样判定，其余条件逐个评估。
+        失效模式或触发条件（包括参数的原地修改）变化后自动重建数组快照。
+        """
+        arrays = self._failure_arrays
+        if arrays is None or not arrays.matches(self.failure_modes):
+            self._failure_arrays = arrays = FailureTriggerArrays(self.failure_modes)
+        return arrays.check(context, rng)
+
     def simulate_interface(self, inputs: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         runtime_context = context.copy() if context else {}
         runtime_context['inputs'] = inputs
@@ -786,20 +1013,37 @@ class Interface(BaseModel):
         state_outputs = state_result.get('outputs', {}) or {}
         outputs.update(state_outputs)
 
-        if self.python_code:
-            local_vars = {
-                'inputs': copy.deepcopy(inputs),
-                'parameters': self.parameters,
-                'state_outputs': state_outputs,
-                'context': runtime_context,
-                'outputs': copy.deepcopy(outputs),
-                'interface': self
-            }
+        # 纯数值代码走改写后的函数，输入或参数不满足时回退到 exec
+        kernel = numeric_kernel(self.python_code) if self.python_code else None
+        numeric_outputs = kernel.run(inputs, self.parameters) if kernel is not None else None
+        if numeric_outputs is not None:
+            outputs.update(numeric_outputs)
+        elif self.python_code:
+            # 复用局部变量字典；使用期间从实例上取下，重入调用时退化为新建字典。
+            # outputs 已是输入的独立副本，直接交给用户代码修改；state_outputs 应视为只读。
+            local_vars = self._exec_locals
+            self._exec_locals = None
+            if local_vars is None:
+                local_vars = {}
             try:
-                exec(self.python_code, {}, local_vars)
+                if self._code_src is not self.python_code:
+                    self._compiled = compile_python_code(self.python_code, '<interface>')
+                    self._inputs_read_only = is_read_only(self.python_code, 'inputs')
+                    self._code_src = self.python_code
+                # 只读取 inputs 的代码直接使用调用方的输入，否则交给用户代码一份深拷贝
+                local_vars['inputs'] = inputs if self._inputs_read_only else copy.deepcopy(inputs)
+                local_vars['parameters'] = self.parameters
+                local_vars['state_outputs'] = state_outputs
+                local_vars['context'] = runtime_context
+                local_vars['outputs'] = outputs
+                local_vars['interface'] = self
+                exec(self._compiled, exec_globals(self._compiled), local_vars)
                 outputs = local_vars.get('outputs', outputs)
-            except Exception as e:
-                print(f"执行接口 {self.name} 的Python代码时出错: {e}")
+            except Exception:
+                log_code_error(logger, self.python_code, "执行接口 %s 的Python代码时出错", self.name)
+            finally:
+                local_vars.clear()
+                self._exec_locals = local_vars
 
         outputs.setdefault('__state__', state_result)
         active_failures = [fm.name for fm in self.get_active_failure_modes()]
@@ -867,64 +1111,59 @@ class Interface(BaseModel):
     # 序列化与反序列化
     # ------------------------------------------------------------------
     def to_dict(self) -> Dict[str, Any]:
-        base_dict = super().to_dict()
-        base_dict.update({
-            'interface_type': self.interface_type.value if hasattr(self.interface_type, 'value') else self.interface_type,
-            'direction': self.direction.value if hasattr(self.direction, 'value') else self.direction,
-            'subtype': self.subtype.value if self.subtype and hasattr(self.subtype, 'value') else self.subtype,
-            'source_module_id': self.source_module_id,
-            'target_module_id': self.target_module_id,
-            'protocol': self.protocol,
-            'data_format': self.data_format,
-            'bandwidth': self.bandwidth,
-            'latency': self.latency,
-            'reliability': self.reliability,
-            'failure_modes': [fm.to_dict() for fm in self.failure_modes],
-            'python_code': self.python_code,
-            'parameters': self.parameters,
-            'state_machine': {
-                'enabled': self.state_machine_enabled,
-                'states': {state_id: state.to_dict() for state_id, state in self.states.items()},
-                'transitions': [transition.to_dict() for transition in self.transitions],
-                'normal_state_id': self.normal_state_id,
-                'current_state_id': self.current_state_id,
-                'failure_state_map': self.failure_state_map,
-                'state_history': self.state_history
-            }
-        })
-        return base_dict
+        cached = self._dict_cache
+        if cached is None:
+            cached = super().to_dict()
+            cached.update({
+                'interface_type': _ev(self.interface_type),
+                'direction': _ev(self.direction),
+                'subtype': _ev(self.subtype),
+                'source_module_id': self.source_module_id,
+                'target_module_id': self.target_module_id,
+                'protocol': self.protocol,
+                'data_format': self.data_format,
+                'bandwidth': self.bandwidth,
+                'latency': self.latency,
+                'reliability': self.reliability,
+                'failure_modes': None,  # 占位保持键顺序，子对象与状态机每次重新生成
+                'python_code': self.python_code,
+                'parameters': self.parameters,
+                'state_machine': None
+            })
+            self._dict_cache = cached
+        data = dict(cached)
+        data['failure_modes'] = [fm.to_dict() for fm in self.failure_modes]
+        data['state_machine'] = {
+            'enabled': self.state_machine_enabled,
+            'states': {state_id: state.to_dict() for state_id, state in self.states.items()},
+            'transitions': [transition.to_dict() for transition in self.transitions],
+            'normal_state_id': self.normal_state_id,
+            'current_state_id': self.current_state_id,
+            'failure_state_map': self.failure_state_map,
+            'state_history': list(self.state_history)
+        }
+        return data
 
     def from_dict(self, data: Dict[str, Any]):
         super().from_dict(data)
-        self.interface_type = InterfaceType(data.get('interface_type', InterfaceType.SOFTWARE_HARDWARE.value))
-
-        # 加载方向
-        direction_value = data.get('direction', 'bidirectional')
-        try:
-            self.direction = InterfaceDirection(direction_value)
-        except ValueError:
-            self.direction = InterfaceDirection.BIDIRECTIONAL
+        self.interface_type = _VAL[InterfaceType].get(data.get('interface_type'), InterfaceType.SOFTWARE_HARDWARE)
+        self.direction = _VAL[InterfaceDirection].get(data.get('direction'), InterfaceDirection.BIDIRECTIONAL)
 
-        subtype_value = data.get('subtype')
-        if subtype_value and self.interface_type == InterfaceType.ALGORITHM_HARDWARE:
-            self.subtype = HardwareInterfaceSubtype(subtype_value)
+        if self.interface_type == InterfaceType.ALGORITHM_HARDWARE:
+            self.subtype = _VAL[HardwareInterfaceSubtype].get(data.get('subtype'))
         else:
             self.subtype = None
 
-        self.source_module_id = data.get('source_module_id', '')
-        self.target_module_id = data.get('target_module_id', '')
-        self.protocol = data.get('protocol', '')
-        self.data_format = data.get('data_format', '')
+        self.source_module_id = intern_str(data.get('source_module_id', ''))
+        self.target_module_id = intern_str(data.get('target_module_id', ''))
+        self.protocol = intern_str(data.get('protocol', ''))
+        self.data_format = intern_str(data.get('data_format', ''))
         self.bandwidth = data.get('bandwidth', 0.0)
         self.latency = data.get('latency', 0.0)
         self.reliability = data.get('reliability', 0.99)
 
         # 失效模式
-        self.failure_modes = []
-        for fm_data in data.get('failure_modes', []):
-            fm = InterfaceFailureMode(FailureMode.COMMUNICATION_FAILURE)
-            fm.from_dict(fm_data)
-            self.failure_modes.append(fm)
+        self.failure_modes = list(map(InterfaceFailureMode.from_dict_cls, data.get('failure_modes', [])))
 
         self.python_code = data.get('python_code', '')
         self.parameters = data.get('parameters', {})
@@ -933,29 +1172,21 @@ class Interface(BaseModel):
         state_machine_data = data.get('state_machine', {})
         self.state_machine_enabled = state_machine_data.get('enabled', True)
 
-        self.states = {}
-        for state_id, state_data in state_machine_data.get('states', {}).items():
-            state = InterfaceState()
-            state.from_dict(state_data)
-            self.states[state.id] = state
-
-        self.transitions = []
-        for transition_data in state_machine_data.get('transitions', []):
-            transition = InterfaceTransition('', '')
-            transition.from_dict(transition_data)
-            self.transitions.append(transition)
+        self.states = {state.id: state for state in
+                       map(InterfaceState.from_dict_cls, state_machine_data.get('states', {}).values())}
+        self._index_states_by_type()
+        self.transitions = list(map(InterfaceTransition.from_dict_cls, state_machine_data.get('transitions', [])))
 
         self.normal_state_id = state_machine_data.get('normal_state_id')
         self.current_state_id = state_machine_data.get('current_state_id')
         self.failure_state_map = state_machine_data.get('failure_state_map', {})
-        self.state_history = state_machine_data.get('state_history', [])
+        self.state_history = self._new_state_history(state_machine_data.get('state_history', []))
 
         if not self.states:
             self._initialize_default_state()
         else:
             if self.normal_state_id not in self.states:
-                self.normal_state_id = next((sid for sid, state in self.states.items()
-                                             if state.state_type == InterfaceStateType.NORMAL), None)
+                self.normal_state_id = self.first_state_of_type(InterfaceStateType.NORMAL)
             if not self.normal_state_id:
                 # 确保存在正常状态
                 self._initialize_default_state()
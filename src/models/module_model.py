@@ -7,14 +7,26 @@ Module Data Model
 """
 
 import copy
-from typing import Dict, Any, List, Optional
+import itertools
+import logging
+import uuid
+from types import CodeType, MappingProxyType
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 from enum import Enum
-try:
-    from .base_model import BaseModel, Point, ConnectionPoint
-    from .interface_model import Interface, InterfaceDirection
-except ImportError:
-    from base_model import BaseModel, Point, ConnectionPoint
-    from interface_model import Interface, InterfaceDirection
+from ._imports import (BaseModel, DictCacheMixin, Point, ConnectionPoint, _MISSING, _ev, compile_python_code,
+                       exec_globals, intern_str, log_code_error, numeric_kernel, serializable_fields)
+from .interface_model import Interface, InterfaceDirection
+
+logger = logging.getLogger(__name__)
+
+# 默认模块ID：进程内单调计数，前缀带本进程的随机标记，避免与已保存项目中的ID重复
+_MODULE_ID_PREFIX = f"module_{uuid.uuid4().hex[:8]}_"
+_MODULE_ID_COUNTER = itertools.count(1)
+
+# 共享的默认值常量（只读），构造与加载时不再各自新建
+_DEFAULT_SIZE = MappingProxyType({'x': 100, 'y': 60})
+_NO_POSITION = MappingProxyType({})
+_DEFAULT_OP_TEMP = (-40.0, 85.0)
 
 
 class ModuleType(Enum):
@@ -53,65 +65,152 @@ class ModuleTemplate(Enum):
     USER_ENVIRONMENT = "user_environment"
 
 
-class Module(BaseModel):
+# 枚举取值 -> 成员，反序列化时以字典查找代替 Enum(value) 调用
+_MODULE_TYPE_MAP = {member.value: member for member in ModuleType}
+_TEMPLATE_MAP = {member.value: member for member in ModuleTemplate}
+
+# 接口方向 <-> 兼容连接点的 connection_type（未列出的取值均视为双向）
+_CONNECTION_TYPE_BY_DIRECTION = {
+    InterfaceDirection.INPUT: 'input',
+    InterfaceDirection.OUTPUT: 'output',
+}
+_DIRECTION_BY_CONNECTION_TYPE = {
+    'input': InterfaceDirection.INPUT,
+    'output': InterfaceDirection.OUTPUT,
+}
+
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+
+def _fast_clone(value: Any) -> Any:
+    """深拷贝 JSON 风格的参数数据（dict/list/tuple 与标量），其他类型回退到 copy.deepcopy"""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: _fast_clone(item) for key, item in value.items()}
+    if value_type is list:
+        return [_fast_clone(item) for item in value]
+    if value_type in _ATOMIC_TYPES:
+        return value
+    if value_type is tuple:
+        return tuple(_fast_clone(item) for item in value)
+    return copy.deepcopy(value)
+
+
+class _CPView:
+    """connection_points 返回的轻量连接点，仅含兼容旧代码所需的字段"""
+
+    __slots__ = ('id', 'name', 'connection_type', 'direction', 'data_type', 'variables')
+
+
+class Module(DictCacheMixin, BaseModel):
     """模块基类"""
+
+    __slots__ = ('module_type', 'template', 'position', 'size', 'icon_path', 'interfaces', '_parameters',
+                 '_state_variables', 'python_code', 'is_template', 'failure_rate',
+                 '_compiled', '_code_src', '_exec_locals', '_id', '_dict_cache', '_cp_cache',
+                 'get_parameter', 'get_state_variable')
+    # module_type 取值 -> 模块类；声明了 _TYPE_KEY 的子类定义时自动注册
+    _REGISTRY: Dict[str, type] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        type_key = cls.__dict__.get('_TYPE_KEY')
+        if type_key is not None:
+            Module._REGISTRY[type_key.value] = cls
     
     def __init__(self, name: str = "", description: str = "", 
                  module_type: ModuleType = ModuleType.HARDWARE):
         super().__init__(name, description)
-        self.module_type = module_type
-        self.template = None  # 使用的模板类型
-        self.position = Point()  # 在图形界面中的位置
-        self.size = Point(100, 60)  # 模块大小
-        self.icon_path = ""  # 图标路径
-        self.interfaces = {}  # 接口字典，key为接口ID，value为Interface对象
-        self.parameters = {}  # 模块参数
-        self.state_variables = {}  # 状态变量
-        self.python_code = ""  # Python建模代码
-        self.is_template = False  # 是否为模板
-        self.id = f"module_{id(self)}"  # 确保每个模块都有唯一ID
+        self.module_type: ModuleType = module_type
+        self.template: Optional[ModuleTemplate] = None  # 使用的模板类型
+        self.position: Point = Point()  # 在图形界面中的位置
+        self.size: Point = Point.from_mapping(_DEFAULT_SIZE)  # 模块大小
+        self.icon_path: str = ""  # 图标路径
+        self.interfaces: Dict[str, Interface] = {}  # 接口字典，key为接口ID，value为Interface对象
+        self.parameters: Dict[str, Any] = {}  # 模块参数
+        self.state_variables: Dict[str, Any] = {}  # 状态变量
+        self.python_code: str = ""  # Python建模代码
+        self._compiled: Optional[CodeType] = None  # python_code 的编译结果，源码变化时重新编译
+        self._code_src: Optional[str] = None
+        self._exec_locals: Optional[Dict[str, Any]] = {}  # 执行 python_code 时复用的局部变量字典
+        self._cp_cache: Optional[List[_CPView]] = None  # connection_points 的缓存列表
+        self.is_template: bool = False  # 是否为模板
         # 可靠性与失效率（每小时λ）；用于故障树定量分析
         self.failure_rate: float = 0.0
         
+    def _assign_default_id(self):
+        # 默认ID在首次读取时生成，from_dict 覆盖ID时不必先格式化一个用不到的字符串
+        self._id = None
+
+    @property
+    def id(self) -> str:
+        """模块ID"""
+        if self._id is None:
+            self._id = f"{_MODULE_ID_PREFIX}{next(_MODULE_ID_COUNTER)}"  # 确保每个模块都有唯一ID
+        return self._id
+
+    @id.setter
+    def id(self, value: str):
+        self._id = value
+
+    @property
+    def parameters(self) -> Dict[str, Any]:
+        """模块参数"""
+        return self._parameters
+
+    @parameters.setter
+    def parameters(self, value: Dict[str, Any]):
+        self._parameters = value
+        # get_parameter(key, default=None) 直接绑定为字典的 get，省去一层方法调用；替换字典时随之重新绑定
+        self.get_parameter = value.get
+
+    @property
+    def state_variables(self) -> Dict[str, Any]:
+        """状态变量"""
+        return self._state_variables
+
+    @state_variables.setter
+    def state_variables(self, value: Dict[str, Any]):
+        self._state_variables = value
+        self.get_state_variable = value.get  # 同 get_parameter
+
+    def clone(self) -> 'Module':
+        """克隆模块；from_dict 直接采用传入的字典，参数与状态变量在此各拷贝一次"""
+        cloned = super().clone()
+        cloned.parameters = _fast_clone(self._parameters)
+        cloned.state_variables = _fast_clone(self._state_variables)
+        return cloned
+
     @property
     def connection_points(self):
-        """兼容性属性：返回接口列表（用于向后兼容）"""
-        # 创建临时的ConnectionPoint对象列表
-        from .base_model import ConnectionPoint
-        points = []
-        for interface in self.interfaces.values():
-            cp = ConnectionPoint()
+        """兼容性属性：返回接口列表（用于向后兼容）
+
+        连接点对象在接口集合不变时复用，每次访问只就地刷新字段；
+        接口被增删、替换或 interfaces 被整体重新赋值时重建。
+        """
+        interfaces = self.interfaces
+        points = self._cp_cache
+        if points is None or len(points) != len(interfaces) or any(
+                cp.id != interface.id for cp, interface in zip(points, interfaces.values())):
+            points = [_CPView() for _ in range(len(interfaces))]
+            self._cp_cache = points
+        for cp, interface in zip(points, interfaces.values()):
             cp.id = interface.id
             cp.name = interface.name
             # 映射direction到connection_type
-            if interface.direction == InterfaceDirection.INPUT:
-                cp.connection_type = 'input'
-                cp.direction = 'input'
-            elif interface.direction == InterfaceDirection.OUTPUT:
-                cp.connection_type = 'output'
-                cp.direction = 'output'
-            else:
-                cp.connection_type = 'bidirectional'
-                cp.direction = 'bidirectional'
+            cp.connection_type = cp.direction = _CONNECTION_TYPE_BY_DIRECTION.get(interface.direction, 'bidirectional')
             cp.data_type = interface.data_format or 'signal'
             cp.variables = interface.parameters.get('linked_variables', [])
-            points.append(cp)
         return points
 
     def add_connection_point(self, connection_point: ConnectionPoint) -> Interface:
         """兼容旧接口：根据连接点创建接口并添加到模块"""
         direction_value = getattr(connection_point, 'direction', connection_point.connection_type)
-        direction_mapping = {
-            'input': InterfaceDirection.INPUT,
-            'output': InterfaceDirection.OUTPUT,
-            'bidirectional': InterfaceDirection.BIDIRECTIONAL,
-            None: InterfaceDirection.BIDIRECTIONAL
-        }
-        direction = direction_mapping.get(direction_value, InterfaceDirection.BIDIRECTIONAL)
+        direction = _DIRECTION_BY_CONNECTION_TYPE.get(direction_value, InterfaceDirection.BIDIRECTIONAL)
 
         interface = Interface(connection_point.name, f"由连接点 {connection_point.name} 实例化", direction=direction)
         interface.data_format = connection_point.data_type
-        interface.parameters = copy.deepcopy(getattr(connection_point, 'parameters', {}))
+        interface.parameters = _fast_clone(getattr(connection_point, 'parameters', {}))
         interface.parameters['legacy_connection_point'] = connection_point.to_dict()
         interface.parameters.setdefault('linked_variables', connection_point.variables)
 
@@ -148,75 +247,105 @@ class Module(BaseModel):
         self.parameters[key] = value
         self.update_modified_time()
     
-    def get_parameter(self, key: str, default_value: Any = None) -> Any:
-        """获取参数"""
-        return self.parameters.get(key, default_value)
-    
     def set_state_variable(self, key: str, value: Any):
         """设置状态变量"""
         self.state_variables[key] = value
         self.update_modified_time()
     
-    def get_state_variable(self, key: str, default_value: Any = None) -> Any:
-        """获取状态变量"""
-        return self.state_variables.get(key, default_value)
-    
     def execute_python_code(self, inputs: Dict[str, Any] = None) -> Dict[str, Any]:
         """执行Python建模代码"""
         if not self.python_code:
             return {}
-        
-        # 准备执行环境
-        local_vars = {
-            'inputs': inputs or {},
-            'parameters': self.parameters,
-            'state_variables': self.state_variables,
-            'outputs': {}
-        }
-        
+
+        # 纯数值代码走改写后的函数，输入或参数不满足时回退到 exec
+        kernel = numeric_kernel(self.python_code)
+        if kernel is not None:
+            numeric_outputs = kernel.run(inputs or {}, self._parameters)
+            if numeric_outputs is not None:
+                return numeric_outputs
+
+        # 准备执行环境：复用局部变量字典，使用期间从实例上取下，重入调用时退化为新建字典
+        local_vars = self._exec_locals
+        self._exec_locals = None
+        if local_vars is None:
+            local_vars = {}
+        local_vars['inputs'] = inputs or {}
+        local_vars['parameters'] = self.parameters
+        local_vars['state_variables'] = self.state_variables
+        local_vars['outputs'] = {}
+
         try:
-            # 执行用户定义的Python代码
-            exec(self.python_code, {}, local_vars)
+            # 执行用户定义的Python代码（源码未变时复用编译结果）
+            if self._code_src is not self.python_code:
+                self._compiled = compile_python_code(self.python_code, '<module>')
+                self._code_src = self.python_code
+            exec(self._compiled, exec_globals(self._compiled), local_vars)
             return local_vars.get('outputs', {})
-        except Exception as e:
-            print(f"执行模块 {self.name} 的Python代码时出错: {e}")
+        except Exception:
+            log_code_error(logger, self.python_code, "执行模块 %s 的Python代码时出错", self.name)
             return {}
+        finally:
+            local_vars.clear()
+            self._exec_locals = local_vars
     
+    def execute_python_code_batch(self, inputs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """对多组输入批量执行纯数值建模代码
+
+        ``inputs`` 为输入名到等长一维数组的映射，返回输出名到一维数组的映射；
+        代码不是纯数值运算或不读取输入时返回 None，调用方应逐组调用 execute_python_code。
+        代码含 ``# @njit`` 注释或参数 ``numba`` 为真，且安装了 Numba 时以 JIT 编译的循环执行，
+        否则以 NumPy 向量化执行。
+        """
+        kernel = numeric_kernel(self.python_code) if self.python_code else None
+        if kernel is None or not kernel.input_names:
+            return None
+
+        import numpy as np
+
+        matrix = np.column_stack([np.asarray(inputs[name], dtype=np.float64) for name in kernel.input_names])
+        parameters = self._parameters
+        use_numba = kernel.prefers_numba or bool(parameters.get('numba', False))
+        return kernel.run_batch(matrix, parameters, use_numba=use_numba)
+
     def to_dict(self) -> Dict[str, Any]:
-        base_dict = super().to_dict()
-        # 序列化接口字典
-        interfaces_data = {}
-        for interface_id, interface in self.interfaces.items():
-            interfaces_data[interface_id] = interface.to_dict()
-            
-        base_dict.update({
-            'module_type': self.module_type.value if hasattr(self.module_type, 'value') else self.module_type,
-            'template': self.template.value if self.template and hasattr(self.template, 'value') else self.template,
-            'position': self.position.to_dict() if hasattr(self.position, 'to_dict') else self.position,
-            'size': self.size.to_dict() if hasattr(self.size, 'to_dict') else self.size,
-            'icon_path': self.icon_path,
-            'interfaces': interfaces_data,
-            'parameters': self.parameters,
-            'state_variables': self.state_variables,
-            'python_code': self.python_code,
-            'is_template': self.is_template,
-            'failure_rate': self.failure_rate
-        })
+        cached = self._dict_cache
+        if cached is None:
+            # 直接写入父类返回的字典；module_type 恒为枚举成员。
+            # 位置、尺寸可能被原地修改，与接口一样每次重新生成（先占位保持键顺序）
+            cached = super().to_dict()
+            cached['module_type'] = self.module_type.value
+            cached['template'] = _ev(self.template)
+            cached['position'] = None
+            cached['size'] = None
+            cached['icon_path'] = self.icon_path
+            cached['interfaces'] = None
+            cached['parameters'] = self._parameters
+            cached['state_variables'] = self._state_variables
+            cached['python_code'] = self.python_code
+            cached['is_template'] = self.is_template
+            cached['failure_rate'] = self.failure_rate
+            self._dict_cache = cached
+        base_dict = dict(cached)
+        base_dict['position'] = self.position.to_dict()
+        base_dict['size'] = self.size.to_dict()
+        base_dict['interfaces'] = {interface_id: interface.to_dict()
+                                   for interface_id, interface in self.interfaces.items()}
         return base_dict
     
+    @staticmethod
+    def to_dict_many(modules: Iterable['Module']) -> List[Dict[str, Any]]:
+        """批量序列化模块；未修改的模块复用缓存的字段字典，结果可一次交给序列化器编码"""
+        return [module.to_dict() for module in modules]
+
     def from_dict(self, data: Dict[str, Any]):
         super().from_dict(data)
-        self.module_type = ModuleType(data.get('module_type', ModuleType.HARDWARE.value))
-        template_value = data.get('template')
-        self.template = ModuleTemplate(template_value) if template_value else None
-        
-        self.position = Point()
-        self.position.from_dict(data.get('position', {}))
+        self.module_type = _MODULE_TYPE_MAP.get(data.get('module_type'), ModuleType.HARDWARE)
+        self.template = _TEMPLATE_MAP.get(data.get('template'))
         
-        self.size = Point()
-        self.size.from_dict(data.get('size', {'x': 100, 'y': 60}))
+        self.position = Point.from_mapping(data.get('position', _NO_POSITION))
+        self.size = Point.from_mapping(data.get('size', _DEFAULT_SIZE))
         
-        self.icon_path = data.get('icon_path', '')
+        self.icon_path = intern_str(data.get('icon_path', ''))
         
         # 加载接口
         self.interfaces = {}
@@ -230,127 +359,127 @@ class Module(BaseModel):
                 interface.name = cp_data.get('name', '未命名接口')
                 interface.description = f"从连接点转换: {interface.name}"
                 # 映射connection_type到direction
-                connection_type = cp_data.get('connection_type', 'input')
-                if connection_type == 'input':
-                    interface.direction = InterfaceDirection.INPUT
-                elif connection_type == 'output':
-                    interface.direction = InterfaceDirection.OUTPUT
-                else:
-                    interface.direction = InterfaceDirection.BIDIRECTIONAL
+                interface.direction = _DIRECTION_BY_CONNECTION_TYPE.get(
+                    cp_data.get('connection_type', 'input'), InterfaceDirection.BIDIRECTIONAL)
                 
                 interface.data_format = cp_data.get('data_type', 'signal')
                 self.interfaces[interface.id] = interface
         else:
             # 加载新格式的interfaces
-            for interface_id, interface_data in interfaces_data.items():
-                interface = Interface()
-                interface.from_dict(interface_data)
-                self.interfaces[interface_id] = interface
+            self.interfaces = {interface_id: Interface.from_dict_cls(interface_data)
+                               for interface_id, interface_data in interfaces_data.items()}
         
-        self.parameters = data.get('parameters', {})
-        self.state_variables = data.get('state_variables', {})
+        value = data.get('parameters', _MISSING)
+        self.parameters = {} if value is _MISSING else value
+        value = data.get('state_variables', _MISSING)
+        self.state_variables = {} if value is _MISSING else value
         self.python_code = data.get('python_code', '')
         self.is_template = data.get('is_template', False)
         self.failure_rate = data.get('failure_rate', 0.0)
 
 
+@serializable_fields
 class HardwareModule(Module):
     """硬件模块"""
+
+    __slots__ = ('manufacturer', 'model', 'specifications', 'power_consumption', 'op_temp_min', 'op_temp_max',
+                 'reliability_data')
+    _TYPE_KEY = ModuleType.HARDWARE
+    # 序列化字段：(属性名, 默认值[, 转换函数])
+    _FIELDS = (
+        ('manufacturer', '', intern_str),
+        ('model', '', intern_str),
+        ('specifications', {}),
+        ('power_consumption', 0.0),
+        ('operating_temperature', _DEFAULT_OP_TEMP),
+        ('reliability_data', {}),
+    )
     
     def __init__(self, name: str = "", description: str = ""):
         super().__init__(name, description, ModuleType.HARDWARE)
-        self.manufacturer = ""  # 制造商
-        self.model = ""  # 型号
-        self.specifications = {}  # 技术规格
-        self.power_consumption = 0.0  # 功耗
-        self.operating_temperature = (-40, 85)  # 工作温度范围
-        self.reliability_data = {}  # 可靠性数据
-    
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = super().to_dict()
-        base_dict.update({
-            'manufacturer': self.manufacturer,
-            'model': self.model,
-            'specifications': self.specifications,
-            'power_consumption': self.power_consumption,
-            'operating_temperature': self.operating_temperature,
-            'reliability_data': self.reliability_data
-        })
-        return base_dict
-    
-    def from_dict(self, data: Dict[str, Any]):
-        super().from_dict(data)
-        self.manufacturer = data.get('manufacturer', '')
-        self.model = data.get('model', '')
-        self.specifications = data.get('specifications', {})
-        self.power_consumption = data.get('power_consumption', 0.0)
-        self.operating_temperature = data.get('operating_temperature', (-40, 85))
-        self.reliability_data = data.get('reliability_data', {})
+        self.manufacturer: str = ""  # 制造商
+        self.model: str = ""  # 型号
+        self.specifications: Dict[str, Any] = {}  # 技术规格
+        self.power_consumption: float = 0.0  # 功耗
+        self.op_temp_min: float = _DEFAULT_OP_TEMP[0]  # 最低工作温度
+        self.op_temp_max: float = _DEFAULT_OP_TEMP[1]  # 最高工作温度
+        self.reliability_data: Dict[str, Any] = {}  # 可靠性数据
+
+    @property
+    def operating_temperature(self) -> Tuple[float, float]:
+        """工作温度范围 (最低, 最高)，兼容原元组字段；序列化时仍写入 operating_temperature"""
+        return (self.op_temp_min, self.op_temp_max)
+
+    @operating_temperature.setter
+    def operating_temperature(self, value):
+        try:
+            low, high = value
+            low, high = float(low), float(high)
+        except (TypeError, ValueError):
+            # 无效值（null、"-40~85"、含 null 的列表等）不应使整个项目加载失败
+            logger.warning("模块 %s 的工作温度范围无效: %r，使用默认值 %s", self.name, value, _DEFAULT_OP_TEMP)
+            low, high = _DEFAULT_OP_TEMP
+        self.op_temp_min = low
+        self.op_temp_max = high
 
 
+@serializable_fields
 class SoftwareModule(Module):
     """软件模块"""
+
+    __slots__ = ('software_version', 'programming_language', 'dependencies', 'memory_usage', 'cpu_usage',
+                 'execution_time')
+    _TYPE_KEY = ModuleType.SOFTWARE
+    # 序列化字段：(属性名, 默认值[, 转换函数])
+    _FIELDS = (
+        ('software_version', '1.0'),
+        ('programming_language', 'Python', intern_str),
+        ('dependencies', []),
+        ('memory_usage', 0),
+        ('cpu_usage', 0.0),
+        ('execution_time', 0.0),
+    )
     
     def __init__(self, name: str = "", description: str = ""):
         super().__init__(name, description, ModuleType.SOFTWARE)
-        self.software_version = "1.0"  # 软件版本
-        self.programming_language = "Python"  # 编程语言
-        self.dependencies = []  # 依赖项
-        self.memory_usage = 0  # 内存使用量(MB)
-        self.cpu_usage = 0.0  # CPU使用率(%)
-        self.execution_time = 0.0  # 执行时间(ms)
+        self.software_version: str = "1.0"  # 软件版本
+        self.programming_language: str = "Python"  # 编程语言
+        self.dependencies: List[str] = []  # 依赖项
+        self.memory_usage: int = 0  # 内存使用量(MB)
+        self.cpu_usage: float = 0.0  # CPU使用率(%)
+        self.execution_time: float = 0.0  # 执行时间(ms)
     
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = super().to_dict()
-        base_dict.update({
-            'software_version': self.software_version,
-            'programming_language': self.programming_language,
-            'dependencies': self.dependencies,
-            'memory_usage': self.memory_usage,
-            'cpu_usage': self.cpu_usage,
-            'execution_time': self.execution_time
-        })
-        return base_dict
-    
-    def from_dict(self, data: Dict[str, Any]):
-        super().from_dict(data)
-        self.software_version = data.get('software_version', '1.0')
-        self.programming_language = data.get('programming_language', 'Python')
-        self.dependencies = data.get('dependencies', [])
-        self.memory_usage = data.get('memory_usage', 0)
-        self.cpu_usage = data.get('cpu_usage', 0.0)
-        self.execution_time = data.get('execution_time', 0.0)
 
 
+@serializable_fields
 class AlgorithmModule(Module):
     """算法模块"""
+
+    __slots__ = ('algorithm_type', 'complexity', 'accuracy', 'performance_metrics', 'training_data',
+                 'model_parameters')
+    _TYPE_KEY = ModuleType.ALGORITHM
+    # 序列化字段：(属性名, 默认值[, 转换函数])
+    _FIELDS = (
+        ('algorithm_type', ''),
+        ('complexity', ''),
+        ('accuracy', 0.0),
+        ('performance_metrics', {}),
+        ('training_data', ''),
+        ('model_parameters', {}),
+    )
     
     def __init__(self, name: str = "", description: str = ""):
         super().__init__(name, description, ModuleType.ALGORITHM)
-        self.algorithm_type = ""  # 算法类型
-        self.complexity = ""  # 算法复杂度
-        self.accuracy = 0.0  # 准确率
-        self.performance_metrics = {}  # 性能指标
-        self.training_data = ""  # 训练数据描述
-        self.model_parameters = {}  # 模型参数
+        self.algorithm_type: str = ""  # 算法类型
+        self.complexity: str = ""  # 算法复杂度
+        self.accuracy: float = 0.0  # 准确率
+        self.performance_metrics: Dict[str, Any] = {}  # 性能指标
+        self.training_data: str = ""  # 训练数据描述
+        self.model_parameters: Dict[str, Any] = {}  # 模型参数
     
-    def to_dict(self) -> Dict[str, Any]:
-        base_dict = super().to_dict()
-        base_dict.update({
-            'algorithm_type': self.algorithm_type,
-            'complexity': self.complexity,
-            'accuracy': self.accuracy,
-            'performance_metrics': self.performance_metrics,
-            'training_data': self.training_data,
-            'model_parameters': self.model_parameters
-        })
-        return base_dict
-    
-    def from_dict(self, data: Dict[str, Any]):
-        super().from_dict(data)
-        self.algorithm_type = data.get('algorithm_type', '')
-        self.complexity = data.get('complexity', '')
-        self.accuracy = data.get('accuracy', 0.0)
-        self.performance_metrics = data.get('performance_metrics', {})
-        self.training_data = data.get('training_data', '')
-        self.model_parameters = data.get('model_parameters', {})
+
+
+def load_module(data: Dict[str, Any]) -> Module:
+    """按 module_type 分派到已注册的模块类并加载；未注册的类型使用 Module"""
+    module_cls = Module._REGISTRY.get(data.get('module_type', ModuleType.HARDWARE.value), Module)
+    return module_cls.from_dict_cls(data)
@@ -6,28 +6,26 @@ System Data Model
 定义智能系统结构、任务剖面、环境模型等数据结构
 """
 
+import itertools
+import logging
+import operator
+import uuid
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
-try:
-    from .base_model import BaseModel, Point
-    from .module_model import Module
-    from .interface_model import Interface
-    from .task_profile_model import TaskProfile as DetailedTaskProfile
-    from .environment_model import (
-        EnvironmentType as DetailedEnvironmentType,
-        StressFactor as DetailedStressFactor,
-        StressType as DetailedStressType,
-    )
-except ImportError:
-    from base_model import BaseModel, Point
-    from module_model import Module
-    from interface_model import Interface
-    from task_profile_model import TaskProfile as DetailedTaskProfile
-    from environment_model import (
-        EnvironmentType as DetailedEnvironmentType,
-        StressFactor as DetailedStressFactor,
-        StressType as DetailedStressType,
-    )
+from ._imports import BaseModel, CodeRunner, Point, intern_str, log_code_error, reset_code_error_counts
+from ._criteria_kernel import CriteriaArrays
+from .module_model import Module, load_module
+from .interface_model import Interface
+from .task_profile_model import TaskProfile as DetailedTaskProfile
+from .environment_model import (
+    EnvironmentType as DetailedEnvironmentType,
+    StressFactor as DetailedStressFactor,
+    StressType as DetailedStressType,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class TaskStatus(Enum):
@@ -38,8 +36,87 @@ class TaskStatus(Enum):
     UNKNOWN = "unknown"
 
 
+# 阈值判据的比较操作符 -> 比较函数；未知操作符判定为不满足
+_OPS = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+
+def _unknown_op(actual_value: Any, threshold_value: Any) -> bool:
+    return False
+
+
+# 用户代码包装为函数时的参数（依次对应 exec 执行时预置的局部变量）
+_CRITERIA_CODE_ARGS = ('system_state', 'target_module_id', 'target_parameter', 'threshold_value', 'result')
+_ENVIRONMENT_CODE_ARGS = ('system_state', 'modified_state', 'current_time', 'parameters', 'stress_factors',
+                          'affected_modules')
+
+# 序列化子对象字典：dict(zip(keys, map(_TO_DICT, values))) 在 C 层循环中调用各对象的 to_dict
+_TO_DICT = operator.methodcaller('to_dict')
+
+
+def _to_dict_map(objects: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    return dict(zip(objects, map(_TO_DICT, objects.values())))
+
+
+# 判据修订号：公开属性每次赋值都取一个新值，任务剖面据此判断打包的判据是否过期
+_REVISIONS = itertools.count()
+_revision_of = operator.attrgetter('_revision')
+
+
+class _CriteriaPlan:
+    """由判据列表派生、在判据变化前可复用的评估数据"""
+
+    __slots__ = ('key', 'total_weight', 'disabled_weight', 'enabled_count', 'arrays', 'threshold_groups',
+                 'scripted', 'by_weight', 'remaining_weights', 'deterministic')
+
+    def __init__(self, key: tuple, criteria: List['SuccessCriteria']):
+        self.key = key  # 各判据的修订号
+        self.total_weight = sum(c.weight for c in criteria if c.enabled)
+        self.disabled_weight = sum(c.weight for c in criteria if not c.enabled)  # 停用的判据视为满足
+        enabled = [c for c in criteria if c.enabled]
+        self.enabled_count = len(enabled)
+        self.arrays = CriteriaArrays.build(criteria, _OPS)
+        # 阈值判据按目标模块分组：[(模块ID, [(参数名, 比较函数, 阈值, 权重), ...]), ...]，每个模块状态只取一次
+        groups: Dict[str, list] = {}
+        for c in enabled:
+            if not c.python_code:
+                groups.setdefault(c.target_module_id, []).append(
+                    (c.target_parameter, c._op_func, c.threshold_value, c.weight))
+        self.threshold_groups = list(groups.items())
+        self.scripted = [c for c in enabled if c.python_code]
+        # 启用的判据都不含自定义代码时，评估结果只取决于系统状态，可以缓存
+        self.deterministic = not self.scripted
+        # 启用的判据按权重从大到小排列，以及评估到每个判据之后剩余的权重
+        self.by_weight = sorted(enabled, key=lambda c: c.weight, reverse=True)
+        remaining, self.remaining_weights = 0.0, []
+        for c in reversed(self.by_weight):
+            self.remaining_weights.append(remaining)
+            remaining += c.weight
+        self.remaining_weights.reverse()
+
+
+def _status_for(success_rate: float) -> 'TaskStatus':
+    """成功率所在区间对应的任务状态"""
+    if success_rate >= 1.0:
+        return TaskStatus.SUCCESS
+    if success_rate >= 0.5:
+        return TaskStatus.PARTIAL_SUCCESS
+    return TaskStatus.FAILURE
+
+
 class SuccessCriteria:
     """成功判据"""
+
+    __slots__ = ('name', 'criteria_type', 'target_module_id', 'target_parameter', 'threshold_value',
+                 '_comparison_operator', '_op_func', 'python_code', 'weight', 'enabled',
+                 '_code', '_revision',
+                 '__dict__')  # 保留 __dict__：旧版任务剖面字段（module_id 等）可按需附加
     
     def __init__(self, name: str = "", criteria_type: str = "threshold"):
         self.name = name
@@ -47,10 +124,25 @@ class SuccessCriteria:
         self.target_module_id = ""  # 目标模块ID
         self.target_parameter = ""  # 目标参数名
         self.threshold_value = 0.0  # 阈值
-        self.comparison_operator = ">="  # 比较操作符
+        self.comparison_operator = ">="  # 比较操作符（赋值时解析出比较函数）
         self.python_code = ""  # 自定义判据代码
         self.weight = 1.0  # 权重
         self.enabled = True
+        self._code = CodeRunner(_CRITERIA_CODE_ARGS, 'result', '<criteria>')
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_revision', next(_REVISIONS))
+
+    @property
+    def comparison_operator(self) -> str:
+        return self._comparison_operator
+
+    @comparison_operator.setter
+    def comparison_operator(self, value: str):
+        self._comparison_operator = value
+        self._op_func = _OPS.get(value, _unknown_op)
     
     def evaluate(self, system_state: Dict[str, Any]) -> bool:
         """评估成功判据"""
@@ -59,37 +151,16 @@ class SuccessCriteria:
         
         if self.python_code:
             try:
-                local_vars = {
-                    'system_state': system_state,
-                    'target_module_id': self.target_module_id,
-                    'target_parameter': self.target_parameter,
-                    'threshold_value': self.threshold_value,
-                    'result': False
-                }
-                exec(self.python_code, {}, local_vars)
-                return local_vars.get('result', False)
-            except Exception as e:
-                print(f"评估成功判据 {self.name} 时出错: {e}")
+                return self._code.run(self.python_code, system_state, self.target_module_id,
+                                      self.target_parameter, self.threshold_value, False)
+            except Exception:
+                log_code_error(logger, self.python_code, "评估成功判据 %s 时出错", self.name)
                 return False
         
         # 默认阈值比较
         module_state = system_state.get(self.target_module_id, {})
         actual_value = module_state.get(self.target_parameter, 0)
-        
-        if self.comparison_operator == ">=":
-            return actual_value >= self.threshold_value
-        elif self.comparison_operator == "<=":
-            return actual_value <= self.threshold_value
-        elif self.comparison_operator == "==":
-            return actual_value == self.threshold_value
-        elif self.comparison_operator == "!=":
-            return actual_value != self.threshold_value
-        elif self.comparison_operator == ">":
-            return actual_value > self.threshold_value
-        elif self.comparison_operator == "<":
-            return actual_value < self.threshold_value
-        
-        return False
+        return self._op_func(actual_value, self.threshold_value)
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -107,8 +178,9 @@ class SuccessCriteria:
     def from_dict(self, data: Dict[str, Any]):
         self.name = data.get('name', '')
         self.criteria_type = data.get('criteria_type', 'threshold')
-        self.target_module_id = data.get('target_module_id', '')
-        self.target_parameter = data.get('target_parameter', '')
+        # 模块ID、参数名驻留后与状态字典中的键为同一对象，评估时字典查找可走指针比较
+        self.target_module_id = intern_str(data.get('target_module_id', ''))
+        self.target_parameter = intern_str(data.get('target_parameter', ''))
         self.threshold_value = data.get('threshold_value', 0.0)
         self.comparison_operator = data.get('comparison_operator', '>=')
         self.python_code = data.get('python_code', '')
@@ -129,6 +201,9 @@ class TaskProfile(BaseModel):
         self.expected_outputs = {}  # 期望输出
         self.fault_tree_analysis_results = {}  # 故障树分析结果
         self.analysis_completed = False  # 是否已完成分析
+        self._criteria_plan: Optional[_CriteriaPlan] = None
+        # 最近一次按 state_version 评估的 (状态版本, 判据评估数据, 结果)
+        self._last_evaluation: Optional[Tuple[Any, _CriteriaPlan, Tuple[TaskStatus, float]]] = None
     
     def add_success_criteria(self, criteria: SuccessCriteria):
         """添加成功判据"""
@@ -140,28 +215,95 @@ class TaskProfile(BaseModel):
         self.success_criteria = [c for c in self.success_criteria if c.name != criteria_name]
         self.update_modified_time()
     
-    def evaluate_task_success(self, system_state: Dict[str, Any]) -> Tuple[TaskStatus, float]:
-        """评估任务成功状态"""
+    def evaluate_task_success(self, system_state: Dict[str, Any],
+                              state_version: Optional[Any] = None) -> Tuple[TaskStatus, float]:
+        """评估任务成功状态
+
+        ``state_version`` 由调用方给出（如仿真步号），系统状态每次变化时都应改变；
+        给出时，对相同版本的重复评估直接返回上次的结果（判据含自定义代码时不缓存）。
+        不给出时每次都重新评估。
+        """
         if not self.success_criteria:
             return TaskStatus.UNKNOWN, 0.0
         
-        total_weight = sum(c.weight for c in self.success_criteria if c.enabled)
+        plan = self._current_criteria_plan()
+        if state_version is None:
+            return self._evaluate_with_plan(plan, system_state)
+        last = self._last_evaluation
+        if last is not None and last[0] == state_version and last[1] is plan:
+            return last[2]
+        result = self._evaluate_with_plan(plan, system_state)
+        self._last_evaluation = (state_version, plan, result) if plan.deterministic else None
+        return result
+
+    def invalidate_cache(self):
+        """丢弃按 state_version 缓存的评估结果"""
+        self._last_evaluation = None
+
+    def _evaluate_with_plan(self, plan: _CriteriaPlan, system_state: Dict[str, Any]) -> Tuple[TaskStatus, float]:
+        total_weight = plan.total_weight
         if total_weight == 0:
             return TaskStatus.UNKNOWN, 0.0
         
-        success_weight = 0.0
-        for criteria in self.success_criteria:
-            if criteria.evaluate(system_state):
-                success_weight += criteria.weight
+        arrays = plan.arrays
+        success_weight = arrays.success_weight(system_state) if arrays is not None else None
+        if success_weight is None:
+            success_weight = plan.disabled_weight
+            hits = 0
+            empty: Dict[str, Any] = {}
+            for module_id, group in plan.threshold_groups:
+                module_state = system_state.get(module_id, empty)
+                for parameter, compare, threshold, weight in group:
+                    if compare(module_state.get(parameter, 0), threshold):
+                        success_weight += weight
+                        hits += 1
+            for criteria in plan.scripted:
+                if criteria.evaluate(system_state):
+                    success_weight += criteria.weight
+                    hits += 1
+            if hits == plan.enabled_count:
+                # 全部满足时直接使用合计权重，保证成功率不因求和顺序偏离 1.0
+                success_weight = total_weight + plan.disabled_weight
         
         success_rate = success_weight / total_weight
-        
-        if success_rate >= 1.0:
-            return TaskStatus.SUCCESS, success_rate
-        elif success_rate >= 0.5:
-            return TaskStatus.PARTIAL_SUCCESS, success_rate
-        else:
-            return TaskStatus.FAILURE, success_rate
+        return _status_for(success_rate), success_rate
+
+    def evaluate_task_status(self, system_state: Dict[str, Any]) -> TaskStatus:
+        """只评估任务成功状态，结果与 evaluate_task_success 的状态一致
+
+        判据按权重从大到小评估，剩余判据无论是否满足都不会改变状态时提前结束，
+        适合只需要状态、且含较慢的自定义代码判据的场合。
+        """
+        if not self.success_criteria:
+            return TaskStatus.UNKNOWN
+        plan = self._current_criteria_plan()
+        total_weight = plan.total_weight
+        if total_weight == 0:
+            return TaskStatus.UNKNOWN
+        if plan.arrays is not None:
+            return self.evaluate_task_success(system_state)[0]
+
+        success_weight = plan.disabled_weight
+        failed = False
+        for criteria, remaining in zip(plan.by_weight, plan.remaining_weights):
+            if criteria.evaluate(system_state):
+                success_weight += criteria.weight
+            else:
+                failed = True
+            # 在出现不满足的判据之前，剩余判据全部满足即为成功，状态尚未确定
+            if failed:
+                status = _status_for(success_weight / total_weight)
+                if status is _status_for((success_weight + remaining) / total_weight):
+                    return status
+        return TaskStatus.SUCCESS
+    
+    def _current_criteria_plan(self) -> _CriteriaPlan:
+        """判据评估数据（启用权重合计、打包的阈值判据）；判据列表或任一判据的属性变化后重新生成"""
+        key = tuple(map(_revision_of, self.success_criteria))
+        plan = self._criteria_plan
+        if plan is None or plan.key != key:
+            plan = self._criteria_plan = _CriteriaPlan(key, self.success_criteria)
+        return plan
     
     def to_dict(self) -> Dict[str, Any]:
         base_dict = super().to_dict()
@@ -198,16 +340,18 @@ class TaskProfile(BaseModel):
 
 class Connection:
     """模块间连接"""
+
+    __slots__ = ('id', 'source_module_id', 'target_module_id', 'source_point_id', 'target_point_id',
+                 'interface_id', 'connection_points', 'enabled', 'line_style', 'orthogonal_orientation',
+                 'orthogonal_ratio', '__dict__')  # 保留 __dict__：界面与演示数据会附加名称等字段
     
     def __init__(self, id: str = "", source_module_id: str = "", target_module_id: str = "",
                  source_point_id: str = "", target_point_id: str = "",
                  line_style: str = "curved",
                  orthogonal_orientation: Optional[str] = None,
                  orthogonal_ratio: Optional[float] = None):
-        if id:
-            self.id = id
-        else:
-            self.id = f"{source_module_id}_{source_point_id}_{target_module_id}_{target_point_id}"
+        # 未指定ID时随机生成；由端点ID拼接的字符串在ID本身含下划线时可能重复
+        self.id = id or uuid.uuid4().hex
         self.source_module_id = source_module_id
         self.target_module_id = target_module_id
         self.source_point_id = source_point_id
@@ -234,20 +378,23 @@ class Connection:
             'orthogonal_ratio': self.orthogonal_ratio
         }
     
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'Connection':
+        """由字典构造连接；from_dict 会写入全部字段，因此跳过 __init__ 中的ID生成"""
+        connection = cls.__new__(cls)
+        connection.from_dict(data)
+        return connection
+    
     def from_dict(self, data: Dict[str, Any]):
         self.id = data.get('id', '')
-        self.source_module_id = data.get('source_module_id', '')
-        self.target_module_id = data.get('target_module_id', '')
+        self.source_module_id = intern_str(data.get('source_module_id', ''))
+        self.target_module_id = intern_str(data.get('target_module_id', ''))
         self.source_point_id = data.get('source_point_id', '')
         self.target_point_id = data.get('target_point_id', '')
         self.interface_id = data.get('interface_id', '')
         
         # 加载连线控制点
-        self.connection_points = []
-        for cp_data in data.get('connection_points', []):
-            cp = Point()
-            cp.from_dict(cp_data)
-            self.connection_points.append(cp)
+        self.connection_points = list(map(Point.from_mapping, data.get('connection_points', [])))
 
         self.enabled = data.get('enabled', True)
         self.line_style = data.get('line_style', 'curved')
@@ -271,13 +418,20 @@ class EnvironmentModel(BaseModel):
         self.affected_modules: List[str] = []
         self.enabled: bool = True
         self.custom_environment_type: Optional[str] = None
+        self._code = CodeRunner(_ENVIRONMENT_CODE_ARGS, 'modified_state', '<environment>')
 
     def apply_stress(self, system_state: Dict[str, Any], current_time: float = 0.0) -> Dict[str, Any]:
-        """施加环境应力"""
+        """施加环境应力
+
+        写时复制：外层字典在第一次写入时才复制，每个受影响模块的状态字典只复制一次，
+        同一模块上的多个应力因子写入同一副本；传入的 system_state 不会被修改。
+        没有可施加的应力且没有自定义代码时与停用时一样，原样返回 system_state。
+        """
         if not self.enabled:
             return system_state
 
-        modified_state = system_state.copy()
+        modified_state = system_state
+        copied_modules: set = set()  # 已在 modified_state 中换成副本的模块ID
         stress_values: Dict[str, float] = {}
 
         for stress_factor in self.stress_factors:
@@ -286,8 +440,8 @@ class EnvironmentModel(BaseModel):
 
             try:
                 stress_value = stress_factor.generate_stress_value(current_time)
-            except Exception as exc:
-                print(f"计算环境应力 {stress_factor.name} 时出错: {exc}")
+            except Exception:
+                logger.warning("计算环境应力 %s 时出错", stress_factor.name, exc_info=True)
                 continue
 
             stress_values[stress_factor.name] = stress_value
@@ -297,7 +451,14 @@ class EnvironmentModel(BaseModel):
                 if module_id not in modified_state:
                     continue
 
-                module_state = dict(modified_state[module_id])
+                if module_id in copied_modules:
+                    module_state = modified_state[module_id]
+                else:
+                    if modified_state is system_state:
+                        modified_state = system_state.copy()
+                    module_state = dict(modified_state[module_id])
+                    modified_state[module_id] = module_state
+                    copied_modules.add(module_id)
 
                 stress_type = getattr(stress_factor, 'stress_type', None)
                 if stress_type == DetailedStressType.TEMPERATURE:
@@ -315,23 +476,14 @@ class EnvironmentModel(BaseModel):
                     key = stress_factor.parameters.get('metric', stress_factor.name)
                     module_state[key] = stress_value
 
-                modified_state[module_id] = module_state
-
         if self.python_code:
-            local_vars = {
-                'system_state': system_state,
-                'modified_state': modified_state,
-                'current_time': current_time,
-                'parameters': self.parameters,
-                'stress_factors': stress_values,
-                'affected_modules': self.affected_modules,
-            }
-
+            if modified_state is system_state:
+                modified_state = system_state.copy()  # 自定义代码可能写入 modified_state
             try:
-                exec(self.python_code, {}, local_vars)
-                modified_state = local_vars.get('modified_state', modified_state)
-            except Exception as e:
-                print(f"执行环境模型 {self.name} 的Python代码时出错: {e}")
+                modified_state = self._code.run(self.python_code, system_state, modified_state, current_time,
+                                                self.parameters, stress_values, self.affected_modules)
+            except Exception:
+                log_code_error(logger, self.python_code, "执行环境模型 %s 的Python代码时出错", self.name)
 
         return modified_state
 
@@ -398,8 +550,8 @@ class EnvironmentModel(BaseModel):
                     factor_data['name'] = key if isinstance(key, str) else f"stress_{len(self.stress_factors) + 1}"
                 try:
                     stress_factor.from_dict(factor_data)
-                except Exception as exc:
-                    print(f"加载环境应力因子 {factor_data.get('name', key)} 时出错: {exc}")
+                except Exception:
+                    logger.warning("加载环境应力因子 %s 时出错", factor_data.get('name', key), exc_info=True)
                     continue
             else:
                 continue
@@ -444,6 +596,7 @@ class SystemStructure(BaseModel):
         self.canvas_size = Point(1200, 800)  # 画布大小
         self.zoom_level = 1.0  # 缩放级别
         self.view_offset = Point(0, 0)  # 视图偏移
+        self._module_connections: Dict[str, set] = defaultdict(set)  # 模块ID -> 相关连接ID
     
     def add_module(self, module: Module):
         """添加模块"""
@@ -453,14 +606,11 @@ class SystemStructure(BaseModel):
     def remove_module(self, module_id: str):
         """移除模块"""
         if module_id in self.modules:
-            # 移除相关的连接
-            connections_to_remove = []
-            for conn_id, conn in self.connections.items():
-                if conn.source_module_id == module_id or conn.target_module_id == module_id:
-                    connections_to_remove.append(conn_id)
-            
-            for conn_id in connections_to_remove:
-                del self.connections[conn_id]
+            # 移除相关的连接（按模块->连接索引查找，不必遍历全部连接）
+            for conn_id in self._module_connections.pop(module_id, ()):
+                conn = self.connections.pop(conn_id, None)
+                if conn is not None:
+                    self._unindex_connection(conn_id, conn)
             
             # 移除模块
             del self.modules[module_id]
@@ -479,14 +629,38 @@ class SystemStructure(BaseModel):
     
     def add_connection(self, connection: Connection):
         """添加连接"""
+        replaced = self.connections.get(connection.id)
+        if replaced is not None:
+            self._unindex_connection(connection.id, replaced)
         self.connections[connection.id] = connection
+        self._index_connection(connection.id, connection)
         self.update_modified_time()
     
     def remove_connection(self, connection_id: str):
         """移除连接"""
         if connection_id in self.connections:
-            del self.connections[connection_id]
+            self._unindex_connection(connection_id, self.connections.pop(connection_id))
             self.update_modified_time()
+
+    def _index_connection(self, connection_id: str, connection: Connection):
+        index = self._module_connections
+        index[connection.source_module_id].add(connection_id)
+        index[connection.target_module_id].add(connection_id)
+
+    def _unindex_connection(self, connection_id: str, connection: Connection):
+        index = self._module_connections
+        for module_id in (connection.source_module_id, connection.target_module_id):
+            connection_ids = index.get(module_id)
+            if connection_ids is not None:
+                connection_ids.discard(connection_id)
+                if not connection_ids:
+                    del index[module_id]
+
+    def _rebuild_connection_index(self):
+        """按当前连接字典重建模块->连接索引"""
+        self._module_connections = defaultdict(set)
+        for connection_id, connection in self.connections.items():
+            self._index_connection(connection_id, connection)
     
     def add_environment_model(self, env_model: EnvironmentModel):
         """添加环境模型"""
@@ -520,12 +694,15 @@ class SystemStructure(BaseModel):
     
     def get_current_task_profile(self) -> Optional[TaskProfile]:
         """获取当前任务剖面"""
-        if self.current_task_profile_id in self.task_profiles:
-            return self.task_profiles[self.current_task_profile_id]
-        return None
+        return self.task_profiles.get(self.current_task_profile_id)
     
-    def simulate_system(self, duration: float = 1.0) -> Dict[str, Any]:
-        """模拟系统运行"""
+    def simulate_system(self, duration: float = 1.0, max_workers: Optional[int] = None) -> Dict[str, Any]:
+        """模拟系统运行
+
+        各模块的建模代码之间没有输入依赖；``max_workers`` 大于 1 时在线程池中并发执行。
+        纯 Python 代码受 GIL 限制不会因此变快，适合代码中调用 NumPy 等释放 GIL 的运算。
+        """
+        reset_code_error_counts()  # 上一次仿真中被限流的错误在本次仍以 WARNING 记录
         system_state: Dict[str, Any] = {}
 
         def gather_environment_snapshot() -> Dict[str, Dict[str, Any]]:
@@ -551,18 +728,27 @@ class SystemStructure(BaseModel):
         interface_outputs_by_module: Dict[str, Dict[str, Any]] = {}
         interface_inputs_by_module: Dict[str, Dict[str, Any]] = {}
 
-        # 初步执行模块逻辑
-        for module_id, module in self.modules.items():
+        def run_module(item: Tuple[str, Module]) -> Dict[str, Any]:
+            module_id, module = item
             inputs = {
                 'environment': environment_snapshot.get(module_id, environment_snapshot.get('global', {})),
                 'task_context': {},
                 'interfaces': {},
             }
             try:
-                outputs = module.execute_python_code(inputs) or {}
-            except Exception as exc:  # pragma: no cover - defensive logging
-                print(f"执行模块 {module.name} 的仿真代码失败: {exc}")
-                outputs = {}
+                return module.execute_python_code(inputs) or {}
+            except Exception:  # pragma: no cover - defensive logging
+                log_code_error(logger, module.python_code, "执行模块 %s 的仿真代码失败", module.name)
+                return {}
+
+        # 初步执行模块逻辑
+        module_items = list(self.modules.items())
+        if max_workers is not None and max_workers > 1 and len(module_items) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(module_items))) as executor:
+                results = list(executor.map(run_module, module_items))
+        else:
+            results = map(run_module, module_items)
+        for (module_id, _), outputs in zip(module_items, results):
             module_outputs[module_id] = outputs
 
         # 汇总所有接口（模块内部和系统级）
@@ -581,8 +767,8 @@ class SystemStructure(BaseModel):
             }
             try:
                 iface_result = interface.simulate_interface(source_context, runtime_context) or {}
-            except Exception as exc:  # pragma: no cover - defensive logging
-                print(f"接口 {interface.name} 仿真失败: {exc}")
+            except Exception:  # pragma: no cover - defensive logging
+                log_code_error(logger, interface.python_code, "接口 %s 仿真失败", interface.name)
                 iface_result = {}
 
             if interface.source_module_id:
@@ -606,40 +792,29 @@ class SystemStructure(BaseModel):
         return system_state
     
     def to_dict(self) -> Dict[str, Any]:
+        # 直接写入父类返回的字典，不另建中间字典再 update
         base_dict = super().to_dict()
-        base_dict.update({
-            'modules': {k: v.to_dict() for k, v in self.modules.items()},
-            'interfaces': {k: v.to_dict() for k, v in self.interfaces.items()},
-            'connections': {k: v.to_dict() for k, v in self.connections.items()},
-            'environment_models': {k: v.to_dict() for k, v in self.environment_models.items()},
-            'task_profiles': {k: v.to_dict() for k, v in self.task_profiles.items()},
-            'current_task_profile_id': self.current_task_profile_id,
-            'canvas_size': self.canvas_size.to_dict(),
-            'zoom_level': self.zoom_level,
-            'view_offset': self.view_offset.to_dict()
-        })
+        base_dict['modules'] = _to_dict_map(self.modules)
+        base_dict['interfaces'] = _to_dict_map(self.interfaces)
+        base_dict['connections'] = _to_dict_map(self.connections)
+        base_dict['environment_models'] = _to_dict_map(self.environment_models)
+        base_dict['task_profiles'] = _to_dict_map(self.task_profiles)
+        base_dict['current_task_profile_id'] = self.current_task_profile_id
+        base_dict['canvas_size'] = self.canvas_size.to_dict()
+        base_dict['zoom_level'] = self.zoom_level
+        base_dict['view_offset'] = self.view_offset.to_dict()
         return base_dict
     
     def from_dict(self, data: Dict[str, Any]):
         super().from_dict(data)
         
-        # 加载模块（这里需要根据实际的模块类型创建对应的对象）
+        # 加载模块
         self.modules = {}
         for module_id, module_data in data.get('modules', {}).items():
             # 根据module_type创建对应的模块类型
-            module_type_str = module_data.get('module_type', 'hardware')
-            if module_type_str == 'hardware':
-                from .module_model import HardwareModule as ModuleClass
-            elif module_type_str == 'software':
-                from .module_model import SoftwareModule as ModuleClass
-            elif module_type_str == 'algorithm':
-                from .module_model import AlgorithmModule as ModuleClass
-            else:
-                from .module_model import Module as ModuleClass
-                
-            module = ModuleClass()
-            module.from_dict(module_data)
-            # 确保模块ID正确设置
+            module = load_module(module_data)
+            # 确保模块ID正确设置；驻留后模块字典、仿真状态与判据、连接共用同一ID字符串
+            module_id = intern_str(module_id)
             module.id = module_id
             self.modules[module_id] = module
         
@@ -654,14 +829,14 @@ class SystemStructure(BaseModel):
         self.connections = {}
         for connection_id, connection_data in data.get('connections', {}).items():
             try:
-                connection = Connection()
-                connection.from_dict(connection_data)
+                connection = Connection.from_dict_cls(connection_data)
                 # 确保连接有有效的ID
                 if not connection.id:
                     connection.id = connection_id
                 self.connections[connection_id] = connection
             except Exception as e:
                 print(f"加载连接 {connection_id} 时出错: {e}")
+        self._rebuild_connection_index()
         
         # 加载环境模型
         self.environment_models = {}
@@ -682,10 +857,8 @@ class SystemStructure(BaseModel):
         
         self.current_task_profile_id = data.get('current_task_profile_id', '')
         
-        self.canvas_size = Point()
-        self.canvas_size.from_dict(data.get('canvas_size', {'x': 1200, 'y': 800}))
+        self.canvas_size = Point.from_mapping(data.get('canvas_size', {'x': 1200, 'y': 800}))
         
         self.zoom_level = data.get('zoom_level', 1.0)
         
-        self.view_offset = Point()
-        self.view_offset.from_dict(data.get('view_offset', {'x': 0, 'y': 0}))
+        self.view_offset = Point.from_mapping(data.get('view_offset', {'x': 0, 'y': 0}))
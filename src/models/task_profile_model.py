@@ -5,9 +5,19 @@
 Task Profile Data Model
 """
 
+import itertools
+import logging
+import operator
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 from enum import Enum
-from .base_model import BaseModel
+from ._imports import BaseModel, CodeRunner, intern_str, log_code_error
+from ._criteria_kernel import (IN_RANGE_CODE, JIT_MIN_CRITERIA, OUT_RANGE_CODE, VECTOR_MIN_CRITERIA,
+                               compare_each_jit, op_code)
+from ..utils.serialization import serialize
+
+logger = logging.getLogger(__name__)
 
 
 class SuccessCriteriaType(Enum):
@@ -30,69 +40,108 @@ class ComparisonOperator(Enum):
     OUT_RANGE = "out_range"
 
 
+# 常用枚举成员绑定为模块常量：经 Enum 类读取成员比读取全局变量慢一个数量级
+_MODULE_OUTPUT = SuccessCriteriaType.MODULE_OUTPUT
+_CUSTOM_CONDITION = SuccessCriteriaType.CUSTOM_CONDITION
+_GREATER_EQUAL = ComparisonOperator.GREATER_EQUAL
+_IN_RANGE = ComparisonOperator.IN_RANGE
+
+# evaluate_overall_success 每评估该次数后按失败率重新排列判据
+_REORDER_INTERVAL = 64
+
+# 自定义判据代码包装为函数时的参数（依次对应 exec 执行时预置的局部变量）
+_CUSTOM_CODE_ARGS = ('system_state', 'result')
+
+# 系统状态中缺少模块或参数的标记
+_NO_STATE = MappingProxyType({})
+_ABSENT = object()
+
+# 枚举取值 -> 成员，反序列化时以字典查找代替 Enum(value) 调用；未知取值仍交给 Enum 抛出 ValueError
+_CRITERIA_TYPE_MAP = {member.value: member for member in SuccessCriteriaType}
+_OPERATOR_MAP = {member.value: member for member in ComparisonOperator}
+
+
+def _in_range(current_value: Any, criteria: 'SuccessCriteria') -> bool:
+    return criteria.range_min <= current_value <= criteria.range_max
+
+
+def _out_range(current_value: Any, criteria: 'SuccessCriteria') -> bool:
+    return not (criteria.range_min <= current_value <= criteria.range_max)
+
+
+# 与目标值比较的操作符 -> 比较函数
+_VALUE_OPS = {
+    ComparisonOperator.EQUAL: operator.eq,
+    ComparisonOperator.NOT_EQUAL: operator.ne,
+    ComparisonOperator.GREATER: operator.gt,
+    ComparisonOperator.GREATER_EQUAL: operator.ge,
+    ComparisonOperator.LESS: operator.lt,
+    ComparisonOperator.LESS_EQUAL: operator.le,
+}
+# 范围操作符 -> 比较函数（以判据本身取范围上下限）
+_RANGE_OPS = {
+    ComparisonOperator.IN_RANGE: _in_range,
+    ComparisonOperator.OUT_RANGE: _out_range,
+}
+
+# 判据修订号：公开属性每次赋值都取一个新值，任务剖面据此判断打包的判据是否过期
+_REVISIONS = itertools.count()
+_revision_of = operator.attrgetter('_revision')
+
+
 class SuccessCriteria:
     """成功判据"""
+
+    __slots__ = ('name', 'description', 'criteria_type', 'module_id', 'parameter_name', 'operator',
+                 'target_value', 'range_min', 'range_max', 'weight', 'enabled', 'python_code',
+                 '_code', '_revision')
     
     def __init__(self, name: str = ""):
         self.name = name
         self.description = ""
-        self.criteria_type = SuccessCriteriaType.MODULE_OUTPUT
+        self.criteria_type = _MODULE_OUTPUT
         self.module_id = ""  # 关联的模块ID
         self.parameter_name = ""  # 参数名称
-        self.operator = ComparisonOperator.GREATER_EQUAL
+        self.operator = _GREATER_EQUAL
         self.target_value = 0.0  # 目标值
         self.range_min = 0.0  # 范围最小值
         self.range_max = 100.0  # 范围最大值
         self.weight = 1.0  # 权重
         self.enabled = True  # 是否启用
         self.python_code = ""  # 自定义Python代码
-    
+        self._code = CodeRunner(_CUSTOM_CODE_ARGS, 'result', '<criteria>')
+
+    def __setattr__(self, name: str, value: Any):
+        object.__setattr__(self, name, value)
+        if name[0] != '_':
+            object.__setattr__(self, '_revision', next(_REVISIONS))
+
     def evaluate(self, system_state: Dict[str, Any]) -> bool:
         """评估成功判据"""
         try:
-            if self.criteria_type == SuccessCriteriaType.CUSTOM_CONDITION:
+            if self.criteria_type is _CUSTOM_CONDITION:
                 # 执行自定义Python代码
                 if self.python_code:
-                    local_vars = {
-                        'system_state': system_state,
-                        'result': False
-                    }
-                    exec(self.python_code, {}, local_vars)
-                    return local_vars.get('result', False)
+                    return self._code.run(self.python_code, system_state, False)
                 return False
             
-            # 获取参数值
-            if self.module_id not in system_state:
+            # 获取参数值：两次 get 代替成员测试加取值，缺少模块或参数时判定为不满足
+            current_value = system_state.get(self.module_id, _NO_STATE).get(self.parameter_name, _ABSENT)
+            if current_value is _ABSENT:
                 return False
             
-            module_state = system_state[self.module_id]
-            if self.parameter_name not in module_state:
-                return False
-            
-            current_value = module_state[self.parameter_name]
-            
             # 执行比较操作
-            if self.operator == ComparisonOperator.EQUAL:
-                return current_value == self.target_value
-            elif self.operator == ComparisonOperator.NOT_EQUAL:
-                return current_value != self.target_value
-            elif self.operator == ComparisonOperator.GREATER:
-                return current_value > self.target_value
-            elif self.operator == ComparisonOperator.GREATER_EQUAL:
-                return current_value >= self.target_value
-            elif self.operator == ComparisonOperator.LESS:
-                return current_value < self.target_value
-            elif self.operator == ComparisonOperator.LESS_EQUAL:
-                return current_value <= self.target_value
-            elif self.operator == ComparisonOperator.IN_RANGE:
-                return self.range_min <= current_value <= self.range_max
-            elif self.operator == ComparisonOperator.OUT_RANGE:
-                return not (self.range_min <= current_value <= self.range_max)
+            compare = _VALUE_OPS.get(self.operator)
+            if compare is not None:
+                return compare(current_value, self.target_value)
+            compare = _RANGE_OPS.get(self.operator)
+            if compare is not None:
+                return compare(current_value, self)
             
             return False
             
-        except Exception as e:
-            print(f"评估成功判据 {self.name} 时出错: {e}")
+        except Exception:
+            log_code_error(logger, self.python_code or self.name, "评估成功判据 %s 时出错", self.name)
             return False
     
     def to_dict(self) -> Dict[str, Any]:
@@ -111,13 +160,23 @@ class SuccessCriteria:
             'python_code': self.python_code
         }
     
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'SuccessCriteria':
+        """由字典构造判据；from_dict 会写入全部公开字段，因此跳过 __init__ 中的默认值赋值"""
+        criteria = cls.__new__(cls)
+        criteria._code = CodeRunner(_CUSTOM_CODE_ARGS, 'result', '<criteria>')
+        criteria.from_dict(data)
+        return criteria
+
     def from_dict(self, data: Dict[str, Any]):
-        self.name = data.get('name', '')
+        self.name = intern_str(data.get('name', ''))
         self.description = data.get('description', '')
-        self.criteria_type = SuccessCriteriaType(data.get('criteria_type', SuccessCriteriaType.MODULE_OUTPUT.value))
-        self.module_id = data.get('module_id', '')
-        self.parameter_name = data.get('parameter_name', '')
-        self.operator = ComparisonOperator(data.get('operator', ComparisonOperator.GREATER_EQUAL.value))
+        value = data.get('criteria_type', 'module_output')
+        self.criteria_type = _CRITERIA_TYPE_MAP.get(value) or SuccessCriteriaType(value)
+        self.module_id = intern_str(data.get('module_id', ''))
+        self.parameter_name = intern_str(data.get('parameter_name', ''))
+        value = data.get('operator', '>=')
+        self.operator = _OPERATOR_MAP.get(value) or ComparisonOperator(value)
         self.target_value = data.get('target_value', 0.0)
         self.range_min = data.get('range_min', 0.0)
         self.range_max = data.get('range_max', 100.0)
@@ -128,6 +187,8 @@ class SuccessCriteria:
 
 class TaskPhase:
     """任务阶段"""
+
+    __slots__ = ('name', 'description', 'start_time', 'duration', 'conditions', 'parameters', 'enabled')
     
     def __init__(self, name: str = ""):
         self.name = name
@@ -149,8 +210,15 @@ class TaskPhase:
             'enabled': self.enabled
         }
     
+    @classmethod
+    def from_dict_cls(cls, data: Dict[str, Any]) -> 'TaskPhase':
+        """由字典构造任务阶段；from_dict 会写入全部字段，因此跳过 __init__"""
+        phase = cls.__new__(cls)
+        phase.from_dict(data)
+        return phase
+
     def from_dict(self, data: Dict[str, Any]):
-        self.name = data.get('name', '')
+        self.name = intern_str(data.get('name', ''))
         self.description = data.get('description', '')
         self.start_time = data.get('start_time', 0.0)
         self.duration = data.get('duration', 60.0)
@@ -159,6 +227,103 @@ class TaskPhase:
         self.enabled = data.get('enabled', True)
 
 
+class _CriteriaBatch:
+    """由判据列表派生、在判据变化前可复用的评估数据
+
+    启用的判据达到 VECTOR_MIN_CRITERIA 个、都是与数值比较的判据（非自定义条件）时，
+    目标值与范围上下限打包为数组，每次评估取一次实际值后按操作符分组做数组比较；
+    判据达到 JIT_MIN_CRITERIA 个且安装了 Numba 时改为在 JIT 编译的循环中逐个比较。
+
+    另记录 evaluate_overall_success 中各判据的评估与失败次数，判据变化后随评估数据一起重置。
+    """
+
+    __slots__ = ('key', 'enabled', 'targets', 'target_values', 'range_min', 'range_max',
+                 'value_groups', 'range_groups', 'op_codes', 'order', 'checks', 'failures', 'evaluations')
+
+    def __init__(self, key: tuple, criteria: List[SuccessCriteria]):
+        self.key = key  # 各判据的修订号
+        self.enabled = [sc for sc in criteria if sc.enabled]
+        self.order = list(range(len(self.enabled)))  # 快速判定时的评估顺序（enabled 中的位置）
+        self.checks = [0] * len(self.enabled)
+        self.failures = [0] * len(self.enabled)
+        self.evaluations = 0
+        self.targets = None
+        enabled = self.enabled
+        if len(enabled) < VECTOR_MIN_CRITERIA or any(
+                sc.criteria_type is _CUSTOM_CONDITION for sc in enabled):
+            return
+
+        import numpy as np
+
+        target_values = np.array([sc.target_value for sc in enabled])
+        range_min = np.array([sc.range_min for sc in enabled])
+        range_max = np.array([sc.range_max for sc in enabled])
+        if any(array.dtype.kind not in 'bif' for array in (target_values, range_min, range_max)):
+            return
+
+        value_groups: Dict[Any, List[int]] = {}
+        range_groups: Dict[bool, List[int]] = {}
+        for index, sc in enumerate(enabled):
+            compare = _VALUE_OPS.get(sc.operator)
+            if compare is not None:
+                value_groups.setdefault(compare, []).append(index)
+            elif sc.operator in _RANGE_OPS:
+                range_groups.setdefault(sc.operator is _IN_RANGE, []).append(index)
+        # 未知操作符的判据不在任何分组中，恒为不满足
+        self.targets = [(sc.module_id, sc.parameter_name) for sc in enabled]
+        self.target_values = target_values
+        self.range_min = range_min
+        self.range_max = range_max
+        self.value_groups = [(compare, np.array(indices, dtype=np.intp))
+                             for compare, indices in value_groups.items()]
+        self.range_groups = [(inside, np.array(indices, dtype=np.intp))
+                             for inside, indices in range_groups.items()]
+        self.op_codes = None
+        if compare_each_jit is not None and len(enabled) >= JIT_MIN_CRITERIA:
+            range_codes = {ComparisonOperator.IN_RANGE: IN_RANGE_CODE, ComparisonOperator.OUT_RANGE: OUT_RANGE_CODE}
+            self.op_codes = np.array([op_code(_VALUE_OPS.get(sc.operator)) if sc.operator in _VALUE_OPS
+                                      else range_codes.get(sc.operator, -1) for sc in enabled], dtype=np.int8)
+            self.target_values = target_values.astype(np.float64)
+            self.range_min = range_min.astype(np.float64)
+            self.range_max = range_max.astype(np.float64)
+
+    def hits(self, system_state: Dict[str, Any]) -> Optional[List[bool]]:
+        """各启用判据是否满足；实际值取不到或不全为数值时返回 None，调用方应逐个评估"""
+        import numpy as np
+
+        values, present = [], []
+        try:
+            for module_id, parameter in self.targets:
+                if module_id in system_state:
+                    module_state = system_state[module_id]
+                    if parameter in module_state:
+                        values.append(module_state[parameter])
+                        present.append(True)
+                        continue
+                values.append(0)
+                present.append(False)
+            actual = np.array(values)
+        except Exception:
+            return None
+        if actual.dtype.kind not in 'bif' or actual.shape != (len(values),):
+            return None
+
+        hits = np.zeros(actual.shape[0], dtype=bool)
+        if self.op_codes is not None:
+            compare_each_jit(actual.astype(np.float64), np.array(present, dtype=bool), self.op_codes,
+                             self.target_values, self.range_min, self.range_max, hits)
+            return hits.tolist()
+        for compare, index in self.value_groups:
+            hits[index] = compare(actual[index], self.target_values[index])
+        for inside, index in self.range_groups:
+            value = actual[index]
+            within = (self.range_min[index] <= value) & (value <= self.range_max[index])
+            hits[index] = within if inside else ~within
+        # 缺少模块或参数的判据不满足
+        hits &= np.array(present, dtype=bool)
+        return hits.tolist()
+
+
 class TaskProfile(BaseModel):
     """任务剖面"""
     
@@ -173,10 +338,14 @@ class TaskProfile(BaseModel):
         self.fault_tree_generated = False  # 是否已生成故障树
         self.fault_tree_data = {}  # 故障树数据
         self.analysis_results = {}  # 分析结果
+        self._criteria_batch = None  # 由判据列表派生的评估数据，判据变化后重新生成
+        # 按名称查找用的索引：列表属性名 -> ((id(列表), 长度), {名称: 第一个同名对象的位置})
+        self._name_indexes: Dict[str, tuple] = {}
     
     def add_success_criteria(self, criteria: SuccessCriteria):
         """添加成功判据"""
         self.success_criteria.append(criteria)
+        self._index_appended('success_criteria', criteria)
         self.update_modified_time()
     
     def remove_success_criteria(self, criteria_name: str):
@@ -186,14 +355,12 @@ class TaskProfile(BaseModel):
     
     def get_success_criteria(self, criteria_name: str) -> Optional[SuccessCriteria]:
         """获取成功判据"""
-        for sc in self.success_criteria:
-            if sc.name == criteria_name:
-                return sc
-        return None
+        return self._find_by_name('success_criteria', criteria_name)
     
     def add_task_phase(self, phase: TaskPhase):
         """添加任务阶段"""
         self.task_phases.append(phase)
+        self._index_appended('task_phases', phase)
         self.update_modified_time()
     
     def remove_task_phase(self, phase_name: str):
@@ -203,10 +370,42 @@ class TaskProfile(BaseModel):
     
     def get_task_phase(self, phase_name: str) -> Optional[TaskPhase]:
         """获取任务阶段"""
-        for tp in self.task_phases:
-            if tp.name == phase_name:
-                return tp
-        return None
+        return self._find_by_name('task_phases', phase_name)
+
+    def _index_by_name(self, attr: str) -> Dict[str, int]:
+        items = getattr(self, attr)
+        index: Dict[str, int] = {}
+        for position, item in enumerate(items):
+            index.setdefault(item.name, position)
+        self._name_indexes[attr] = ((id(items), len(items)), index)
+        return index
+
+    def _index_appended(self, attr: str, item: Any):
+        """add_* 追加对象后增量更新索引；索引已过期时留待查找时重建"""
+        items = getattr(self, attr)
+        cached = self._name_indexes.get(attr)
+        if cached is not None and cached[0] == (id(items), len(items) - 1):
+            cached[1].setdefault(item.name, len(items) - 1)
+            self._name_indexes[attr] = ((id(items), len(items)), cached[1])
+
+    def _find_by_name(self, attr: str, name: str) -> Optional[Any]:
+        """返回列表属性中第一个同名对象
+
+        索引随 add_* 增量维护；列表被替换或长度变化时重建。
+        对象可能在加入后改名，因此命中时校验名称，未命中时重建一次再查。
+        """
+        items = getattr(self, attr)
+        cached = self._name_indexes.get(attr)
+        rebuilt = cached is None or cached[0] != (id(items), len(items))
+        index = self._index_by_name(attr) if rebuilt else cached[1]
+        while True:
+            position = index.get(name)
+            if position is not None and items[position].name == name:
+                return items[position]
+            if rebuilt:
+                return None
+            index = self._index_by_name(attr)
+            rebuilt = True
     
     def evaluate_success(self, system_state: Dict[str, Any]) -> Dict[str, Any]:
         """评估任务成功"""
@@ -218,11 +417,13 @@ class TaskProfile(BaseModel):
             'success_rate': 0.0
         }
         
-        enabled_criteria = [sc for sc in self.success_criteria if sc.enabled]
+        batch = self._current_criteria_batch()
+        # 打包的比较判据一次算出全部结果；无法批量比较时逐个评估
+        hits = batch.hits(system_state) if batch.targets is not None else None
         
-        for criteria in enabled_criteria:
+        for index, criteria in enumerate(batch.enabled):
             try:
-                success = criteria.evaluate(system_state)
+                success = criteria.evaluate(system_state) if hits is None else hits[index]
                 results['criteria_results'][criteria.name] = {
                     'success': success,
                     'weight': criteria.weight,
@@ -252,14 +453,63 @@ class TaskProfile(BaseModel):
             results['success_rate'] = 0.0
         
         return results
+
+    def evaluate_overall_success(self, system_state: Dict[str, Any]) -> bool:
+        """是否全部启用判据都满足，与 evaluate_success(...)['overall_success'] 相同
+
+        遇到第一个不满足的判据即返回 False，不再评估其余判据。判据按历史失败率从高到低
+        排列，每评估 _REORDER_INTERVAL 次重新排序；自定义判据的执行顺序因此可能与列表顺序不同。
+        """
+        batch = self._current_criteria_batch()
+        batch.evaluations += 1
+        if batch.evaluations % _REORDER_INTERVAL == 0:
+            checks, failures = batch.checks, batch.failures
+            batch.order.sort(key=lambda index: failures[index] / checks[index] if checks[index] else 0.0,
+                             reverse=True)
+
+        enabled, checks = batch.enabled, batch.checks
+        for index in batch.order:
+            checks[index] += 1
+            try:
+                success = enabled[index].evaluate(system_state)
+            except Exception:
+                success = False
+            if not success:
+                batch.failures[index] += 1
+                return False
+        return True
+
+    def evaluate_success_batch(self, states: List[Dict[str, Any]],
+                               max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """逐个评估多组系统状态（如蒙特卡洛抽样），结果与依次调用 evaluate_success 相同
+
+        ``max_workers`` 大于 1 时在进程池中并行评估：任务剖面在每个工作进程中只传递一次，
+        状态分块发送。状态与结果需可 pickle；自定义判据代码对状态的修改不会传回调用方。
+        """
+        if not max_workers or max_workers <= 1 or len(states) < 2:
+            return [self.evaluate_success(state) for state in states]
+        workers = min(max_workers, len(states))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_evaluate_in_worker, states,
+                                     chunksize=max(1, len(states) // (workers * 4))))
+
+    def _current_criteria_batch(self) -> _CriteriaBatch:
+        """启用判据及打包的比较判据；判据列表或任一判据的属性变化后重新生成"""
+        key = tuple(map(_revision_of, self.success_criteria))
+        batch = self._criteria_batch
+        if batch is None or batch.key != key:
+            batch = self._criteria_batch = _CriteriaBatch(key, self.success_criteria)
+        return batch
     
-    def to_dict(self) -> Dict[str, Any]:
+    def _shallow_dict(self) -> Dict[str, Any]:
+        """字段字典，判据与阶段列表中仍是对象本身"""
         base_dict = super().to_dict()
         base_dict.update({
             'mission_type': self.mission_type,
             'total_duration': self.total_duration,
-            'success_criteria': [sc.to_dict() for sc in self.success_criteria],
-            'task_phases': [tp.to_dict() for tp in self.task_phases],
+            'success_criteria': self.success_criteria,
+            'task_phases': self.task_phases,
             'environment_conditions': self.environment_conditions,
             'initial_conditions': self.initial_conditions,
             'fault_tree_generated': self.fault_tree_generated,
@@ -267,25 +517,29 @@ class TaskProfile(BaseModel):
             'analysis_results': self.analysis_results
         })
         return base_dict
+
+    def to_dict(self) -> Dict[str, Any]:
+        base_dict = self._shallow_dict()
+        base_dict['success_criteria'] = [sc.to_dict() for sc in self.success_criteria]
+        base_dict['task_phases'] = [tp.to_dict() for tp in self.task_phases]
+        return base_dict
+
+    def to_json_bytes(self) -> bytes:
+        """编码为 JSON 字节串，结果与 serialize(self.to_dict()) 相同
+
+        判据与阶段对象直接交给编码器，编码到时才逐个转换为字典，
+        不必先构建并持有完整的嵌套字典，适合仿真过程中频繁保存快照。
+        """
+        return serialize(self._shallow_dict())
     
     def from_dict(self, data: Dict[str, Any]):
         super().from_dict(data)
         self.mission_type = data.get('mission_type', '')
         self.total_duration = data.get('total_duration', 3600.0)
         
-        # 加载成功判据
-        self.success_criteria = []
-        for sc_data in data.get('success_criteria', []):
-            sc = SuccessCriteria()
-            sc.from_dict(sc_data)
-            self.success_criteria.append(sc)
-        
-        # 加载任务阶段
-        self.task_phases = []
-        for tp_data in data.get('task_phases', []):
-            tp = TaskPhase()
-            tp.from_dict(tp_data)
-            self.task_phases.append(tp)
+        # 加载成功判据与任务阶段
+        self.success_criteria = list(map(SuccessCriteria.from_dict_cls, data.get('success_criteria', [])))
+        self.task_phases = list(map(TaskPhase.from_dict_cls, data.get('task_phases', [])))
         
         self.environment_conditions = data.get('environment_conditions', {})
         self.initial_conditions = data.get('initial_conditions', {})
@@ -294,8 +548,39 @@ class TaskProfile(BaseModel):
         self.analysis_results = data.get('analysis_results', {})
 
 
-# 预定义任务剖面模板
-TASK_PROFILE_TEMPLATES = {
+# 进程池工作进程中的任务剖面，由 _init_batch_worker 在进程启动时设置
+_worker_profile: Optional[TaskProfile] = None
+
+
+def _init_batch_worker(profile: TaskProfile):
+    global _worker_profile
+    _worker_profile = profile
+
+
+def _evaluate_in_worker(system_state: Dict[str, Any]) -> Dict[str, Any]:
+    return _worker_profile.evaluate_success(system_state)
+
+
+def _freeze(value: Any) -> Any:
+    """模板数据转为只读结构：字典 -> MappingProxyType，列表 -> 元组"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """只读模板数据转回新的字典、列表，加载后的对象不与模板共享容器"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+# 预定义任务剖面模板（只读；由 create_profile_from_template 实例化）
+TASK_PROFILE_TEMPLATES = _freeze({
     "无人机巡航任务": {
         "name": "无人机巡航任务",
         "description": "无人机执行巡航监控任务",
@@ -373,4 +658,11 @@ TASK_PROFILE_TEMPLATES = {
             }
         ]
     }
-}
+})
+
+
+def create_profile_from_template(template_name: str) -> TaskProfile:
+    """由模板新建任务剖面，每次生成新的ID与判据、阶段对象"""
+    profile = TaskProfile()
+    profile.from_dict(_thaw(TASK_PROFILE_TEMPLATES[template_name]))
+    return profile
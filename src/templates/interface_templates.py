@@ -9,9 +9,13 @@ models.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import re
+from bisect import bisect_right
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from textwrap import dedent
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from ..models.interface_model import (
     FailureMode,
@@ -26,17 +30,45 @@ from ..models.interface_model import (
 )
 
 
-@dataclass(frozen=True)
+def _slotted_frozen_dataclass(cls: type) -> type:
+    """Declare ``cls`` as a frozen dataclass whose instances use ``__slots__``.
+
+    Template specs are shared between templates, so assigning a field raises
+    ``FrozenInstanceError`` exactly as with ``@dataclass(frozen=True)``; the
+    slots only drop the per-instance ``__dict__``. ``dataclass(slots=True)``
+    would do the same but needs Python 3.10.
+    """
+    cls = dataclass(frozen=True)(cls)
+    names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    # Class-level field defaults would clash with the slot descriptors; the
+    # generated __init__ keeps its own references to them.
+    for name in names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    namespace["__slots__"] = names
+    # Without a __dict__, copy/pickle restore slots through __setattr__,
+    # which the frozen class rejects; restore them directly instead.
+    namespace["__getstate__"] = lambda self: tuple(getattr(self, name) for name in names)
+
+    def __setstate__(self, state):
+        for name, value in zip(names, state):
+            object.__setattr__(self, name, value)
+
+    namespace["__setstate__"] = __setstate__
+    return type(cls)(cls.__name__, cls.__bases__, namespace)
+
+
+@_slotted_frozen_dataclass
 class TriggerSpec:
     """Declarative description of a trigger condition."""
 
     name: str
     condition_type: str
-    parameters: Dict[str, Any] = field(default_factory=dict)
+    parameters: Mapping[str, Any] = field(default_factory=dict)
     python_code: str = ""
 
 
-@dataclass(frozen=True)
+@_slotted_frozen_dataclass
 class FailureModeSpec:
     """Declarative description of an interface failure mode."""
 
@@ -47,12 +79,12 @@ class FailureModeSpec:
     failure_rate: float = 1e-5
     detection_rate: float = 0.5
     occurrence_rate: float = 0.0
-    triggers: List[TriggerSpec] = field(default_factory=list)
-    state_outputs: Dict[str, Any] = field(default_factory=dict)
+    triggers: Sequence[TriggerSpec] = field(default_factory=list)
+    state_outputs: Mapping[str, Any] = field(default_factory=dict)
     python_code: str = ""
 
 
-@dataclass(frozen=True)
+@_slotted_frozen_dataclass
 class InterfaceTemplateDefinition:
     """Structured template metadata for generating Interface instances."""
 
@@ -66,7 +98,7 @@ class InterfaceTemplateDefinition:
     subtype: Optional[HardwareInterfaceSubtype] = None
     parameters: Dict[str, Any] = field(default_factory=dict)
     python_code: str = ""
-    normal_state_outputs: Dict[str, Any] = field(default_factory=dict)
+    normal_state_outputs: Mapping[str, Any] = field(default_factory=dict)
     failure_modes: List[FailureModeSpec] = field(default_factory=list)
     latency: float = 5.0
     bandwidth: float = 0.0
@@ -113,6 +145,46 @@ def _apply_failure_modes(interface: Interface, definition: InterfaceTemplateDefi
                 failure_state.outputs.update(fm_spec.state_outputs)
 
 
+# Behaviour scripts shared by every instance; dedented once at import.
+DEFAULT_INTERFACE_CODE = dedent(
+    """\
+    # 默认接口行为模板
+    outputs.setdefault('link_status', state_outputs.get('link_status', 'normal'))
+    outputs.setdefault('latency_ms', parameters.get('latency_ms', 5.0))
+    outputs.setdefault('payload', inputs)
+    """
+)
+
+SENSOR_INPUT_CODE = dedent(
+    """\
+    # 传感器辅助输入，维护传感器健康评估
+    environment = inputs.get('environment', {})
+    outputs['environment_snapshot'] = environment
+    outputs['link_status'] = 'normal'
+    """
+)
+
+ACTUATOR_INPUT_CODE = dedent(
+    """\
+    # 控制指令接收与约束
+    cmd = inputs.get('command', 0.0)
+
+    def _to_float(val, fallback=0.0):
+        try:
+            return float(val)
+        except Exception:
+            return fallback
+
+    cmin = _to_float(parameters.get('command_min', -1.0), -1.0)
+    cmax = _to_float(parameters.get('command_max', 1.0), 1.0)
+    value = max(cmin, min(cmax, _to_float(cmd, 0.0)))
+    outputs['bounded_command'] = value
+    outputs['saturated'] = value == cmin or value == cmax
+    outputs['link_status'] = 'normal' if not outputs['saturated'] else 'saturated'
+    """
+)
+
+
 def build_interface_from_template(definition: InterfaceTemplateDefinition) -> Interface:
     """Instantiate a concrete Interface from a template definition."""
 
@@ -127,18 +199,11 @@ def build_interface_from_template(definition: InterfaceTemplateDefinition) -> In
     interface.latency = definition.latency
     interface.bandwidth = definition.bandwidth
     interface.parameters = dict(definition.parameters)
-    interface.python_code = definition.python_code or dedent(
-        """\
-        # 默认接口行为模板
-        outputs.setdefault('link_status', state_outputs.get('link_status', 'normal'))
-        outputs.setdefault('latency_ms', parameters.get('latency_ms', 5.0))
-        outputs.setdefault('payload', inputs)
-        """
-    )
+    interface.python_code = definition.python_code or DEFAULT_INTERFACE_CODE
 
     # Annotate the instance to ease UI inspection.
-    interface.category = definition.category  # type: ignore[attr-defined]
-    interface.template_key = definition.key  # type: ignore[attr-defined]
+    interface.category = definition.category
+    interface.template_key = definition.key
 
     # Populate the nominal state with template outputs.
     if definition.normal_state_outputs:
@@ -150,19 +215,21 @@ def build_interface_from_template(definition: InterfaceTemplateDefinition) -> In
     return interface
 
 
+@lru_cache(maxsize=None)
 def _base_interface_code(payload_key: str, health_key: str = "quality") -> str:
-    """Generate a deterministic interface behaviour snippet."""
+    """Generate a deterministic interface behaviour snippet.
+
+    The float conversion is inlined rather than wrapped in a helper function so
+    that each tick does not rebuild a function object inside ``exec``.
+    """
     return dedent(
         f"""\
         # 自动生成的接口行为代码
-        def _safe_float(value, default=0.0):
-            try:
-                return float(value)
-            except Exception:
-                return default
-
         outputs.setdefault('{payload_key}', inputs)
-        health = _safe_float(inputs.get('{health_key}', parameters.get('{health_key}', 1.0)), 1.0)
+        try:
+            health = float(inputs.get('{health_key}', parameters.get('{health_key}', 1.0)))
+        except Exception:
+            health = 1.0
         outputs['health_score'] = max(0.0, min(1.0, health))
         outputs['link_status'] = 'normal' if health >= 0.7 else ('degraded' if health >= 0.4 else 'failed')
         outputs['latency_ms'] = parameters.get('latency_ms', 5.0)
@@ -175,15 +242,37 @@ def _base_interface_code(payload_key: str, health_key: str = "quality") -> str:
 # ---------------------------------------------------------------------------
 
 INTERFACE_TEMPLATE_LIBRARY: Dict[str, InterfaceTemplateDefinition] = {}
+# Category index kept sorted by template name as templates are registered;
+# ``_CATEGORY_NAMES`` holds the parallel name lists used for bisection.
+_TEMPLATES_BY_CATEGORY: Dict[str, List[InterfaceTemplateDefinition]] = {}
+_CATEGORY_NAMES: Dict[str, List[str]] = {}
 
 
 def _register_template(definition: InterfaceTemplateDefinition) -> None:
+    previous = INTERFACE_TEMPLATE_LIBRARY.get(definition.key)
+    if previous is not None:
+        defs = _TEMPLATES_BY_CATEGORY[previous.category]
+        index = next(i for i, item in enumerate(defs) if item is previous)
+        del defs[index]
+        del _CATEGORY_NAMES[previous.category][index]
     INTERFACE_TEMPLATE_LIBRARY[definition.key] = definition
 
+    names = _CATEGORY_NAMES.setdefault(definition.category, [])
+    index = bisect_right(names, definition.name)
+    names.insert(index, definition.name)
+    _TEMPLATES_BY_CATEGORY.setdefault(definition.category, []).insert(index, definition)
+
+
+# Read-only state outputs shared by many specs; builders copy them into
+# each interface state with ``dict.update``.
+_NORMAL_OUTPUTS = MappingProxyType({"link_status": "normal"})
+_SENSOR_NORMAL_OUTPUTS = MappingProxyType({"link_status": "normal", "data_valid": True})
+_DEGRADED_OUTPUTS = MappingProxyType({"link_status": "degraded"})
+_TIMEOUT_OUTPUTS = MappingProxyType({"link_status": "timeout"})
+_FAILED_OUTPUTS = MappingProxyType({"link_status": "failed"})
 
-def _sensor_templates() -> None:
-    normal_outputs = {"link_status": "normal", "data_valid": True}
 
+def _sensor_templates() -> None:
     sensor_output = InterfaceTemplateDefinition(
         key="sensor_data_output",
         name="传感器数据输出",
@@ -198,7 +287,7 @@ def _sensor_templates() -> None:
             "update_rate_hz": 100.0,
         },
         python_code=_base_interface_code("payload", "health"),
-        normal_state_outputs=normal_outputs,
+        normal_state_outputs=_SENSOR_NORMAL_OUTPUTS,
         failure_modes=[
             FailureModeSpec(
                 failure_mode=FailureMode.DATA_CORRUPTION,
@@ -253,15 +342,8 @@ def _sensor_templates() -> None:
             "latency_ms": 2.0,
             "expected_variables": ["environment"],
         },
-        python_code=dedent(
-            """\
-            # 传感器辅助输入，维护传感器健康评估
-            environment = inputs.get('environment', {})
-            outputs['environment_snapshot'] = environment
-            outputs['link_status'] = 'normal'
-            """
-        ),
-        normal_state_outputs={"link_status": "normal"},
+        python_code=SENSOR_INPUT_CODE,
+        normal_state_outputs=_NORMAL_OUTPUTS,
         failure_modes=[
             FailureModeSpec(
                 failure_mode=FailureMode.COMMUNICATION_FAILURE,
@@ -277,7 +359,7 @@ def _sensor_templates() -> None:
                         parameters={"variable": "signal_strength", "operator": "<", "value": 0.1},
                     )
                 ],
-                state_outputs={"link_status": "failed"},
+                state_outputs=_FAILED_OUTPUTS,
             )
         ],
     )
@@ -301,26 +383,8 @@ def _actuator_templates() -> None:
             "command_min": -1.0,
             "command_max": 1.0,
         },
-        python_code=dedent(
-            """\
-            # 控制指令接收与约束
-            cmd = inputs.get('command', 0.0)
-
-            def _to_float(val, fallback=0.0):
-                try:
-                    return float(val)
-                except Exception:
-                    return fallback
-
-            cmin = _to_float(parameters.get('command_min', -1.0), -1.0)
-            cmax = _to_float(parameters.get('command_max', 1.0), 1.0)
-            value = max(cmin, min(cmax, _to_float(cmd, 0.0)))
-            outputs['bounded_command'] = value
-            outputs['saturated'] = value == cmin or value == cmax
-            outputs['link_status'] = 'normal' if not outputs['saturated'] else 'saturated'
-            """
-        ),
-        normal_state_outputs={"link_status": "normal"},
+        python_code=ACTUATOR_INPUT_CODE,
+        normal_state_outputs=_NORMAL_OUTPUTS,
         failure_modes=[
             FailureModeSpec(
                 failure_mode=FailureMode.RESOURCE_EXHAUSTION,
@@ -352,7 +416,7 @@ def _actuator_templates() -> None:
         subtype=HardwareInterfaceSubtype.ACTUATOR,
         parameters={"latency_ms": 6.0},
         python_code=_base_interface_code("feedback", "health"),
-        normal_state_outputs={"link_status": "normal"},
+        normal_state_outputs=_NORMAL_OUTPUTS,
         failure_modes=[
             FailureModeSpec(
                 failure_mode=FailureMode.TIMEOUT,
@@ -368,7 +432,7 @@ def _actuator_templates() -> None:
                         parameters={"variable": "feedback_age", "operator": ">", "value": 0.5},
                     )
                 ],
-                state_outputs={"link_status": "timeout"},
+                state_outputs=_TIMEOUT_OUTPUTS,
             ),
             FailureModeSpec(
                 failure_mode=FailureMode.DATA_CORRUPTION,
@@ -384,7 +448,7 @@ def _actuator_templates() -> None:
                         parameters={"variable": "health", "operator": "<", "value": 0.5},
                     )
                 ],
-                state_outputs={"link_status": "degraded"},
+                state_outputs=_DEGRADED_OUTPUTS,
             ),
         ],
     )
@@ -413,7 +477,7 @@ def _generic_io_templates() -> None:
                 "schema": "generic",
             },
             python_code=_base_interface_code("payload"),
-            normal_state_outputs={"link_status": "normal"},
+            normal_state_outputs=_NORMAL_OUTPUTS,
             failure_modes=[
                 FailureModeSpec(
                     failure_mode=FailureMode.COMMUNICATION_FAILURE,
@@ -429,7 +493,7 @@ def _generic_io_templates() -> None:
                             parameters={"lambda_per_hour": 8e-6, "dt": 1.0},
                         )
                     ],
-                    state_outputs={"link_status": "failed"},
+                    state_outputs=_FAILED_OUTPUTS,
                 ),
                 FailureModeSpec(
                     failure_mode=FailureMode.CONFIGURATION_ERROR,
@@ -445,16 +509,35 @@ def _generic_io_templates() -> None:
                             parameters={"event": "configuration_changed"},
                         )
                     ],
-                    state_outputs={"link_status": "degraded"},
+                    state_outputs=_DEGRADED_OUTPUTS,
                 ),
             ],
         )
         _register_template(definition)
 
 
-def _default_failure_modes(category: str) -> List[FailureModeSpec]:
-    """Generate a common pair of failure modes for higher-level templates."""
-    return [
+# Trigger specs shared by every category's default failure modes.
+_JITTER_TRIGGER = TriggerSpec(
+    name="链路抖动",
+    condition_type="probability",
+    parameters=MappingProxyType({"lambda_per_hour": 6e-6, "dt": 1.0}),
+)
+_QUEUE_TRIGGER = TriggerSpec(
+    name="队列过长",
+    condition_type="threshold",
+    parameters=MappingProxyType({"variable": "queue_length", "operator": ">", "value": 128}),
+)
+
+
+@lru_cache(maxsize=None)
+def _default_failure_modes(category: str) -> Tuple[FailureModeSpec, ...]:
+    """Generate a common pair of failure modes for higher-level templates.
+
+    Cached per category: all templates of a category share the same frozen
+    specs (returned as a tuple, so callers copy it into their own list), and
+    every category shares the two read-only trigger specs.
+    """
+    return (
         FailureModeSpec(
             failure_mode=FailureMode.COMMUNICATION_FAILURE,
             name=f"{category}通信异常",
@@ -462,14 +545,8 @@ def _default_failure_modes(category: str) -> List[FailureModeSpec]:
             severity=6,
             failure_rate=1.0e-5,
             detection_rate=0.5,
-            triggers=[
-                TriggerSpec(
-                    name="链路抖动",
-                    condition_type="probability",
-                    parameters={"lambda_per_hour": 6e-6, "dt": 1.0},
-                )
-            ],
-            state_outputs={"link_status": "failed"},
+            triggers=(_JITTER_TRIGGER,),
+            state_outputs=_FAILED_OUTPUTS,
         ),
         FailureModeSpec(
             failure_mode=FailureMode.TIMEOUT,
@@ -478,20 +555,17 @@ def _default_failure_modes(category: str) -> List[FailureModeSpec]:
             severity=5,
             failure_rate=8.0e-6,
             detection_rate=0.6,
-            triggers=[
-                TriggerSpec(
-                    name="队列过长",
-                    condition_type="threshold",
-                    parameters={"variable": "queue_length", "operator": ">", "value": 128},
-                )
-            ],
-            state_outputs={"link_status": "timeout"},
+            triggers=(_QUEUE_TRIGGER,),
+            state_outputs=_TIMEOUT_OUTPUTS,
         ),
-    ]
+    )
+
+
+_SLUG_DROP = re.compile(r"[^A-Za-z0-9]+")
 
 
 def _slugify(name: str) -> str:
-    return "".join(ch for ch in name if ch.isascii() and ch.isalnum()).lower()
+    return _SLUG_DROP.sub("", name).lower()
 
 
 def _category_templates() -> None:
@@ -571,8 +645,8 @@ def _category_templates() -> None:
                 data_format="data",
                 parameters={},
                 python_code=_base_interface_code("payload"),
-                normal_state_outputs={"link_status": "normal"},
-                failure_modes=_default_failure_modes(category),
+                normal_state_outputs=_NORMAL_OUTPUTS,
+                failure_modes=list(_default_failure_modes(category)),
             )
             _register_template(definition)
 
@@ -600,10 +674,6 @@ def list_interface_templates() -> Dict[str, InterfaceTemplateDefinition]:
 
 def get_interface_templates_by_category() -> Dict[str, List[InterfaceTemplateDefinition]]:
     initialise_interface_templates()
-    categories: Dict[str, List[InterfaceTemplateDefinition]] = {}
-    for definition in INTERFACE_TEMPLATE_LIBRARY.values():
-        categories.setdefault(definition.category, []).append(definition)
-    # Stable ordering by template name for UI predictability.
-    for defs in categories.values():
-        defs.sort(key=lambda item: item.name)
-    return categories
+    # Stable ordering by template name for UI predictability; callers get
+    # independent lists rather than the registry's own index.
+    return {category: list(defs) for category, defs in _TEMPLATES_BY_CATEGORY.items() if defs}
@@ -20,11 +20,8 @@ from typing import Optional
 from PyQt5.QtCore import Qt, QRectF, QPointF, pyqtSignal, QTimer
 from PyQt5.QtGui import QPen, QBrush, QColor, QPainter, QFont, QPainterPath
 
-# 导入Point类
-try:
-    from ..models.base_model import Point
-except ImportError:
-    from src.models.base_model import Point
+from ..models.base_model import Point
+from ..models.system_model import Connection
 
 
 class ModuleConfigDialog(QDialog):
@@ -800,7 +797,7 @@ class ConnectionGraphicsItem(QGraphicsPathItem):
             # 从系统中移除连接
             if (self.system_canvas.current_system and 
                 self.connection.id in self.system_canvas.current_system.connections):
-                del self.system_canvas.current_system.connections[self.connection.id]
+                self.system_canvas.current_system.remove_connection(self.connection.id)
                 
                 # 从连接项字典中移除
                 if self.connection.id in self.system_canvas.connection_items:
@@ -1147,12 +1144,6 @@ class SystemCanvas(QWidget):
             # 暂时跳过接口兼容性检查
             print("跳过接口兼容性检查，直接建立连接")
             
-            # 创建连接
-            try:
-                from ..models.system_model import Connection
-            except ImportError:
-                from src.models.system_model import Connection
-            
             # 生成连接ID
             connection_id = f"connection_{len(self.current_system.connections) + 1}"
             
@@ -1179,7 +1170,7 @@ class SystemCanvas(QWidget):
             )
 
             # 添加到系统
-            self.current_system.connections[connection_id] = connection
+            self.current_system.add_connection(connection)
             
             # 绘制连接线
             self.draw_connection(connection)
@@ -17,7 +17,7 @@ from PyQt5.QtGui import QIcon, QFont
 
 from ..models.task_profile_model import (TaskProfile, SuccessCriteria, TaskPhase,
                                        SuccessCriteriaType, ComparisonOperator,
-                                       TASK_PROFILE_TEMPLATES)
+                                       TASK_PROFILE_TEMPLATES, create_profile_from_template)
 
 
 class SuccessCriteriaDialog(QDialog):
@@ -852,9 +852,7 @@ class TaskProfilePanel(QWidget):
             return
         
         # 从模板创建任务剖面
-        template_data = TASK_PROFILE_TEMPLATES[template_name]
-        profile = TaskProfile()
-        profile.from_dict(template_data)
+        profile = create_profile_from_template(template_name)
         
         # 添加到系统中
         system = self.project_manager.current_system
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""
+序列化工具
+Serialization Utilities
+
+模型字典与字节串之间的编解码。写 JSON 时优先使用 C 实现的 orjson，未安装时使用标准库 json；
+读 JSON 始终使用标准库 json（orjson 不接受 NaN/Infinity，且会把超过 64 位的整数读成浮点数）。
+orjson 无法原样写出的数据（NaN/Infinity、超过 64 位的整数）改由标准库 json 写出，
+保证文件内容与 json.dump(ensure_ascii=False, indent=2) 兼容、可无损读回。
+msgpack 格式需要 ormsgpack。
+"""
+
+import json
+import math
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 可选依赖
+    orjson = None
+
+try:
+    import ormsgpack
+except ImportError:  # pragma: no cover - 可选依赖
+    ormsgpack = None
+
+JSON_FORMAT = 'json'
+MSGPACK_FORMAT = 'msgpack'
+MSGPACK_EXTENSIONS = ('.msgpack', '.mpk')
+
+
+def _default(obj: Any) -> Any:
+    """编码器无法直接处理的对象：枚举取值、时间转 ISO 字符串、模型对象转字典"""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is not None:
+        return to_dict()
+    tolist = getattr(obj, 'tolist', None)  # NumPy 数组与标量（标准库 json 编码时）
+    if tolist is not None:
+        return tolist()
+    raise TypeError(f"无法序列化类型 {type(obj).__name__}")
+
+
+def _has_non_finite(data: Any) -> bool:
+    """数据中是否含有 NaN/Infinity（orjson 会把它们写成 null）"""
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, float):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, (str, int, type(None))):
+            continue
+        elif getattr(obj, 'dtype', None) is not None:
+            import numpy as np
+
+            if obj.dtype.kind in 'fc' and not np.isfinite(obj).all():
+                return True
+        else:
+            try:
+                stack.append(_default(obj))
+            except TypeError:
+                continue
+    return False
+
+
+def format_for_path(file_path: str) -> str:
+    """根据文件扩展名选择序列化格式"""
+    return MSGPACK_FORMAT if file_path.lower().endswith(MSGPACK_EXTENSIONS) else JSON_FORMAT
+
+
+def serialize(data: Any, fmt: str = JSON_FORMAT) -> bytes:
+    """将字典（或模型对象）编码为字节串"""
+    if fmt == MSGPACK_FORMAT:
+        if ormsgpack is None:
+            raise RuntimeError("未安装 ormsgpack，无法使用 msgpack 格式")
+        return ormsgpack.packb(data, default=_default,
+                               option=ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_SERIALIZE_NUMPY)
+
+    if orjson is not None:
+        try:
+            buf = orjson.dumps(data, default=_default,
+                               option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            buf = None  # 超过 64 位的整数等，交给标准库 json（其他类型错误由 json 照常抛出）
+        # NaN/Infinity 只会以 null 出现，输出中没有 null 时无需检查
+        if buf is not None and (b'null' not in buf or not _has_non_finite(data)):
+            return buf
+    return json.dumps(data, default=_default, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def deserialize(buf: bytes, fmt: str = JSON_FORMAT) -> Any:
+    """将字节串解码为字典，之后由调用方交给 from_dict 加载"""
+    if fmt == MSGPACK_FORMAT:
+        if ormsgpack is None:
+            raise RuntimeError("未安装 ormsgpack，无法读取 msgpack 格式")
+        return ormsgpack.unpackb(buf)
+
+    return json.loads(buf.decode('utf-8'))
@@ -0,0 +1,108 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.analysis.interface_batch import InterfaceBatch
+from src.models.interface_model import (
+    FailureMode,
+    Interface,
+    InterfaceFailureMode,
+    TriggerCondition,
+)
+
+
+def _threshold_interface(variable: str, operator: str, value: float) -> Interface:
+    interface = Interface(f"{variable}接口", "批量仿真测试")
+    failure_mode = InterfaceFailureMode(FailureMode.TIMEOUT, f"{variable}越限")
+    condition = TriggerCondition("阈值", "threshold")
+    condition.parameters = {"variable": variable, "operator": operator, "value": value}
+    failure_mode.add_trigger_condition(condition)
+    interface.add_failure_mode(failure_mode)
+    interface.reset_runtime_state()
+    return interface
+
+
+def test_batch_step_matches_per_interface_state_machine():
+    interfaces = [
+        _threshold_interface("latency", ">", 50),
+        _threshold_interface("latency", ">", 50),
+        _threshold_interface("health", "<", 0.5),
+        _threshold_interface("health", "<", 0.5),
+    ]
+    inputs = [{"latency": 80}, {"latency": 10}, {"health": 0.2}, {}]
+
+    batch = InterfaceBatch(interfaces)
+    transitioned = batch.step(batch.values_from_inputs(inputs))
+
+    expected = []
+    for interface, interface_inputs in zip(interfaces, inputs):
+        reference = interface.instantiate_from_template()
+        reference.current_state_id = reference.normal_state_id
+        result = reference.step_state_machine({"inputs": interface_inputs})
+        expected.append(result["transition"] is not None)
+
+    assert transitioned.tolist() == expected == [True, False, True, False]
+
+    batch.sync_to_interfaces()
+    assert interfaces[0].current_state_id == interfaces[0].failure_modes[0].associated_state_id
+    assert interfaces[1].current_state_id == interfaces[1].normal_state_id
+
+
+def test_batch_rejects_non_threshold_conditions():
+    interface = _threshold_interface("latency", ">", 50)
+    probability = TriggerCondition("随机", "probability")
+    probability.parameters = {"p": 0.5}
+    interface.failure_modes[0].add_trigger_condition(probability)
+    interface.add_failure_mode(interface.failure_modes[0])
+
+    assert not InterfaceBatch.supports(interface)
+    with pytest.raises(ValueError):
+        InterfaceBatch([interface])
+
+
+def test_fast_failure_check_matches_probability_and_threshold_triggers():
+    interface = _threshold_interface("latency", ">", 50)
+    always = InterfaceFailureMode(FailureMode.HARDWARE_FAULT, "必然故障")
+    certain = TriggerCondition("必然", "probability")
+    certain.parameters = {"p": 1.0}
+    always.add_trigger_condition(certain)
+    never = InterfaceFailureMode(FailureMode.SOFTWARE_BUG, "不会发生")
+    impossible = TriggerCondition("不可能", "probability")
+    impossible.parameters = {"p": 0.0}
+    never.add_trigger_condition(impossible)
+    interface.add_failure_mode(always)
+    interface.add_failure_mode(never)
+
+    context = {"inputs": {"latency": 80}}
+    rng = np.random.default_rng(0)
+    fired = interface.check_failure_conditions_fast(context, rng)
+    expected = interface.check_failure_conditions({"inputs": {"latency": 80}})
+    assert [fm.name for fm in fired] == [fm.name for fm in expected]
+    assert context["runtime"][f"prob_{certain.id}"]["activations"] == 1
+
+    interface.remove_failure_mode("必然故障")
+    fired = interface.check_failure_conditions_fast({"inputs": {"latency": 10}}, rng)
+    assert fired == []
+
+
+def test_fast_failure_check_rebuilds_after_trigger_edits():
+    interface = Interface("快照")
+    failure_mode = InterfaceFailureMode(FailureMode.TIMEOUT, "t")
+    condition = TriggerCondition("概率", "probability")
+    condition.parameters = {"p": 1.0}
+    failure_mode.add_trigger_condition(condition)
+    interface.add_failure_mode(failure_mode)
+    rng = np.random.default_rng(0)
+    assert [fm.name for fm in interface.check_failure_conditions_fast({}, rng)] == ["t"]
+
+    condition.parameters["p"] = 0.0  # 原地修改参数
+    assert interface.check_failure_conditions_fast({}, rng) == interface.check_failure_conditions({}) == []
+
+    condition.parameters["p"] = 1.0
+    condition.enabled = False
+    assert interface.check_failure_conditions_fast({}, rng) == []
+
+    extra = TriggerCondition("必然", "probability")
+    extra.parameters = {"p": 1.0}
+    failure_mode.add_trigger_condition(extra)
+    assert [fm.name for fm in interface.check_failure_conditions_fast({}, rng)] == ["t"]
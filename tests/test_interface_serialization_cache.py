@@ -0,0 +1,120 @@
+import copy
+
+from src.models.interface_model import (
+    FailureMode,
+    Interface,
+    InterfaceFailureMode,
+    TriggerCondition,
+)
+
+
+def _make_interface() -> Interface:
+    interface = Interface("缓存接口", "用于测试序列化缓存")
+    failure_mode = InterfaceFailureMode(FailureMode.TIMEOUT, "超时")
+    condition = TriggerCondition("高延迟", "threshold")
+    condition.parameters = {"variable": "latency", "operator": ">", "value": 50}
+    failure_mode.add_trigger_condition(condition)
+    interface.add_failure_mode(failure_mode)
+    return interface
+
+
+def test_to_dict_reuses_cache_until_attribute_changes():
+    interface = _make_interface()
+    first = interface.to_dict()
+    cache = interface._dict_cache
+    assert interface.to_dict() == first and interface._dict_cache is cache
+
+    interface.protocol = "CAN"
+    second = interface.to_dict()
+    assert interface._dict_cache is not cache
+    assert second["protocol"] == "CAN"
+
+
+def test_to_dict_returns_independent_dicts():
+    interface = _make_interface()
+    data = interface.to_dict()
+    data["name"] = "HACK"
+    data["failure_modes"][0]["name"] = "HACK"
+    data["failure_modes"][0]["trigger_conditions"].clear()
+    data["state_machine"]["states"].clear()
+    fresh = interface.to_dict()
+    assert fresh["name"] == "缓存接口"
+    assert fresh["failure_modes"][0]["name"] == "超时"
+    assert fresh["failure_modes"][0]["trigger_conditions"]
+    assert fresh["state_machine"]["states"]
+
+
+def test_to_dict_cache_tracks_nested_changes():
+    interface = _make_interface()
+    first = interface.to_dict()
+
+    condition = interface.failure_modes[0].trigger_conditions[0]
+    condition.python_code = "result = True"
+    refreshed = interface.to_dict()
+    assert refreshed is not first
+    assert refreshed["failure_modes"][0]["trigger_conditions"][0]["python_code"] == "result = True"
+
+    interface.failure_modes.append(InterfaceFailureMode(FailureMode.DATA_CORRUPTION, "数据损坏"))
+    assert len(interface.to_dict()["failure_modes"]) == 2
+
+
+def test_clone_does_not_mutate_cached_dict():
+    interface = _make_interface()
+    original_id = interface.to_dict()["id"]
+    clone = interface.clone()
+    assert clone.id != original_id
+    assert interface.to_dict()["id"] == original_id
+
+
+def test_remove_failure_mode_purges_transitions_in_place():
+    interface = _make_interface()
+    transitions = interface.transitions
+    assert transitions
+    cached = interface.to_dict()
+
+    interface.remove_failure_mode("超时")
+    assert interface.transitions is transitions
+    assert interface.transitions == []
+    assert interface.failure_state_map == {}
+    assert interface.to_dict() != cached
+    assert interface.to_dict()["state_machine"]["transitions"] == []
+
+
+def test_state_machine_value_objects_use_slots():
+    interface = _make_interface()
+    failure_mode = interface.failure_modes[0]
+    objects = [failure_mode, failure_mode.trigger_conditions[0]]
+    objects += list(interface.states.values()) + interface.transitions
+    for obj in objects:
+        assert not hasattr(obj, "__dict__")
+
+    copied = copy.deepcopy(failure_mode)
+    assert copied.to_dict() == failure_mode.to_dict()
+    assert failure_mode.rpn() == copied.rpn()
+
+
+def test_module_to_dict_cache_tracks_position_and_interfaces():
+    from src.models.module_model import HardwareModule
+
+    module = HardwareModule("IMU")
+    first = module.to_dict()
+    cache = module._dict_cache
+    assert module.to_dict() == first
+
+    module.position.x = 42
+    moved = module.to_dict()
+    assert moved["position"]["x"] == 42
+    assert module._dict_cache is cache
+    moved["manufacturer"] = "HACK"
+    assert module.to_dict()["manufacturer"] == ""
+
+    interface = Interface("数据")
+    module.add_interface(interface)
+    assert interface.id in module.to_dict()["interfaces"]
+    interface.protocol = "CAN"
+    assert module.to_dict()["interfaces"][interface.id]["protocol"] == "CAN"
+
+    module.set_parameter("gain", 2)
+    module.manufacturer = "ACME"
+    data = module.to_dict()
+    assert data["parameters"] == {"gain": 2} and data["manufacturer"] == "ACME"
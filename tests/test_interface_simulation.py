@@ -0,0 +1,216 @@
+import logging
+import math
+
+import pytest
+
+from src.models._numeric_code import numeric_kernel
+from src.models.interface_model import Interface
+
+
+def test_simulate_interface_reuses_exec_namespace_without_leaking_state():
+    interface = Interface("仿真接口", "用于测试仿真执行")
+    interface.python_code = (
+        "outputs['doubled'] = inputs['value'] * 2\n"
+        "inputs['value'] = -1\n"
+    )
+
+    caller_inputs = {"value": 3}
+    first = interface.simulate_interface(caller_inputs)
+    second = interface.simulate_interface({"value": 5})
+
+    assert first["doubled"] == 6
+    assert second["doubled"] == 10
+    # 用户代码修改的是输入副本，不影响调用方
+    assert caller_inputs == {"value": 3}
+    assert interface._exec_locals == {}
+
+
+def test_python_code_is_compiled_once_and_recompiled_on_change():
+    interface = Interface("编译缓存接口")
+    interface.python_code = "outputs['v'] = [inputs['x'] + 1]"
+    interface.simulate_interface({"x": 1})
+    compiled = interface._compiled
+    interface.simulate_interface({"x": 2})
+    assert interface._compiled is compiled
+
+    interface.python_code = "outputs['v'] = [inputs['x'] * 10]"
+    assert interface.simulate_interface({"x": 2})["v"] == [20]
+    assert interface._compiled is not compiled
+
+
+NUMERIC_CODE = (
+    "import math\n"
+    "gain = parameters['gain']\n"
+    "outputs['latency_ms'] = inputs['latency'] * gain + 1\n"
+    "outputs['rms'] = math.sqrt(inputs['latency'] ** 2 + inputs['jitter'] ** 2)\n"
+    "outputs['latency_ms'] += max(inputs['jitter'], 0)\n"
+)
+
+
+def test_numeric_python_code_matches_exec():
+    interface = Interface("数值接口")
+    interface.parameters = {"gain": 2.0}
+    interface.python_code = NUMERIC_CODE
+    inputs = {"latency": 3.0, "jitter": 4.0}
+
+    kernel = numeric_kernel(NUMERIC_CODE)
+    assert kernel is not None
+    assert kernel.input_names == ("latency", "jitter")
+    outputs = interface.simulate_interface(inputs)
+    assert outputs["latency_ms"] == 11.0
+    assert outputs["rms"] == 5.0
+    assert interface._compiled is None
+
+    # 非数值输入回退到 exec，结果一致
+    fallback = interface.simulate_interface({"latency": 3, "jitter": 4, "extra": "x"})
+    assert fallback["latency_ms"] == 11.0
+    string_input = interface.simulate_interface({"latency": "3", "jitter": 4.0})
+    assert "latency_ms" not in string_input
+    assert interface._compiled is not None
+
+
+def test_non_numeric_code_is_not_rewritten():
+    assert numeric_kernel("outputs['status'] = 'ok'") is None
+    assert numeric_kernel("outputs['x'] = inputs.get('x', 0)") is None
+    assert numeric_kernel("if inputs['x'] > 1:\n    outputs['y'] = 1") is None
+    assert numeric_kernel("y = inputs['x'] + 1") is None
+
+
+def test_numeric_kernel_only_accepts_names_exec_provides():
+    # 未导入 math 时 exec 会抛出 NameError，改写器同样不接受，交由 exec 报错
+    assert numeric_kernel("outputs['y'] = sqrt(inputs['x'])") is None
+    assert numeric_kernel("outputs['y'] = math.sqrt(inputs['x'])") is None
+    assert numeric_kernel("outputs['y'] = inputs['x'] * pi") is None
+    assert numeric_kernel("import math\noutputs['y'] = math.abs(inputs['x'])") is None
+    assert numeric_kernel("outputs['y'] = sqrt(inputs['x'])\nfrom math import sqrt") is None
+
+    kernel = numeric_kernel("from math import sqrt, pi as PI\noutputs['y'] = sqrt(inputs['x']) * PI")
+    assert kernel.run({"x": 4.0}, {}) == {"y": 2 * math.pi}
+    kernel = numeric_kernel("import math\noutputs['y'] = abs(inputs['x']) * math.e")
+    assert kernel.run({"x": -1.0}, {}) == {"y": math.e}
+
+
+def test_numeric_kernel_batch_matches_scalar():
+    np = pytest.importorskip("numpy")
+    kernel = numeric_kernel(NUMERIC_CODE)
+    samples = np.array([[3.0, 4.0], [1.0, -2.0], [0.0, 0.5]])
+    batch = kernel.run_batch(samples, {"gain": 2.0})
+    for row, (latency, jitter) in enumerate(samples):
+        scalar = kernel.run({"latency": latency, "jitter": jitter}, {"gain": 2.0})
+        assert math.isclose(batch["latency_ms"][row], scalar["latency_ms"])
+        assert math.isclose(batch["rms"][row], scalar["rms"])
+
+
+def test_trigger_and_module_reuse_exec_namespace():
+    from src.models.interface_model import TriggerCondition
+    from src.models.module_model import Module
+
+    condition = TriggerCondition("代码条件")
+    condition.python_code = "result = context['inputs']['x'] > parameters['limit']"
+    condition.parameters = {"limit": 1}
+    assert condition.evaluate({"inputs": {"x": 2}}) is True
+    assert condition.evaluate({"inputs": {"x": 0}}) is False
+    assert condition._exec_locals == {}
+
+    module = Module("代码模块")
+    module.python_code = "outputs['name'] = str(inputs['x'])"
+    assert module.execute_python_code({"x": 1}) == {"name": "1"}
+    assert module.execute_python_code({"x": 2}) == {"name": "2"}
+    assert module._exec_locals == {}
+
+
+def test_read_only_code_skips_input_copy():
+    from src.models._code_analysis import is_read_only
+
+    assert is_read_only("outputs['y'] = float(inputs.get('x', 0)) * 2")
+    assert not is_read_only("outputs['payload'] = inputs['data']")
+    assert not is_read_only("items = inputs['items']\nitems.append(1)")
+
+    interface = Interface("只读接口")
+    interface.python_code = "outputs['seen'] = [len(inputs['items'])]"
+    caller_inputs = {"items": [1, 2]}
+    assert interface.simulate_interface(caller_inputs)["seen"] == [2]
+    assert interface._inputs_read_only is True
+    assert caller_inputs == {"items": [1, 2]}
+
+
+def test_repeated_code_errors_are_rate_limited(caplog):
+    from src.models.base_model import CODE_ERROR_LOG_LIMIT
+    from src.models.module_model import Module
+
+    module = Module("故障模块")
+    module.python_code = "outputs['y'] = inputs['missing'] + undefined_name"
+    with caplog.at_level(logging.WARNING, logger="src.models.module_model"):
+        for _ in range(CODE_ERROR_LOG_LIMIT * 3):
+            assert module.execute_python_code({}) == {}
+    warnings = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert len(warnings) == CODE_ERROR_LOG_LIMIT
+    assert warnings[0].exc_info is not None
+
+
+def test_module_batch_execution_matches_single_calls():
+    np = pytest.importorskip("numpy")
+    from src.models.module_model import Module
+
+    module = Module("批量模块")
+    module.python_code = NUMERIC_CODE
+    module.parameters = {"gain": 2.0, "numba": True}
+    latency = np.array([3.0, 1.0, 0.0])
+    jitter = np.array([4.0, -2.0, 0.5])
+    batch = module.execute_python_code_batch({"latency": latency, "jitter": jitter})
+    for row in range(3):
+        single = module.execute_python_code({"latency": latency[row], "jitter": jitter[row]})
+        assert math.isclose(batch["rms"][row], single["rms"])
+
+    module.python_code = "outputs['label'] = str(inputs['latency'])"
+    assert module.execute_python_code_batch({"latency": latency}) is None
+
+
+def test_njit_marker_requests_numba_batch_path():
+    np = pytest.importorskip("numpy")
+    from src.models._numeric_code import numeric_kernel
+    from src.models.module_model import Module
+
+    assert not numeric_kernel(NUMERIC_CODE).prefers_numba
+    marked = "# @njit\n" + NUMERIC_CODE
+    assert numeric_kernel(marked).prefers_numba
+    assert not numeric_kernel("outputs['y'] = inputs['x']  # 不是 @njit 标记\n").prefers_numba
+
+    module = Module("标记模块")
+    module.python_code = marked
+    module.parameters = {"gain": 2.0}
+    batch = module.execute_python_code_batch({"latency": np.array([3.0]), "jitter": np.array([4.0])})
+    single = module.execute_python_code({"latency": 3.0, "jitter": 4.0})
+    assert math.isclose(batch["rms"][0], single["rms"])
+
+
+def test_exec_globals_are_shared_unless_code_writes_globals():
+    from src.models.base_model import EXEC_GLOBALS, compile_python_code, exec_globals
+    from src.models.module_model import Module
+
+    plain = compile_python_code("outputs['y'] = max(1, 2)")
+    assert exec_globals(plain) is EXEC_GLOBALS
+    writer = compile_python_code("def f():\n    global leaked\n    leaked = 1\nf()")
+    assert exec_globals(writer) is not EXEC_GLOBALS
+
+    module = Module("全局写入")
+    module.python_code = "global counter\ncounter = 1\noutputs['ok'] = True"
+    assert module.execute_python_code({}) == {"ok": True}
+    assert "counter" not in EXEC_GLOBALS
+    assert set(EXEC_GLOBALS) == {"__builtins__"}
+
+
+def test_code_error_counts_are_bounded_and_reset_per_run(caplog):
+    from src.models import base_model
+    from src.models.system_model import SystemStructure
+
+    for index in range(base_model.CODE_ERROR_KEYS_LIMIT + 10):
+        try:
+            raise ValueError(index)
+        except ValueError:
+            base_model.log_code_error(logging.getLogger("test.code_errors"), f"source {index}", "出错")
+    assert len(base_model._code_error_counts) == base_model.CODE_ERROR_KEYS_LIMIT
+    assert "source 0" not in base_model._code_error_counts
+
+    SystemStructure("系统").simulate_system()
+    assert not base_model._code_error_counts
@@ -14,11 +14,13 @@ from src.models.interface_model import (
     InterfaceFailureMode,
     InterfaceState,
     InterfaceStateType,
+    InterfaceTransition,
     InterfaceType,
     FailureMode,
     TriggerCondition,
 )
-from src.models.module_model import Module
+from src.models.environment_model import StressFactor, StressType
+from src.models.module_model import AlgorithmModule, HardwareModule, Module, SoftwareModule
 from src.models.system_model import (
     Connection,
     EnvironmentModel,
@@ -30,6 +32,8 @@ from src.models.system_model import (
 from src.models.task_profile_model import (
     ComparisonOperator,
     SuccessCriteria,
+    SuccessCriteriaType,
+    TaskPhase,
     TaskProfile,
 )
 from src.core.fault_tree_generator import FaultTreeGenerator
@@ -91,6 +95,69 @@ def test_interface_state_machine_and_instantiation(interface_with_failure):
     assert instance.failure_modes[0] is not failure_mode
 
 
+def test_interface_round_trip_sync_is_idempotent(interface_with_failure):
+    interface, failure_mode, _ = interface_with_failure
+    restored = Interface()
+    restored.from_dict(interface.to_dict())
+
+    # 反序列化后状态机已同步，重复同步不产生重复转换
+    assert len(restored.transitions) == len(interface.transitions)
+    restored._sync_state_machine_with_failure_modes()
+    assert len(restored.transitions) == len(interface.transitions)
+
+    # 失效模式集合变化后重新同步会补齐缺失的转换
+    extra = InterfaceFailureMode(FailureMode.DATA_CORRUPTION, "数据损坏")
+    extra.add_trigger_condition(TriggerCondition("校验失败", "event"))
+    restored.failure_modes.append(extra)
+    restored._sync_state_machine_with_failure_modes()
+    assert len(restored.transitions) == len(interface.transitions) + 1
+    restored._sync_state_machine_with_failure_modes()
+    restored.remove_failure_mode("不存在")
+    restored.add_failure_mode(extra)
+    assert len(restored.transitions) == len(interface.transitions) + 1
+
+
+def test_failure_modes_and_triggers_keep_authored_order():
+    interface = Interface("排序接口")
+    rare = InterfaceFailureMode(FailureMode.HARDWARE_FAULT, "罕见")
+    rare.occurrence_rate = 1.0
+    frequent = InterfaceFailureMode(FailureMode.TIMEOUT, "频发")
+    frequent.occurrence_rate = 8.0
+
+    unlikely = TriggerCondition("低概率", "probability")
+    unlikely.probability = 0.1
+    likely = TriggerCondition("高概率", "probability")
+    likely.probability = 0.9
+    frequent.add_trigger_condition(unlikely)
+    frequent.add_trigger_condition(likely)
+
+    interface.add_failure_mode(rare)
+    interface.add_failure_mode(frequent)
+    assert [fm.name for fm in interface.failure_modes] == ["罕见", "频发"]
+    assert [c.name for c in frequent.trigger_conditions] == ["低概率", "高概率"]
+
+    restored = Interface()
+    restored.from_dict(interface.to_dict())
+    assert [fm.name for fm in restored.failure_modes] == ["罕见", "频发"]
+    assert [c.name for c in restored.failure_modes[1].trigger_conditions] == ["低概率", "高概率"]
+
+
+def test_from_dict_falls_back_on_unknown_enum_values(interface_with_failure):
+    interface, _, _ = interface_with_failure
+    data = dict(interface.to_dict())
+    data.update(interface_type="unknown", direction="sideways", subtype="sensor")
+    restored = Interface()
+    restored.from_dict(data)
+    assert restored.interface_type == InterfaceType.SOFTWARE_HARDWARE
+    assert restored.direction == InterfaceDirection.BIDIRECTIONAL
+    assert restored.subtype is None
+
+    module = Module("枚举模块")
+    module.from_dict({"module_type": "software", "template": "no_such_template"})
+    assert module.module_type.value == "software"
+    assert module.template is None
+
+
 def test_module_execution_and_serialization(interface_with_failure):
     interface, failure_mode, _ = interface_with_failure
 
@@ -251,3 +318,850 @@ def test_fault_tree_generator_handles_duration_only_task_profile():
 
     assert math.isclose(fault_tree.mission_time, legacy_profile.duration / 3600.0)
     assert fault_tree.get_top_event() is not None
+
+
+def test_failure_mode_lookup_tracks_direct_list_edits(interface_with_failure):
+    interface, failure_mode, _ = interface_with_failure
+    assert interface.get_failure_mode("通信超时") is failure_mode
+
+    extra = InterfaceFailureMode(FailureMode.DATA_CORRUPTION, "数据损坏")
+    interface.failure_modes.append(extra)
+    assert interface.get_failure_mode("数据损坏") is extra
+
+    extra.name = "数据篡改"
+    assert interface.get_failure_mode("数据损坏") is None
+    assert interface.get_failure_mode("数据篡改") is extra
+
+    interface.remove_failure_mode("通信超时")
+    assert interface.get_failure_mode("通信超时") is None
+    assert interface.failure_modes == [extra]
+
+
+def test_interfaces_and_modules_use_slots(interface_with_failure):
+    import copy
+
+    from src.models.module_model import AlgorithmModule, HardwareModule, SoftwareModule
+
+    interface, _, _ = interface_with_failure
+    modules = [Module("基础"), HardwareModule("硬件"), SoftwareModule("软件"), AlgorithmModule("算法")]
+    for obj in [interface, *modules]:
+        assert not hasattr(obj, "__dict__")
+
+    modules[1].add_interface(interface)
+    copied = copy.deepcopy(modules[1])
+    assert copied.to_dict() == modules[1].to_dict()
+
+    # 槽位对象（含缓存的连接点视图）可以被 pickle，供多进程分析传递
+    import pickle
+
+    assert modules[1].connection_points
+    restored = pickle.loads(pickle.dumps(modules[1]))
+    assert restored.id == modules[1].id
+    assert restored.to_dict() == modules[1].to_dict()
+
+
+def test_state_history_is_bounded_ring_buffer():
+    interface = Interface("历史接口")
+    interface.parameters = {"history_max": 3}
+    failure_state_id = interface.add_state(InterfaceState("故障", InterfaceStateType.FAILURE))
+    to_failure = TriggerCondition("进入故障", "event")
+    to_failure.parameters = {"event": "fail"}
+    to_normal = TriggerCondition("恢复", "event")
+    to_normal.parameters = {"event": "recover"}
+    interface.add_transition(InterfaceTransition(interface.normal_state_id, failure_state_id, to_failure))
+    interface.add_transition(InterfaceTransition(failure_state_id, interface.normal_state_id, to_normal))
+    interface.reset_runtime_state()
+
+    for _ in range(3):
+        interface.step_state_machine({"events": {"fail"}})
+        interface.step_state_machine({"events": {"recover"}})
+
+    assert len(interface.state_history) == 3
+    history = interface.to_dict()["state_machine"]["state_history"]
+    assert isinstance(history, list) and len(history) == 3
+
+    restored = Interface()
+    restored.from_dict(interface.to_dict())
+    assert list(restored.state_history) == history
+    assert restored.state_history.maxlen == 3
+
+
+def test_module_subclass_fields_round_trip_with_fresh_defaults():
+    hardware = HardwareModule("IMU")
+    hardware.manufacturer = "ACME"
+    hardware.specifications = {"rate": 200}
+    hardware.operating_temperature = (-20, 60)
+    restored = HardwareModule()
+    restored.from_dict(hardware.to_dict())
+    assert restored.manufacturer == "ACME"
+    assert (restored.op_temp_min, restored.op_temp_max) == (-20.0, 60.0)
+    assert HardwareModule.from_dict_cls({"operating_temperature": [-10, 50]}).operating_temperature == (-10.0, 50.0)
+    # 无效的温度范围回退到默认值，不影响加载
+    for invalid in (None, [None, 85], "-40~85", [1, 2, 3]):
+        assert HardwareModule.from_dict_cls({"operating_temperature": invalid}).operating_temperature == (-40.0, 85.0)
+    assert restored.specifications == {"rate": 200}
+
+    first, second = SoftwareModule(), AlgorithmModule()
+    first.from_dict({"name": "a"})
+    second.from_dict({"name": "b"})
+    assert first.dependencies == [] and first.software_version == "1.0"
+    assert second.model_parameters == {} and second.to_dict()["accuracy"] == 0.0
+    other = SoftwareModule()
+    other.from_dict({"name": "c"})
+    assert other.dependencies is not first.dependencies
+
+
+def test_from_dict_cls_builds_fully_initialised_objects(interface_with_failure):
+    interface, _, _ = interface_with_failure
+    data = interface.to_dict()
+    restored = Interface.from_dict_cls(data)
+    assert restored.to_dict() == data
+
+    transition = InterfaceTransition.from_dict_cls(data["state_machine"]["transitions"][0])
+    assert transition.to_dict() == data["state_machine"]["transitions"][0]
+    transition.priority = 5
+    assert transition.to_dict()["priority"] == 5
+
+
+def test_from_dict_interns_low_cardinality_strings():
+    protocol = "".join(["CAN", "-", "FD"])
+    first = Interface.from_dict_cls({"protocol": protocol, "data_format": "".join(["bin", "ary"])})
+    second = Interface.from_dict_cls({"protocol": "".join(["CAN", "-FD"]), "data_format": "binary"})
+    assert first.protocol is second.protocol
+    assert first.data_format is second.data_format
+
+    hardware = HardwareModule.from_dict_cls({"manufacturer": "".join(["AC", "ME"])})
+    assert hardware.manufacturer is HardwareModule.from_dict_cls({"manufacturer": "ACME"}).manufacturer
+
+    module_id = "".join(["mod", "-1"])
+    system = SystemStructure()
+    system.from_dict({
+        "modules": {module_id: Module("电机").to_dict()},
+        "connections": {"c": {"id": "c", "source_module_id": "".join(["mod-", "1"])}},
+    })
+    criteria = SystemSuccessCriteria()
+    criteria.from_dict({"target_module_id": "".join(["mo", "d-1"]), "target_parameter": "".join(["spe", "ed"])})
+    module_key = next(iter(system.modules))
+    assert module_key is system.modules[module_key].id is system.connections["c"].source_module_id
+    assert criteria.target_module_id is module_key and criteria.target_parameter is sys.intern("speed")
+
+
+def test_state_type_index_tracks_edits(interface_with_failure):
+    interface, _, _ = interface_with_failure
+    failure_ids = [sid for sid, state in interface.states.items() if state.state_type is InterfaceStateType.FAILURE]
+    assert interface.first_state_of_type(InterfaceStateType.FAILURE) == failure_ids[0]
+    assert interface.first_state_of_type(InterfaceStateType.NORMAL) == interface.normal_state_id
+
+    interface.remove_states(failure_ids)
+    assert interface.first_state_of_type(InterfaceStateType.FAILURE) is None
+
+    # 直接修改 states 与改写状态类型后仍能找到
+    extra = InterfaceState("降级", InterfaceStateType.FAILURE)
+    interface.states[extra.id] = extra
+    assert interface.first_state_of_type(InterfaceStateType.FAILURE) == extra.id
+    interface.states[interface.normal_state_id].state_type = InterfaceStateType.FAILURE
+    assert interface.first_state_of_type(InterfaceStateType.NORMAL) is None
+    interface.states[interface.normal_state_id].state_type = InterfaceStateType.NORMAL
+
+    data = interface.to_dict()
+    data["state_machine"]["normal_state_id"] = "missing"
+    restored = Interface.from_dict_cls(data)
+    assert restored.states[restored.normal_state_id].state_type is InterfaceStateType.NORMAL
+
+
+def test_load_module_dispatches_on_module_type():
+    from src.models.module_model import load_module
+
+    software = SoftwareModule("飞控软件")
+    software.programming_language = "C++"
+    loaded = load_module(software.to_dict())
+    assert type(loaded) is SoftwareModule
+    assert loaded.programming_language == "C++"
+    assert type(load_module({"module_type": "algorithm"})) is AlgorithmModule
+    assert type(load_module({})) is HardwareModule
+    assert type(load_module({"module_type": "environment"})) is Module
+
+
+def test_connection_points_are_reused_and_refreshed():
+    module = Module("链路模块")
+    first = Interface("输入", direction=InterfaceDirection.INPUT)
+    module.add_interface(first)
+    points = module.connection_points
+    assert module.connection_points is points
+    assert points[0].connection_type == "input"
+    assert not hasattr(points[0], "__dict__")
+
+    first.direction = InterfaceDirection.OUTPUT
+    first.name = "输出"
+    assert module.connection_points[0].connection_type == "output"
+    assert module.connection_points[0].name == "输出"
+
+    second = Interface("双向")
+    module.add_interface(second)
+    assert [cp.id for cp in module.connection_points] == [first.id, second.id]
+    module.remove_interface(first.id)
+    assert [cp.connection_type for cp in module.connection_points] == ["bidirectional"]
+
+
+def test_add_connection_point_copies_parameters():
+    from src.models.base_model import ConnectionPoint
+
+    point = ConnectionPoint("旧连接点", connection_type="output")
+    point.parameters = {"limits": [1, 2], "meta": {"unit": "V"}, "pair": (1, [2])}
+    interface = Module("旧模块").add_connection_point(point)
+    assert interface.direction is InterfaceDirection.OUTPUT
+    assert interface.parameters["limits"] == [1, 2]
+    assert interface.parameters["limits"] is not point.parameters["limits"]
+    assert interface.parameters["meta"] is not point.parameters["meta"]
+    assert interface.parameters["pair"][1] is not point.parameters["pair"][1]
+    assert "legacy_connection_point" not in point.parameters
+
+
+def test_module_from_dict_falls_back_on_unknown_enum_values():
+    from src.models.module_model import ModuleTemplate, ModuleType
+
+    module = Module.from_dict_cls({"module_type": "quantum", "template": "unknown"})
+    assert module.module_type is ModuleType.HARDWARE
+    assert module.template is None
+    module = Module.from_dict_cls({"module_type": "software", "template": "middleware"})
+    assert module.module_type is ModuleType.SOFTWARE
+    assert module.template is ModuleTemplate.MIDDLEWARE
+
+
+def test_legacy_connection_points_map_directions():
+    module = Module.from_dict_cls({"connection_points": [
+        {"name": "入", "connection_type": "input"},
+        {"name": "出", "connection_type": "output"},
+        {"name": "双", "connection_type": "bidirectional"},
+        {"name": "缺省"},
+    ]})
+    directions = [interface.direction for interface in module.interfaces.values()]
+    assert directions == [InterfaceDirection.INPUT, InterfaceDirection.OUTPUT,
+                          InterfaceDirection.BIDIRECTIONAL, InterfaceDirection.INPUT]
+    assert [cp.connection_type for cp in module.connection_points] == ["input", "output", "bidirectional", "input"]
+
+
+def test_point_from_mapping_and_slots():
+    from src.models.base_model import Point
+
+    point = Point.from_mapping({"x": 3})
+    assert (point.x, point.y) == (3, 0.0)
+    assert not hasattr(point, "__dict__")
+    module = Module.from_dict_cls({"position": {"x": 5, "y": 6}})
+    assert (module.position.x, module.position.y, module.size.x, module.size.y) == (5, 6, 100, 60)
+
+
+def test_default_module_ids_are_not_reused_after_collection():
+    seen = set()
+    for _ in range(50):
+        seen.add(Module("临时").id)  # 对象随即被回收，内存地址可能复用
+    assert len(seen) == 50
+
+
+def test_to_dict_many_matches_individual_serialization():
+    modules = [HardwareModule("硬件"), SoftwareModule("软件"), Module("基础")]
+    batch = Module.to_dict_many(modules)
+    assert batch == [module.to_dict() for module in modules]
+    assert batch[0] is not modules[0].to_dict()
+
+
+def test_from_dict_defaults_are_fresh_and_keep_given_values():
+    base = {"id": "fixed", "created_time": "2024-01-02T03:04:05"}
+    module = Module.from_dict_cls(base)
+    assert module.id == "fixed"
+    assert module.created_time.year == 2024
+    first, second = Module.from_dict_cls({}), Module.from_dict_cls({})
+    assert first.id != second.id
+    assert first.parameters == {} and first.parameters is not second.parameters
+    state = InterfaceState.from_dict_cls({})
+    assert state.id and state.id != InterfaceState.from_dict_cls({}).id
+
+
+def test_module_clone_copies_parameters_once():
+    original = HardwareModule("原始")
+    original.parameters = {"gain": 1.0, "limits": [0, 10]}
+    original.state_variables = {"mode": "idle"}
+    cloned = original.clone()
+    assert cloned.id != original.id
+    assert cloned._parameters is not original._parameters
+    assert cloned.parameters["limits"] is not original.parameters["limits"]
+    # 读取不再触发拷贝
+    assert original.parameters is original.parameters
+    assert cloned.get_parameter("gain") == 1.0
+
+    cloned.set_parameter("gain", 2.0)
+    cloned.parameters["limits"].append(20)
+    assert original.get_parameter("gain") == 1.0
+    assert original.parameters["limits"] == [0, 10]
+    assert cloned.to_dict()["parameters"] == {"gain": 2.0, "limits": [0, 10, 20]}
+
+    original.state_variables["mode"] = "run"
+    assert cloned.get_state_variable("mode") == "idle"
+    assert original.to_dict()["state_variables"] == {"mode": "run"}
+
+
+def test_module_getters_follow_replaced_dicts():
+    module = HardwareModule("参数")
+    module.parameters = {"gain": 1.5}
+    assert module.get_parameter("gain") == 1.5
+    assert module.get_parameter("missing", 7) == 7
+
+    module.from_dict({**module.to_dict(), "parameters": {"gain": 3.0}, "state_variables": {"mode": "run"}})
+    assert module.get_parameter("gain") == 3.0
+    assert module.get_state_variable("mode") == "run"
+
+    cloned = module.clone()
+    cloned.parameters["gain"] = 4.0  # 克隆对象持有自有副本，读取方法随之指向该副本
+    assert cloned.get_parameter("gain") == 4.0
+    assert module.get_parameter("gain") == 3.0
+
+
+def test_success_criteria_code_is_compiled_once():
+    state = {"m": {"speed": 3}}
+    criteria = SystemSuccessCriteria("脚本判据")
+    criteria.python_code = "result = system_state['m']['speed'] > 2"
+    assert criteria.evaluate(state)
+    function = criteria._code.function
+    assert criteria.evaluate(state) and criteria._code.function is function
+
+    criteria.from_dict({**criteria.to_dict(), "python_code": "result = system_state['m']['speed'] > 5"})
+    assert not criteria.evaluate(state)
+    assert criteria._code.function is not function
+
+    detailed = SuccessCriteria("自定义")
+    detailed.criteria_type = SuccessCriteriaType.CUSTOM_CONDITION
+    detailed.python_code = "result = 'm' in system_state"
+    assert detailed.evaluate(state) and detailed.evaluate({}) is False
+
+
+@pytest.mark.parametrize(
+    ("operator", "expected"),
+    [
+        (ComparisonOperator.EQUAL, False),
+        (ComparisonOperator.NOT_EQUAL, True),
+        (ComparisonOperator.GREATER, True),
+        (ComparisonOperator.GREATER_EQUAL, True),
+        (ComparisonOperator.LESS, False),
+        (ComparisonOperator.LESS_EQUAL, False),
+        (ComparisonOperator.IN_RANGE, True),
+        (ComparisonOperator.OUT_RANGE, False),
+    ],
+)
+def test_detailed_criteria_operators(operator, expected):
+    criteria = SuccessCriteria("速度")
+    criteria.module_id, criteria.parameter_name = "m", "speed"
+    criteria.operator = operator
+    criteria.target_value, criteria.range_min, criteria.range_max = 5, 0, 10
+    assert criteria.evaluate({"m": {"speed": 7}}) is expected
+
+
+def test_detailed_criteria_missing_values_fail_but_none_is_compared():
+    criteria = SuccessCriteria("速度")
+    criteria.module_id, criteria.parameter_name = "m", "speed"
+    criteria.operator = ComparisonOperator.NOT_EQUAL
+    assert criteria.evaluate({}) is False
+    assert criteria.evaluate({"m": {}}) is False
+    assert criteria.evaluate({"m": {"speed": None}}) is True
+
+
+def test_detailed_profile_json_bytes_match_serialized_dict():
+    from src.utils.serialization import deserialize, serialize
+
+    profile = TaskProfile("巡航", "巡航任务")
+    criteria = SuccessCriteria("速度")
+    criteria.operator = ComparisonOperator.IN_RANGE
+    profile.add_success_criteria(criteria)
+    profile.add_task_phase(TaskPhase("起飞"))
+    profile.environment_conditions = {"风速": 5}
+
+    encoded = profile.to_json_bytes()
+    assert encoded == serialize(profile.to_dict())
+    assert deserialize(encoded)["success_criteria"][0]["operator"] == "in_range"
+
+
+def test_task_profile_templates_are_read_only_and_instantiate_fresh_objects():
+    from src.models.task_profile_model import TASK_PROFILE_TEMPLATES, create_profile_from_template
+
+    with pytest.raises(TypeError):
+        TASK_PROFILE_TEMPLATES["新模板"] = {}
+    first = create_profile_from_template("无人机巡航任务")
+    second = create_profile_from_template("无人机巡航任务")
+    assert first.id != second.id
+    assert first.success_criteria[0] is not second.success_criteria[0]
+    assert first.get_success_criteria("飞行高度维持").operator is ComparisonOperator.IN_RANGE
+    first.task_phases[0].conditions.append("风速<10")
+    assert create_profile_from_template("无人机巡航任务").task_phases[0].conditions == []
+
+
+def test_detailed_criteria_and_phases_use_slots():
+    for obj in (SuccessCriteria("速度"), TaskPhase("起飞")):
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown_field = 1
+
+
+def test_detailed_profile_batch_evaluation_in_worker_processes():
+    profile = TaskProfile("巡航")
+    threshold = SuccessCriteria("速度")
+    threshold.module_id, threshold.parameter_name, threshold.target_value = "m", "speed", 5
+    custom = SuccessCriteria("自定义")
+    custom.criteria_type = SuccessCriteriaType.CUSTOM_CONDITION
+    custom.python_code = "result = system_state['m']['speed'] % 2 == 0"
+    profile.add_success_criteria(threshold)
+    profile.add_success_criteria(custom)
+    states = [{"m": {"speed": speed}} for speed in range(10)]
+    # 先在本进程评估一次，自定义代码已包装为函数，传入工作进程前需丢弃
+    expected = [profile.evaluate_success(state) for state in states]
+
+    assert profile.evaluate_success_batch(states) == expected
+    assert profile.evaluate_success_batch(states, max_workers=2) == expected
+
+
+def test_detailed_criteria_errors_are_logged(caplog):
+    import logging
+
+    criteria = SuccessCriteria("坏判据")
+    criteria.criteria_type = SuccessCriteriaType.CUSTOM_CONDITION
+    criteria.python_code = "result = undefined_name > 0"
+    with caplog.at_level(logging.WARNING, logger="src.models.task_profile_model"):
+        assert criteria.evaluate({}) is False
+    assert "坏判据" in caplog.records[0].getMessage()
+    assert caplog.records[0].exc_info is not None
+
+
+def test_detailed_criteria_and_phase_from_dict_cls_match_two_phase_load():
+    criteria = SuccessCriteria("自定义")
+    criteria.criteria_type = SuccessCriteriaType.CUSTOM_CONDITION
+    criteria.python_code = "result = system_state['ok']"
+    loaded = SuccessCriteria.from_dict_cls(criteria.to_dict())
+    assert loaded.to_dict() == criteria.to_dict()
+    assert loaded.evaluate({"ok": True}) is True
+
+    phase = TaskPhase("巡航")
+    phase.conditions = ["高度>100"]
+    assert TaskPhase.from_dict_cls(phase.to_dict()).to_dict() == phase.to_dict()
+
+
+def test_detailed_criteria_and_phase_names_are_interned():
+    criteria = SuccessCriteria.from_dict_cls({"name": "".join(["航迹", "精度"]), "module_id": "".join(["na", "v"]),
+                                              "parameter_name": "".join(["err", "or"])})
+    phase = TaskPhase.from_dict_cls({"name": "".join(["巡航", "阶段"])})
+    assert criteria.name is sys.intern("航迹精度") and criteria.module_id is sys.intern("nav")
+    assert criteria.parameter_name is sys.intern("error") and phase.name is sys.intern("巡航阶段")
+
+
+def test_detailed_overall_success_stops_at_first_failure_and_learns_order():
+    profile = TaskProfile("巡航")
+    for name in ("稳", "易失败"):
+        criteria = SuccessCriteria(name)
+        criteria.criteria_type = SuccessCriteriaType.CUSTOM_CONDITION
+        criteria.python_code = f"system_state['calls'].append({name!r})\nresult = system_state[{name!r}]"
+        profile.add_success_criteria(criteria)
+
+    for _ in range(64):
+        state = {"calls": [], "稳": True, "易失败": False}
+        assert profile.evaluate_overall_success(state) is False
+    # 重新排序后先评估失败率高的判据
+    assert state["calls"] == ["易失败"]
+
+    state = {"calls": [], "稳": True, "易失败": True}
+    assert profile.evaluate_overall_success(state) is True
+    assert profile.evaluate_success(dict(state, calls=[]))["overall_success"] is True
+    assert TaskProfile().evaluate_overall_success({}) is True
+
+
+def test_detailed_criteria_from_dict_maps_enum_values():
+    criteria = SuccessCriteria.__new__(SuccessCriteria)
+    criteria.from_dict({"criteria_type": "custom_condition", "operator": "in_range"})
+    assert criteria.criteria_type is SuccessCriteriaType.CUSTOM_CONDITION
+    assert criteria.operator is ComparisonOperator.IN_RANGE
+    criteria.from_dict({})
+    assert criteria.operator is ComparisonOperator.GREATER_EQUAL
+    with pytest.raises(ValueError):
+        criteria.from_dict({"operator": "=~"})
+
+
+def test_detailed_profile_batches_many_comparison_criteria():
+    profile = TaskProfile("巡航")
+    operators = list(ComparisonOperator)
+    for index in range(40):
+        criteria = SuccessCriteria(f"判据{index}")
+        criteria.module_id, criteria.parameter_name = f"m{index % 3}", "speed"
+        criteria.operator = operators[index % len(operators)]
+        criteria.target_value, criteria.range_min, criteria.range_max = index % 5, 1, 3
+        profile.add_success_criteria(criteria)
+    state = {"m0": {"speed": 2}, "m1": {"speed": float("nan")}}
+
+    batched = profile.evaluate_success(state)
+    assert profile._criteria_batch.targets is not None
+    assert batched["criteria_results"] == {
+        criteria.name: {
+            "success": criteria.evaluate(state),
+            "weight": 1.0,
+            "message": "评估成功" if criteria.evaluate(state) else "评估失败",
+        }
+        for criteria in profile.success_criteria
+    }
+
+    # 直接修改判据后重新打包
+    profile.success_criteria[0].enabled = False
+    assert "判据0" not in profile.evaluate_success(state)["criteria_results"]
+    # 实际值不是数值时逐个评估
+    assert profile.evaluate_success({"m0": {"speed": "快"}})["overall_success"] is False
+
+
+def test_detailed_profile_name_lookups_follow_edits():
+    profile = TaskProfile("巡航")
+    for name in ("起飞", "巡航", "起飞"):
+        profile.add_success_criteria(SuccessCriteria(name))
+    first = profile.success_criteria[0]
+    assert profile.get_success_criteria("起飞") is first
+    assert profile.get_success_criteria("降落") is None
+
+    # 原地改名、直接替换列表后仍能找到
+    first.name = "爬升"
+    assert profile.get_success_criteria("起飞") is profile.success_criteria[2]
+    assert profile.get_success_criteria("爬升") is first
+    profile.remove_success_criteria("起飞")
+    assert profile.get_success_criteria("起飞") is None
+
+    reloaded = TaskProfile.from_dict_cls(profile.to_dict())
+    assert reloaded.get_success_criteria("巡航").name == "巡航"
+
+    phase = TaskPhase("阶段一")
+    profile.add_task_phase(phase)
+    profile.task_phases[0] = replacement = TaskPhase("阶段一")
+    assert profile.get_task_phase("阶段一") is replacement
+
+
+def test_user_code_errors_are_logged_not_printed(caplog, capsys):
+    criteria = SystemSuccessCriteria("坏判据")
+    criteria.python_code = "result = system_state['missing']['x'] > 0"
+    environment = EnvironmentModel("坏环境")
+    environment.python_code = "modified_state = 1 / 0"
+    with caplog.at_level("WARNING"):
+        assert criteria.evaluate({}) is False
+        assert environment.apply_stress({"m": {}}) == {"m": {}}
+    assert "坏判据" in caplog.text and "坏环境" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_environment_code_is_wrapped_once_into_a_function():
+    environment = EnvironmentModel("风扰")
+    environment.affected_modules = ["m"]
+    environment.parameters = {"drop": 2}
+    environment.python_code = (
+        "modified_state['m'] = dict(modified_state['m'], speed=system_state['m']['speed'] - parameters['drop'])"
+    )
+    state = {"m": {"speed": 10}}
+    assert environment.apply_stress(state)["m"]["speed"] == 8
+    function = environment._code.function
+    assert function is not None and environment._code.compiled is None
+    assert environment.apply_stress({"m": {"speed": 5}})["m"]["speed"] == 3
+    assert environment._code.function is function and state == {"m": {"speed": 10}}
+
+
+def test_environment_stress_copies_state_only_on_write():
+    environment = EnvironmentModel("高温")
+    environment.affected_modules = ["m"]
+    state = {"m": {"temperature": 20}, "n": {"temperature": 20}}
+    assert environment.apply_stress(state) is state
+
+    for name, stress_type, base_value in (("温度", StressType.TEMPERATURE, 60.0), ("附加", StressType.CUSTOM, 1.0)):
+        factor = StressFactor(name)
+        factor.stress_type = stress_type
+        factor.base_value = base_value
+        environment.stress_factors.append(factor)
+    stressed = environment.apply_stress(state)
+    assert stressed is not state and stressed["n"] is state["n"]
+    assert stressed["m"] == {"temperature": 60.0, "附加": 1.0}
+    assert state == {"m": {"temperature": 20}, "n": {"temperature": 20}}
+
+
+@pytest.mark.parametrize(
+    "code, wrapped",
+    [
+        ("result = all(system_state[k]['speed'] > 1 for k in system_state)", True),
+        ("global seen\nseen = 1\nresult = True", False),
+        ("result = 'speed' in locals() or True", False),
+        ("max = 3\nresult = max > 2", False),
+    ],
+)
+def test_criteria_code_falls_back_to_exec_when_wrapping_changes_meaning(code, wrapped):
+    criteria = SystemSuccessCriteria("脚本")
+    criteria.python_code = code
+    assert criteria.evaluate({"m": {"speed": 3}}) is True
+    assert (criteria._code.function is not None) is wrapped
+    assert (criteria._code.compiled is None) is wrapped
+
+
+@pytest.mark.parametrize(
+    "op, expected",
+    [(">=", True), ("<=", False), ("==", False), ("!=", True), (">", True), ("<", False), ("≈", False)],
+)
+def test_threshold_criteria_operators(op, expected):
+    criteria = SystemSuccessCriteria("阈值")
+    criteria.target_module_id = "m"
+    criteria.target_parameter = "speed"
+    criteria.threshold_value = 3
+    criteria.comparison_operator = op
+    assert criteria.evaluate({"m": {"speed": 5}}) is expected
+
+    restored = SystemSuccessCriteria()
+    restored.from_dict(criteria.to_dict())
+    assert restored.comparison_operator == op
+    assert restored.evaluate({"m": {"speed": 5}}) is expected
+
+
+def _threshold_profile(count):
+    profile = SystemTaskProfile("批量判据")
+    for index in range(count):
+        criteria = SystemSuccessCriteria(f"c{index}")
+        criteria.target_module_id = f"m{index % 4}"
+        criteria.target_parameter = "value"
+        criteria.threshold_value = index % 7
+        criteria.comparison_operator = (">=", "<", "!=")[index % 3]
+        criteria.weight = 1.0 + index % 5
+        profile.add_success_criteria(criteria)
+    return profile
+
+
+def _loop_success(profile, state):
+    total = sum(c.weight for c in profile.success_criteria if c.enabled)
+    return sum(c.weight for c in profile.success_criteria if c.evaluate(state)) / total
+
+
+def test_many_threshold_criteria_are_evaluated_as_arrays():
+    pytest.importorskip("numpy")
+    profile = _threshold_profile(40)
+    state = {f"m{i}": {"value": 3 + i} for i in range(4)}
+    status, rate = profile.evaluate_task_success(state)
+    assert profile._criteria_plan.arrays is not None
+    assert math.isclose(rate, _loop_success(profile, state))
+    assert rate < 1.0 and status == (TaskStatus.PARTIAL_SUCCESS if rate >= 0.5 else TaskStatus.FAILURE)
+
+    # 修改判据后重新打包
+    for criteria in profile.success_criteria:
+        criteria.comparison_operator = ">="
+        criteria.threshold_value = 0
+    assert profile.evaluate_task_success(state) == (TaskStatus.SUCCESS, 1.0)
+
+    # 非数值实际值回退到逐个评估
+    state["m0"]["value"] = "高"
+    with pytest.raises(TypeError):
+        profile.evaluate_task_success(state)
+
+
+def test_remove_module_drops_only_its_connections():
+    system = SystemStructure("索引")
+    for module_id in ("a", "b", "c"):
+        module = Module(module_id)
+        module.id = module_id
+        system.add_module(module)
+    for source, target in (("a", "b"), ("b", "c"), ("c", "a"), ("b", "b")):
+        system.add_connection(Connection(id=f"{source}-{target}", source_module_id=source, target_module_id=target))
+    system.remove_connection("c-a")
+
+    reloaded = SystemStructure()
+    reloaded.from_dict(system.to_dict())
+    for structure in (system, reloaded):
+        structure.remove_module("b")
+        assert set(structure.connections) == set()
+        assert "b" not in structure.modules
+        structure.add_connection(Connection(id="a-c", source_module_id="a", target_module_id="c"))
+        structure.remove_module("c")
+        assert structure.connections == {} and dict(structure._module_connections) == {}
+
+
+def test_enabled_weight_total_follows_criteria_edits():
+    profile = _threshold_profile(3)
+    state = {f"m{i}": {"value": 100} for i in range(4)}
+    profile.evaluate_task_success(state)
+    plan = profile._criteria_plan
+    assert plan.total_weight == 1.0 + 2.0 + 3.0
+    profile.evaluate_task_success(state)
+    assert profile._criteria_plan is plan
+
+    profile.success_criteria[0].enabled = False
+    profile.success_criteria[2].weight = 5.0
+    profile.evaluate_task_success(state)
+    assert profile._criteria_plan.total_weight == 2.0 + 5.0
+    profile.remove_success_criteria("c1")
+    assert profile.evaluate_task_success(state)[1] == (1.0 + 5.0) / 5.0
+
+
+def test_criteria_reduce_loop_matches_array_comparison():
+    np = pytest.importorskip("numpy")
+    from src.models import _criteria_kernel
+
+    actual = np.array([1.0, 5.0, 3.0, np.nan, 2.0, 7.0, 4.0])
+    thresholds = np.array([2.0, 5.0, 3.0, 1.0, 2.0, 1.0, 9.0])
+    op_codes = np.array([0, 1, 2, 3, 4, 5, -1], dtype=np.int8)
+    weights = np.arange(1.0, 8.0)
+    success, hits = _criteria_kernel._reduce_hits(actual, thresholds, op_codes, weights)
+    # 5<=5, 3==3, nan!=1
+    assert (success, hits) == (2.0 + 3.0 + 4.0, 3)
+
+
+def test_compare_each_selects_every_operator_code():
+    np = pytest.importorskip("numpy")
+    from src.models import _criteria_kernel
+
+    actual = np.array([1.0, 5.0, 3.0, np.nan, 2.0, 7.0, 4.0, 2.0, np.nan, 0.0, 5.0])
+    targets = np.array([2.0, 5.0, 3.0, 1.0, 2.0, 1.0, 9.0, 0.0, 0.0, 0.0, 5.0])
+    op_codes = np.array([0, 1, 2, 3, 4, 5, -1, 6, 7, 7, 0], dtype=np.int8)
+    present = np.ones(actual.shape[0], dtype=bool)
+    present[-1] = False
+    hits = np.zeros(actual.shape[0], dtype=bool)
+    _criteria_kernel.compare_each(actual, present, op_codes, targets, np.full(11, 1.0), np.full(11, 3.0), hits)
+    # 5<=5, 3==3, nan!=1, 2 在 [1, 3] 内, nan 与 0 不在其内；缺少取值的判据不满足
+    assert hits.tolist() == [False, True, True, True, False, False, False, True, True, True, False]
+
+
+def test_criteria_loop_path_agrees_with_numpy_path(monkeypatch):
+    pytest.importorskip("numpy")
+    from src.models import _criteria_kernel
+
+    state = {f"m{i}": {"value": 3 + i} for i in range(4)}
+    expected = _threshold_profile(40).evaluate_task_success(state)
+    # 以未编译的循环代替 JIT 版本，检验操作码路径
+    monkeypatch.setattr(_criteria_kernel, "_reduce_hits_jit", _criteria_kernel._reduce_hits)
+    monkeypatch.setattr(_criteria_kernel, "JIT_MIN_CRITERIA", 10)
+    profile = _threshold_profile(40)
+    assert profile.evaluate_task_success(state) == expected
+    assert profile._criteria_plan.arrays.op_codes is not None
+
+
+def test_detailed_criteria_loop_path_agrees_with_numpy_path(monkeypatch):
+    pytest.importorskip("numpy")
+    from src.models import _criteria_kernel, task_profile_model
+
+    def build():
+        profile = TaskProfile("巡航")
+        operators = list(ComparisonOperator)
+        for index in range(40):
+            criteria = SuccessCriteria(f"判据{index}")
+            criteria.module_id, criteria.parameter_name = f"m{index % 3}", "speed"
+            criteria.operator = operators[index % len(operators)]
+            criteria.target_value, criteria.range_min, criteria.range_max = index % 5, 1, 3
+            profile.add_success_criteria(criteria)
+        return profile
+
+    state = {"m0": {"speed": 2}, "m1": {"speed": float("nan")}}
+    expected = build().evaluate_success(state)
+    # 以未编译的循环代替 JIT 版本，检验操作码路径
+    monkeypatch.setattr(task_profile_model, "compare_each_jit", _criteria_kernel.compare_each)
+    monkeypatch.setattr(task_profile_model, "JIT_MIN_CRITERIA", 10)
+    profile = build()
+    assert profile.evaluate_success(state) == expected
+    assert profile._criteria_batch.op_codes is not None
+
+
+def test_task_status_short_circuits_on_heavy_criteria():
+    profile = SystemTaskProfile("状态")
+    for name, weight in (("轻", 1.0), ("重", 10.0), ("中", 2.0)):
+        criteria = SystemSuccessCriteria(name)
+        criteria.weight = weight
+        criteria.python_code = f"system_state['calls'].append({name!r})\nresult = system_state['ok']"
+        profile.add_success_criteria(criteria)
+
+    state = {"ok": False, "calls": []}
+    assert profile.evaluate_task_status(state) == TaskStatus.FAILURE
+    assert state["calls"] == ["重"]
+    state = {"ok": True, "calls": []}
+    assert profile.evaluate_task_status(state) == TaskStatus.SUCCESS
+    assert state["calls"] == ["重", "中", "轻"]
+
+
+def test_task_status_matches_full_evaluation():
+    profile = _threshold_profile(12)
+    for value in range(-1, 9):
+        state = {f"m{i}": {"value": value + i} for i in range(4)}
+        assert profile.evaluate_task_status(state) == profile.evaluate_task_success(state)[0]
+
+
+def test_task_success_is_memoized_only_per_state_version():
+    profile = _threshold_profile(3)
+    state = {f"m{i}": {"value": 100} for i in range(4)}
+    result = profile.evaluate_task_success(state)
+    # 原地修改系统状态后不带版本号评估，总是得到新结果
+    state["m0"]["value"] = -100
+    assert profile.evaluate_task_success(state) != result
+    assert profile._last_evaluation is None
+
+    first = profile.evaluate_task_success(state, state_version=1)
+    state["m0"]["value"] = 100
+    assert profile.evaluate_task_success(state, state_version=1) is first
+    assert profile.evaluate_task_success(state, state_version=2) == result
+    profile.invalidate_cache()
+    assert profile._last_evaluation is None
+
+    # 判据修改后不使用旧结果；含自定义代码的判据不缓存
+    profile.success_criteria[0].python_code = "result = True"
+    first = profile.evaluate_task_success(state, state_version=2)
+    assert profile._last_evaluation is None
+    assert profile.evaluate_task_success(state, state_version=2) == first
+
+
+def test_grouped_threshold_evaluation_matches_per_criterion_loop():
+    profile = _threshold_profile(12)
+    profile.success_criteria[5].enabled = False
+    scripted = SystemSuccessCriteria("脚本")
+    scripted.python_code = "result = system_state['m1']['value'] > 4"
+    profile.add_success_criteria(scripted)
+    for value in range(-1, 9):
+        state = {f"m{i}": {"value": value + i} for i in range(3)}
+        rate = profile.evaluate_task_success(state)[1]
+        assert math.isclose(rate, _loop_success(profile, state))
+    assert [module_id for module_id, _ in profile._criteria_plan.threshold_groups] == ["m0", "m1", "m2", "m3"]
+
+
+def test_connection_ids_do_not_collide_on_underscored_endpoints():
+    first = Connection(source_module_id="a_b", source_point_id="c", target_module_id="d", target_point_id="e")
+    second = Connection(source_module_id="a", source_point_id="b_c", target_module_id="d", target_point_id="e")
+    assert first.id != second.id
+    assert Connection(id="given").id == "given"
+
+    restored = Connection.from_dict_cls(first.to_dict())
+    assert restored.to_dict() == first.to_dict()
+    system = SystemStructure()
+    system.from_dict({"connections": {"legacy": {**first.to_dict(), "id": ""}}})
+    assert system.connections["legacy"].id == "legacy"
+
+
+def test_criteria_and_connections_use_slots_and_copy_cleanly():
+    import copy
+    import pickle
+
+    from src.models.base_model import Point
+
+    criteria = SystemSuccessCriteria("脚本")
+    criteria.python_code = "result = threshold_value < 1"
+    assert criteria.evaluate({}) and criteria._code.function is not None
+    connection = Connection(id="c", source_module_id="a", target_module_id="b")
+    connection.connection_points = [Point(1, 2)]
+    criteria.module_id = "legacy"  # 声明的字段使用槽位，附加字段仍可设置
+    for obj in (criteria, connection):
+        assert "name" not in obj.__dict__ and "enabled" not in obj.__dict__
+
+    for restored in (pickle.loads(pickle.dumps(criteria)), copy.deepcopy(criteria)):
+        assert restored._code.function is None and restored.to_dict() == criteria.to_dict()
+        assert restored.module_id == "legacy"
+        assert restored.comparison_operator == ">=" and restored.evaluate({})
+    restored = pickle.loads(pickle.dumps(connection))
+    assert restored.to_dict() == connection.to_dict()
+
+
+def test_simulate_system_with_thread_pool_matches_sequential_run():
+    system = SystemStructure("并发仿真")
+    for index in range(6):
+        module = Module(f"模块{index}")
+        module.id = f"m{index}"
+        module.parameters = {"k": index}
+        module.python_code = "outputs['y'] = parameters['k'] * 2 + len(inputs['environment'])"
+        system.add_module(module)
+    sequential = system.simulate_system()
+    parallel = system.simulate_system(max_workers=4)
+    assert parallel == sequential
+    assert list(parallel) == [f"m{index}" for index in range(6)]
+    assert parallel["m5"]["y"] == 10
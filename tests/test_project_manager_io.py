@@ -1,5 +1,6 @@
 import os
 import json
+import math
 
 import pytest
 
@@ -56,3 +57,28 @@ def test_project_manager_save_load_roundtrip(tmp_path):
     assert restored_interface.direction == interface.direction
     assert restored_interface.interface_type == interface.interface_type
 
+
+
+def test_serialize_handles_enums_and_matches_stdlib_json():
+    from src.utils.serialization import deserialize, serialize
+
+    interface = Interface(name="枚举接口", interface_type=InterfaceType.ALGORITHM_OS)
+    data = interface.to_dict()
+    payload = serialize({"interface": data, "direction": InterfaceDirection.INPUT})
+
+    assert "枚举接口".encode("utf-8") in payload
+    decoded = deserialize(payload)
+    assert decoded == json.loads(json.dumps({"interface": data, "direction": "input"}, ensure_ascii=False))
+
+
+def test_serialize_round_trips_non_finite_floats_and_big_integers():
+    from src.utils.serialization import deserialize, serialize
+
+    data = {"limits": [float("inf"), -float("inf")], "nan": float("nan"), "big": 2 ** 70, "none": None}
+    decoded = deserialize(serialize(data))
+    assert decoded["limits"] == [float("inf"), -float("inf")]
+    assert math.isnan(decoded["nan"])
+    assert decoded["big"] == 2 ** 70 and decoded["none"] is None
+    # 旧版 json.dump 写出的 NaN/Infinity 仍可读取
+    legacy = json.dumps({"value": float("inf")}, ensure_ascii=False, indent=2).encode("utf-8")
+    assert deserialize(legacy) == {"value": float("inf")}
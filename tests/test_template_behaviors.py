@@ -76,3 +76,105 @@ def test_system_simulation_flow_uses_template_interfaces():
     actuator_state = state[actuator.id]
     assert "interface_inputs" in actuator_state
     assert actuator_in.name in actuator_state["interface_inputs"]
+
+
+def test_template_specs_are_slotted_dataclasses():
+    import copy
+    import pickle
+    from dataclasses import FrozenInstanceError, fields
+
+    from src.templates.interface_templates import FailureModeSpec, TriggerSpec, get_interface_template
+
+    definition = get_interface_template("sensor_data_output")
+    spec = definition.failure_modes[0]
+    assert isinstance(spec, FailureModeSpec) and not hasattr(spec, "__dict__")
+    assert type(definition).__slots__ == tuple(f.name for f in fields(definition))
+    assert TriggerSpec("a", "threshold") == TriggerSpec("a", "threshold")
+    assert TriggerSpec("a", "threshold").parameters is not TriggerSpec("a", "threshold").parameters
+    try:
+        spec.name = "changed"
+    except FrozenInstanceError:
+        pass
+    else:
+        raise AssertionError("模板规格应不可修改")
+    trigger = TriggerSpec("a", "threshold", {"value": 1})
+    assert copy.deepcopy(trigger) == trigger and pickle.loads(pickle.dumps(trigger)) == trigger
+
+
+def test_category_templates_share_default_failure_mode_specs():
+    from src.templates.interface_templates import _default_failure_modes
+
+    assert _default_failure_modes("算法-应用接口") is _default_failure_modes("算法-应用接口")
+    catalog = get_interface_templates_by_category()
+    application = catalog["算法-应用接口"][0]
+    framework = catalog["算法-智能框架接口"][0]
+    assert application.failure_modes[0].triggers[0] is framework.failure_modes[0].triggers[0]
+    # 缓存的是不可修改的元组，模板定义各自持有独立的列表
+    shared = _default_failure_modes(application.category)
+    assert isinstance(shared, tuple)
+    assert application.failure_modes == list(shared) and application.failure_modes is not shared
+    # 共享的规格在实例化时仍生成独立的触发条件参数
+    one, two = build_interface_from_template(application), build_interface_from_template(framework)
+    assert one.failure_modes[0].trigger_conditions[0].parameters is not two.failure_modes[0].trigger_conditions[0].parameters
+
+
+def test_sensor_interface_code_maps_health_to_link_status():
+    from src.templates.interface_templates import get_interface_template
+
+    instance = build_interface_from_template(get_interface_template("sensor_data_output"))
+    cases = [(0.9, 0.9, "normal"), (0.5, 0.5, "degraded"), (1.7, 1.0, "normal"), ("bad", 1.0, "normal"), (-1, 0.0, "failed")]
+    for health, score, status in cases:
+        outputs = instance.simulate_interface({"health": health})
+        assert outputs["health_score"] == score
+        assert outputs["link_status"] == status
+        assert outputs["latency_ms"] == instance.parameters["latency_ms"]
+
+
+def test_category_index_matches_library_and_tracks_replacement():
+    from dataclasses import replace
+
+    from src.templates import interface_templates as templates
+
+    catalog = get_interface_templates_by_category()
+    expected = {}
+    for definition in templates.INTERFACE_TEMPLATE_LIBRARY.values():
+        expected.setdefault(definition.category, []).append(definition)
+    assert catalog == {k: sorted(v, key=lambda item: item.name) for k, v in expected.items()}
+    catalog["一般接口"].clear()
+    assert get_interface_templates_by_category()["一般接口"], "调用方修改返回值不应影响注册表"
+
+    original = templates.get_interface_template("sensor_data_output")
+    try:
+        templates._register_template(replace(original, category="测试分类", name="A"))
+        catalog = get_interface_templates_by_category()
+        assert [d.name for d in catalog["测试分类"]] == ["A"]
+        assert original not in catalog[original.category]
+    finally:
+        templates._register_template(original)
+    assert "测试分类" not in get_interface_templates_by_category()
+    assert original in get_interface_templates_by_category()[original.category]
+
+
+def test_slugify_keeps_only_ascii_alphanumerics():
+    from src.templates.interface_templates import _slugify
+
+    assert _slugify("算法-OS 接口_V2") == "osv2"
+    assert _slugify("数据接口") == ""
+
+
+def test_shared_state_outputs_are_read_only_and_copied_per_interface():
+    from src.templates.interface_templates import get_interface_template
+
+    definition = get_interface_template("sensor_power_input")
+    other = get_interface_template("actuator_command_input")
+    assert definition.normal_state_outputs is other.normal_state_outputs
+    try:
+        definition.normal_state_outputs["link_status"] = "failed"
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("共享的状态输出应为只读映射")
+    one, two = build_interface_from_template(definition), build_interface_from_template(other)
+    normal = [s for s in one.states.values() if s.outputs.get("link_status") == "normal"][0]
+    normal.outputs["link_status"] = "failed"
+    assert [s for s in two.states.values() if s.outputs.get("link_status") == "normal"]